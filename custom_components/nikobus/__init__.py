@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from typing import Any, Final
 
 import voluptuous as vol
@@ -10,7 +11,11 @@ from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 from homeassistant.helpers import config_validation as cv, device_registry as dr, entity_registry as er
 from homeassistant.helpers.typing import ConfigType
-from homeassistant.exceptions import ConfigEntryNotReady, ServiceValidationError
+from homeassistant.exceptions import (
+    ConfigEntryNotReady,
+    HomeAssistantError,
+    ServiceValidationError,
+)
 from homeassistant.components import (
     switch,
     light,
@@ -21,10 +26,17 @@ from homeassistant.components import (
     sensor,
 )
 
-from .const import CONFIG_ENTRY_VERSION, DOMAIN, HUB_IDENTIFIER
+from .const import (
+    CONFIG_ENTRY_VERSION,
+    DEFAULT_CALIBRATION_CYCLES,
+    DOMAIN,
+    HUB_IDENTIFIER,
+    MAX_CALIBRATION_CYCLES,
+)
 from .coordinator import NikobusConfigEntry, NikobusDataCoordinator
 from .entity import hub_device_info
 from .exceptions import NikobusConnectionError, NikobusDataError, NikobusError
+from .nkbcalibrate import CalibrationError
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -42,6 +54,7 @@ SERVICE_QUERY_MODULE_INVENTORY: Final = "query_module_inventory"
 SERVICE_SEND_BUTTON_PRESS: Final = "send_button_press"
 SERVICE_DETECT_STALE_INVENTORY: Final = "detect_stale_inventory"
 SERVICE_PURGE_STALE_INVENTORY: Final = "purge_stale_inventory"
+SERVICE_CALIBRATE_COVER: Final = "calibrate_cover"
 
 # Default per-module probe budget. The library's
 # ``NikobusDiscovery.detect_stale_inventory`` polls each candidate module
@@ -115,6 +128,13 @@ DETECT_STALE_INVENTORY_SCHEMA = vol.Schema({
 PURGE_STALE_INVENTORY_SCHEMA = vol.Schema({
     vol.Required("addresses"): vol.All(cv.ensure_list, [cv.string], vol.Length(min=1)),
 })
+CALIBRATE_COVER_SCHEMA = vol.Schema({
+    vol.Required("module_address"): cv.string,
+    vol.Required("channel"): vol.All(vol.Coerce(int), vol.Range(min=1, max=12)),
+    vol.Optional("cycles", default=DEFAULT_CALIBRATION_CYCLES): vol.All(
+        vol.Coerce(int), vol.Range(min=1, max=MAX_CALIBRATION_CYCLES)
+    ),
+})
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
@@ -306,6 +326,65 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         PURGE_STALE_INVENTORY_SCHEMA,
         supports_response=SupportsResponse.ONLY,
     )
+
+    async def handle_calibrate_cover(call: ServiceCall) -> ServiceResponse:
+        """Time full open/close runs of a shutter channel and store them.
+
+        The shutter really moves — fully open, then fully closed, per
+        cycle — so the service blocks for a few travel times. The
+        measured times replace the channel's operation times.
+        """
+        coordinator = _loaded_coordinator(hass)
+        if coordinator is None:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="no_loaded_entry",
+            )
+        address = (call.data.get("module_address", "") or "").strip().upper()
+        channel = int(call.data["channel"])
+        if (
+            coordinator.get_module_type(address) != "roller_module"
+            or channel > coordinator.get_module_channel_count(address)
+        ):
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="not_a_cover_channel",
+                translation_placeholders={"address": address, "channel": str(channel)},
+            )
+        if (address, channel) in coordinator.calibrating:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="calibration_running",
+            )
+
+        cycles = int(call.data.get("cycles", DEFAULT_CALIBRATION_CYCLES))
+        _LOGGER.info(
+            "Calibrating travel times of %s ch%d (%d cycle(s))", address, channel, cycles
+        )
+        try:
+            fit = await coordinator.async_calibrate_cover(address, channel, cycles)
+        except CalibrationError as err:
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="calibration_failed",
+                translation_placeholders={"error": str(err)},
+            ) from err
+        return {
+            "module_address": address,
+            "channel": channel,
+            "operation_time_up": round(fit.time_up, 1),
+            "operation_time_down": round(fit.time_down, 1),
+            "start_latency": round(fit.start_latency, 2),
+            "runs": fit.runs,
+        }
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CALIBRATE_COVER,
+        handle_calibrate_cover,
+        CALIBRATE_COVER_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
     return True
 
 
@@ -348,6 +427,7 @@ async def async_migrate_entry(
 async def async_setup_entry(hass: HomeAssistant, entry: NikobusConfigEntry) -> bool:
     """Set up the Nikobus integration (single-instance) without redundant handshakes."""
     _LOGGER.debug("Starting setup of Nikobus (single-instance)")
+    started = time.monotonic()
 
     # 1. Initialize the coordinator
     # We create the object but ensure it doesn't broadcast data prematurely.
@@ -386,41 +466,58 @@ async def async_setup_entry(hass: HomeAssistant, entry: NikobusConfigEntry) -> b
     _register_hub_device(hass, entry)
 
     # 3. Forward setup to platforms FIRST
-    # This allows entities to be created and register their dispatcher listeners.
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # This allows entities to be created and register their dispatcher
+    # listeners. They come up from the persisted stores and restored state.
+    with coordinator.startup_phase("platforms"):
+        await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # 4. Reload when the user changes options via the OptionsFlow
+    # 4. Reload (or reconcile) when the user changes options via the OptionsFlow
     entry.async_on_unload(entry.add_update_listener(_async_options_updated))
 
-    # 5. Trigger the first refresh
-    # Since platforms are loaded, entities will correctly receive the "Targeted update signal".
-    _LOGGER.debug("Performing initial Nikobus data synchronization")
-    await coordinator.async_config_entry_first_refresh()
-
-    # 6. Clean up stale entities
+    # 5. Clean up stale entities
     await _async_cleanup_orphan_entities(hass, entry, coordinator)
 
-    # 7. Surface repair issues for actionable misconfigurations.
+    # 6. Surface repair issues for actionable misconfigurations.
     coordinator.refresh_repair_issues()
 
-    _LOGGER.info("Nikobus integration setup complete")
+    # 7. Run the first poll sweep in the background. A sweep of every
+    # module takes as long as the bus does; setup doesn't wait for it.
+    # Since platforms are loaded, entities receive the targeted update
+    # signal as each module's read lands.
+    entry.async_create_background_task(
+        hass, coordinator.async_first_poll(), f"{DOMAIN} first poll"
+    )
+
+    _LOGGER.info(
+        "Nikobus integration setup complete in %.2f s",
+        time.monotonic() - started,
+    )
     return True
 
 
 async def _async_options_updated(hass: HomeAssistant, entry: NikobusConfigEntry) -> None:
-    """Reload the integration when the user changes options.
+    """Apply an entry update: reload for new settings, else reconcile.
+
+    The coordinator reads the connection and hardware settings once, when
+    it is built, so an update that changes them needs a reload. Anything
+    else only needs the entities brought in line with the stores, which a
+    reconcile does without tearing down the bus connection. This listener
+    is the only reconcile for an update that changes the options; the
+    options flow reconciles itself only when they stay the same, since
+    this listener doesn't fire then.
 
     Scheduled as a background task rather than awaited, because HA awaits
     update listeners before closing the options flow and responding to
-    the frontend. A reload triggered by the discovery options flow is
-    slow (unload + re-forward setup to every platform, rebuilding
-    entities for every freshly-discovered module/button); awaiting it
-    here causes the flow-close HTTP request to time out, which the UI
-    renders as a generic "Invalid flow specified" error. Firing the
-    reload as a task lets the flow finalize immediately; entities
-    refresh when the reload completes in the background.
+    the frontend. A reload is slow (unload + re-forward setup to every
+    platform); awaiting it here causes the flow-close HTTP request to
+    time out, which the UI renders as a generic "Invalid flow specified"
+    error. Firing it as a task lets the flow finalize immediately.
     """
-    hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
+    coordinator = entry.runtime_data
+    if {**entry.data, **entry.options} != coordinator.applied_config:
+        hass.async_create_task(hass.config_entries.async_reload(entry.entry_id))
+        return
+    hass.async_create_task(coordinator.async_reconcile_entities())
 
 
 def _register_hub_device(hass: HomeAssistant, entry: NikobusConfigEntry) -> None:
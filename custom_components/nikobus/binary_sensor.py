@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any
 
@@ -15,7 +16,7 @@ from homeassistant.helpers.event import async_call_later
 from .button import op_point_display_name, register_wall_button_devices
 from .const import DOMAIN, press_signal
 from .coordinator import NikobusConfigEntry, NikobusDataCoordinator
-from .router import iter_operation_points
+from .router import PlatformEntities, iter_operation_points
 from .entity import NikobusEntity
 
 _LOGGER = logging.getLogger(__name__)
@@ -34,16 +35,18 @@ async def async_setup_entry(
     """Set up Nikobus button sensor entities from a config entry."""
     coordinator: NikobusDataCoordinator = entry.runtime_data
 
-    buttons = (coordinator.dict_button_data or {}).get("nikobus_button", {})
-    register_wall_button_devices(hass, entry, buttons, coordinator.dict_module_data)
+    def _build() -> Iterator[tuple[NikobusButtonBinarySensor, Any]]:
+        buttons = (coordinator.dict_button_data or {}).get("nikobus_button", {})
+        register_wall_button_devices(hass, entry, buttons, coordinator.dict_module_data)
 
-    entities: list[NikobusButtonBinarySensor] = [
-        NikobusButtonBinarySensor(
-            coordinator, physical_addr, key_label, op_point, parent_phys=phys
-        )
-        for physical_addr, key_label, op_point, phys in iter_operation_points(buttons)
-    ]
-    async_add_entities(entities)
+        for physical_addr, key_label, op_point, phys in iter_operation_points(buttons):
+            yield NikobusButtonBinarySensor(
+                coordinator, physical_addr, key_label, op_point, parent_phys=phys
+            ), (op_point, phys)
+
+    entities = PlatformEntities(_build, async_add_entities)
+    entities.async_add_initial()
+    coordinator.register_platform_entities("binary_sensor", entities)
 
 
 class NikobusButtonBinarySensor(NikobusEntity, BinarySensorEntity):
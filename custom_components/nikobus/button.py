@@ -28,6 +28,7 @@ from .entity import NikobusEntity, hub_device_info
 from .router import (
     INPUT_MODULE_TYPES,
     OPAQUE_MODULE_TYPES,
+    PlatformEntities,
     input_label_prefix,
     iter_operation_points,
     pc_logic_input_naming,
@@ -46,39 +47,43 @@ async def async_setup_entry(
     """Set up Nikobus button entities from a config entry."""
     coordinator: NikobusDataCoordinator = entry.runtime_data
 
-    entities: list[ButtonEntity] = [
-        NikobusPcLinkInventoryButton(coordinator),
-        NikobusModuleScanButton(coordinator),
-        NikobusImportNkbNamesButton(coordinator),
-    ]
+    def _build() -> Iterator[tuple[ButtonEntity, Any]]:
+        # The bridge's own buttons never change; a ``None`` record keeps
+        # them running across every reconcile.
+        yield NikobusPcLinkInventoryButton(coordinator), None
+        yield NikobusModuleScanButton(coordinator), None
+        yield NikobusImportNkbNamesButton(coordinator), None
 
-    buttons = (coordinator.dict_button_data or {}).get("nikobus_button", {})
-    register_wall_button_devices(hass, entry, buttons, coordinator.dict_module_data)
-    entities.extend(_iter_button_entities(coordinator, buttons))
+        buttons = (coordinator.dict_button_data or {}).get("nikobus_button", {})
+        register_wall_button_devices(hass, entry, buttons, coordinator.dict_module_data)
+        yield from _iter_button_entities(coordinator, buttons)
 
-    # Input-class modules (PC-Logic, Modular Interface) — register one
-    # device per module address. Their inputs are surfaced as synthesized
-    # LM-INPUT / MI-INPUT button entries (register_wall_button_devices), so
-    # there are no per-channel entities to add here.
-    register_input_module_devices(hass, entry, coordinator.dict_module_data)
+        # Input-class modules (PC-Logic, Modular Interface) — register one
+        # device per module address. Their inputs are surfaced as synthesized
+        # LM-INPUT / MI-INPUT button entries (register_wall_button_devices),
+        # so there are no per-channel entities to add here.
+        register_input_module_devices(hass, entry, coordinator.dict_module_data)
 
-    # Opaque modules (Audio Distribution) — register the device so it's
-    # visible in HA's device registry, but don't create any entities
-    # for it yet (input/output schema not validated).
-    register_opaque_module_devices(hass, entry, coordinator.dict_module_data)
+        # Opaque modules (Audio Distribution) — register the device so it's
+        # visible in HA's device registry, but don't create any entities
+        # for it yet (input/output schema not validated).
+        register_opaque_module_devices(hass, entry, coordinator.dict_module_data)
 
-    async_add_entities(entities)
+    entities = PlatformEntities(_build, async_add_entities)
+    entities.async_add_initial()
+    coordinator.register_platform_entities("button", entities)
 
 
 def _iter_button_entities(
     coordinator: NikobusDataCoordinator,
     buttons: dict[str, Any],
-) -> Iterator[NikobusButtonEntity]:
-    """Yield one NikobusButtonEntity per discovered operation point."""
+) -> Iterator[tuple[NikobusButtonEntity, Any]]:
+    """Yield one NikobusButtonEntity per discovered operation point, with
+    the records it was built from."""
     for physical_addr, key_label, op_point, phys in iter_operation_points(buttons):
         yield NikobusButtonEntity(
             coordinator, physical_addr, key_label, op_point, parent_phys=phys
-        )
+        ), (op_point, phys)
 
 
 def _category_for_button_type(type_str: str) -> str:
@@ -28,14 +28,31 @@ from nikobus_connect import NikobusConnect
 from nikobus_connect.discovery import find_module
 
 from .const import (
+    CONF_BLACKOUT_STREAK,
     CONF_CONNECTION_STRING,
+    CONF_COVER_UPDATE_INTERVAL,
     CONF_HAS_FEEDBACK_MODULE,
+    CONF_POLL_FRESHNESS,
+    CONF_POLL_PIPELINE_DEPTH,
     CONF_PRESS_REPEAT,
     CONF_PRIOR_GEN3,
     CONF_REFRESH_INTERVAL,
+    CONF_SCENE_DISPATCH_LIMIT,
     CONFIG_ENTRY_VERSION,
+    DEFAULT_BLACKOUT_STREAK,
+    DEFAULT_COVER_UPDATE_INTERVAL,
+    DEFAULT_POLL_FRESHNESS,
+    DEFAULT_POLL_PIPELINE_DEPTH,
     DEFAULT_PRESS_REPEAT,
+    DEFAULT_SCENE_DISPATCH_LIMIT,
     DOMAIN,
+    MAX_BLACKOUT_STREAK,
+    MAX_COVER_UPDATE_INTERVAL,
+    MAX_POLL_FRESHNESS,
+    MAX_POLL_PIPELINE_DEPTH,
+    MAX_SCENE_DISPATCH_LIMIT,
+    MIN_COVER_UPDATE_INTERVAL,
+    MIN_SCENE_DISPATCH_LIMIT,
     NKB_IMPORT_CATEGORIES,
 )
 from .coordinator import (
@@ -213,6 +230,20 @@ def _hardware_schema(defaults: dict[str, Any]) -> vol.Schema:
             CONF_PRESS_REPEAT,
             default=defaults.get(CONF_PRESS_REPEAT, DEFAULT_PRESS_REPEAT),
         ): vol.All(cv.positive_int, vol.Range(min=1, max=10)),
+        vol.Optional(
+            CONF_COVER_UPDATE_INTERVAL,
+            default=defaults.get(CONF_COVER_UPDATE_INTERVAL, DEFAULT_COVER_UPDATE_INTERVAL),
+        ): vol.All(
+            cv.positive_int,
+            vol.Range(min=MIN_COVER_UPDATE_INTERVAL, max=MAX_COVER_UPDATE_INTERVAL),
+        ),
+        vol.Optional(
+            CONF_SCENE_DISPATCH_LIMIT,
+            default=defaults.get(CONF_SCENE_DISPATCH_LIMIT, DEFAULT_SCENE_DISPATCH_LIMIT),
+        ): vol.All(
+            cv.positive_int,
+            vol.Range(min=MIN_SCENE_DISPATCH_LIMIT, max=MAX_SCENE_DISPATCH_LIMIT),
+        ),
     })
 
 
@@ -222,6 +253,18 @@ def _polling_schema(defaults: dict[str, Any]) -> vol.Schema:
             CONF_REFRESH_INTERVAL,
             default=defaults.get(CONF_REFRESH_INTERVAL, 120),
         ): vol.All(cv.positive_int, vol.Range(min=60, max=3600)),
+        vol.Optional(
+            CONF_POLL_PIPELINE_DEPTH,
+            default=defaults.get(CONF_POLL_PIPELINE_DEPTH, DEFAULT_POLL_PIPELINE_DEPTH),
+        ): vol.All(cv.positive_int, vol.Range(min=1, max=MAX_POLL_PIPELINE_DEPTH)),
+        vol.Optional(
+            CONF_POLL_FRESHNESS,
+            default=defaults.get(CONF_POLL_FRESHNESS, DEFAULT_POLL_FRESHNESS),
+        ): vol.All(cv.positive_int, vol.Range(min=0, max=MAX_POLL_FRESHNESS)),
+        vol.Optional(
+            CONF_BLACKOUT_STREAK,
+            default=defaults.get(CONF_BLACKOUT_STREAK, DEFAULT_BLACKOUT_STREAK),
+        ): vol.All(cv.positive_int, vol.Range(min=1, max=MAX_BLACKOUT_STREAK)),
     })
 
 
@@ -464,6 +507,22 @@ class NikobusOptionsFlow(config_entries.OptionsFlow):
     def _coordinator(self) -> NikobusDataCoordinator | None:
         return self.config_entry.runtime_data
 
+    def _finish_with_reconcile(
+        self, coordinator: NikobusDataCoordinator
+    ) -> config_entries.FlowResult:
+        """Close the flow after a store edit, reconciling the entities once.
+
+        Options that change fire the entry's update listener, which
+        reloads or reconciles itself; reconciling here as well would run
+        twice, or race the reload's unload. Only when the options stay
+        the same — the listener then doesn't fire — is the reconcile
+        left to this flow.
+        """
+        merged = {**self.config_entry.options, **self._options}
+        if merged == dict(self.config_entry.options):
+            self.hass.async_create_task(coordinator.async_reconcile_entities())
+        return self.async_create_entry(title="", data=merged)
+
     # --- Step 1: main menu --------------------------------------------------
 
     async def async_step_init(
@@ -732,9 +791,9 @@ class NikobusOptionsFlow(config_entries.OptionsFlow):
                     return await self.async_step_edit_module()
                 return await self.async_step_edit_channel()
 
-            # Done — close the flow. The entry's update listener reloads.
-            merged = {**self.config_entry.options, **self._options}
-            return self.async_create_entry(title="", data=merged)
+            # Done — bring the entities in line with the edit and close
+            # the flow.
+            return self._finish_with_reconcile(coordinator)
 
         channel_options = [
             {
@@ -919,8 +978,8 @@ class NikobusOptionsFlow(config_entries.OptionsFlow):
     # (previously hand-edited JSON — see README "User-authored scenes").
     # The flow works on a deep copy (``self._scene_work``) and only writes
     # the file on the explicit save/delete actions; closing the flow midway
-    # changes nothing. Saving ends the flow via ``async_create_entry`` so
-    # the entry's update listener reloads the scene platform.
+    # changes nothing. Saving reconciles the scene platform's entities and
+    # ends the flow via ``async_create_entry``.
 
     async def async_step_manage_scenes(
         self, user_input: dict[str, Any] | None = None
@@ -1131,10 +1190,8 @@ class NikobusOptionsFlow(config_entries.OptionsFlow):
         await coordinator.nikobus_config.save_json_data(
             "nikobus_scene_config.json", "scene", coordinator.dict_scene_data
         )
-        # Close the flow; the entry update listener reloads the scene platform.
-        return self.async_create_entry(
-            data={**self.config_entry.options, **self._options}
-        )
+        # Rebuild the scene's entity and close the flow.
+        return self._finish_with_reconcile(coordinator)
 
     async def _delete_scene(self) -> config_entries.FlowResult:
         """Remove the working scene from the store + JSON file and finish."""
@@ -1148,6 +1205,4 @@ class NikobusOptionsFlow(config_entries.OptionsFlow):
         await coordinator.nikobus_config.save_json_data(
             "nikobus_scene_config.json", "scene", coordinator.dict_scene_data
         )
-        return self.async_create_entry(
-            data={**self.config_entry.options, **self._options}
-        )
+        return self._finish_with_reconcile(coordinator)
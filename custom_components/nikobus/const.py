@@ -79,6 +79,27 @@ def operation_signal(address: str) -> str:
     return f"{DOMAIN}_operation_{address.upper()}"
 
 
+def channel_signal(address: str, channel: int) -> str:
+    """Per-channel dispatcher signal for a changed output byte.
+
+    Sent for every channel whose byte a state update actually changed, so
+    a toggle on one channel of a twelve-channel module wakes that
+    channel's entity alone. The module-wide ``{DOMAIN}_update_{address}``
+    signal still goes out alongside for anything listening per module.
+    """
+    return f"{DOMAIN}_update_{address.upper()}_{channel}"
+
+
+def calibration_signal(address: str) -> str:
+    """Per-module dispatcher signal for freshly calibrated travel times.
+
+    Sent with ``(channel, time_up, time_down)`` once a calibration run
+    has stored new operation times, so the live cover picks them up
+    without a reload.
+    """
+    return f"{DOMAIN}_calibrated_{address.upper()}"
+
+
 def press_signal(address: str) -> str:
     """Per-address dispatcher signal for a button-press notification.
 
@@ -188,6 +209,11 @@ CONF_REFRESH_INTERVAL: Final[str] = "refresh_interval"
 CONF_HAS_FEEDBACK_MODULE: Final[str] = "has_feedbackmodule"
 CONF_PRIOR_GEN3: Final[str] = "prior_gen3"
 CONF_PRESS_REPEAT: Final[str] = "press_repeat"
+CONF_POLL_PIPELINE_DEPTH: Final[str] = "poll_pipeline_depth"
+CONF_POLL_FRESHNESS: Final[str] = "poll_freshness"
+CONF_BLACKOUT_STREAK: Final[str] = "blackout_streak"
+CONF_COVER_UPDATE_INTERVAL: Final[str] = "cover_update_interval"
+CONF_SCENE_DISPATCH_LIMIT: Final[str] = "scene_dispatch_limit"
 
 # Filenames used by the manual-config import — the step-1 inventory
 # source for installs without a PC-Link. Both are read on every
@@ -200,6 +226,7 @@ MANUAL_BUTTON_CONFIG_FILENAME: Final[str] = "nikobus_button_config.json"
 # Buttons
 # =============================================================================
 REFRESH_DELAY: Final[float] = 0.5  # Delay before retrieving status after button press
+IMMEDIATE_REFRESH_DELAY: Final[float] = 0.3  # Quick read ahead of the settled one (not for dimmers)
 DIMMER_DELAY: Final[int] = 1  # Delay before retrieving dimmer status
 
 # Simulated-button-press repetition. A real Nikobus button emits its
@@ -248,6 +275,54 @@ BURST_DETECT_GAP_COUNT: Final[int] = 3
 # keeps worst-case latency bounded.
 MAX_EXTENDED_RELEASE_MS: Final[int] = 5000
 
+# =============================================================================
+# Polling
+# =============================================================================
+# Status reads the poll sweep keeps in flight at once. The command
+# handler still puts one exchange on the bus at a time, but with a few
+# reads queued its worker never idles while the sweep issues the next
+# one, and an answer that arrives through the feedback fast path
+# (``resolve_pending_get``) frees its slot straight away. Kept small on
+# purpose: a read's ack timeout starts when it is queued, so a deep
+# window behind one silent module would time out reads that never
+# reached the wire, and a full queue would delay user commands.
+DEFAULT_POLL_PIPELINE_DEPTH: Final[int] = 4
+MAX_POLL_PIPELINE_DEPTH: Final[int] = 8
+
+# Adaptive poll scheduling (see ``nkbpollscheduler``). The configured
+# refresh interval is each group's starting interval; a group whose
+# bytes change is polled up to ``POLL_SPEEDUP_FACTOR`` times as often,
+# one that stays the same backs off to ``POLL_BACKOFF_FACTOR`` times
+# less often. The coordinator ticks at the fastest interval (never
+# below ``POLL_MIN_INTERVAL``) and each tick may spend at most
+# ``POLL_BUS_BUDGET`` of its length on status reads, starting from
+# ``POLL_READ_COST_INITIAL`` seconds per read until sweeps are measured.
+POLL_SPEEDUP_FACTOR: Final[int] = 4
+POLL_BACKOFF_FACTOR: Final[int] = 8
+POLL_MIN_INTERVAL: Final[float] = 30.0
+POLL_BUS_BUDGET: Final[float] = 0.2
+POLL_READ_COST_INITIAL: Final[float] = 0.2
+
+# Blackout detection: the bus counts as silent after this many failed
+# status reads in a row, counted across ticks since a tick may read a
+# single group. Only reads of groups that have answered before count —
+# an absent or powered-off module is not a silent bus. The sweep that reaches the streak drops its remaining
+# reads and the reconnect starts at once.
+DEFAULT_BLACKOUT_STREAK: Final[int] = 3
+MAX_BLACKOUT_STREAK: Final[int] = 20
+
+# Freshness window (seconds): a poll skips a group whose bytes a press
+# refresh or feedback frame read off the bus less than this long ago.
+# The press refresh reads ``REFRESH_DELAY`` after the press, so the
+# default comfortably covers the poll that would follow it. 0 disables.
+DEFAULT_POLL_FRESHNESS: Final[int] = 20
+MAX_POLL_FRESHNESS: Final[int] = 300
+
+# Warm-start snapshot (see ``nkbsnapshot``): module states and cover
+# positions are saved this often (seconds) and at shutdown, and put back
+# at the next connect.
+STATE_SNAPSHOT_INTERVAL: Final[int] = 300
+
 # =============================================================================
 # Covers
 # =============================================================================
@@ -255,6 +330,42 @@ DEFAULT_COVER_MOVEMENT_BUFFER: Final[float] = 3.0
 DEFAULT_COVER_DEBOUNCE_DELAY: Final[float] = 0.3
 DEFAULT_COVER_OPERATION_TIME: Final[float] = 30.0
 
+# How often (ms) a moving cover's position is redrawn. One shared tick
+# serves every moving cover; stops don't wait for it — each fires at its
+# own computed deadline (see ``nkbmotion``).
+DEFAULT_COVER_UPDATE_INTERVAL: Final[int] = 500
+MIN_COVER_UPDATE_INTERVAL: Final[int] = 100
+MAX_COVER_UPDATE_INTERVAL: Final[int] = 5000
+
+# A stop aimed at a target position is issued early by the time stop
+# commands have recently taken to reach the bus (a running average
+# weighting each new sample by ``COVER_STOP_LATENCY_WEIGHT``), but never
+# by more than ``COVER_STOP_LEAD_MAX`` seconds.
+COVER_STOP_LEAD_MAX: Final[float] = 1.0
+COVER_STOP_LATENCY_WEIGHT: Final[float] = 0.25
+
+# Travel-time calibration (``calibrate_cover`` action, see
+# ``nkbcalibrate``): the channel's status byte is read every
+# ``CALIBRATION_SAMPLE_INTERVAL`` seconds while it moves, a run that
+# hasn't stopped after ``CALIBRATION_TIMEOUT`` seconds fails, and each
+# calibration times up to ``MAX_CALIBRATION_CYCLES`` open + close pairs.
+CALIBRATION_SAMPLE_INTERVAL: Final[float] = 0.25
+CALIBRATION_TIMEOUT: Final[float] = 300.0
+DEFAULT_CALIBRATION_CYCLES: Final[int] = 1
+MAX_CALIBRATION_CYCLES: Final[int] = 3
+
+# =============================================================================
+# Scenes
+# =============================================================================
+# A software scene or grouped cover hands all its module writes to the
+# bus as one batch (see ``nkbdispatch``); this many modules may be
+# queued and not yet answered at once. A write whose answer hasn't come
+# after ``SCENE_ANSWER_TIMEOUT`` seconds frees its slot.
+DEFAULT_SCENE_DISPATCH_LIMIT: Final[int] = 4
+MIN_SCENE_DISPATCH_LIMIT: Final[int] = 1
+MAX_SCENE_DISPATCH_LIMIT: Final[int] = 16
+SCENE_ANSWER_TIMEOUT: Final[float] = 5.0
+
 # =============================================================================
 # Listener
 # =============================================================================
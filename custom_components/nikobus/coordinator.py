@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Awaitable, Callable, Iterator, Mapping
 import contextlib
 import logging
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
@@ -14,6 +16,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from nikobus_connect import (
@@ -32,12 +35,39 @@ from nikobus_connect.discovery import (
 from nikobus_connect.exceptions import NikobusConnectionError, NikobusDataError, NikobusError
 
 from .const import (
+    CALIBRATION_SAMPLE_INTERVAL,
+    CALIBRATION_TIMEOUT,
+    CONF_BLACKOUT_STREAK,
     CONF_CONNECTION_STRING,
+    CONF_COVER_UPDATE_INTERVAL,
     CONF_HAS_FEEDBACK_MODULE,
+    CONF_POLL_FRESHNESS,
+    CONF_POLL_PIPELINE_DEPTH,
     CONF_PRESS_REPEAT,
     CONF_PRIOR_GEN3,
     CONF_REFRESH_INTERVAL,
+    CONF_SCENE_DISPATCH_LIMIT,
+    COVER_STOP_LATENCY_WEIGHT,
+    COVER_STOP_LEAD_MAX,
+    DEFAULT_BLACKOUT_STREAK,
+    DEFAULT_CALIBRATION_CYCLES,
+    DEFAULT_COVER_UPDATE_INTERVAL,
+    DEFAULT_POLL_FRESHNESS,
+    DEFAULT_POLL_PIPELINE_DEPTH,
     DEFAULT_PRESS_REPEAT,
+    DEFAULT_SCENE_DISPATCH_LIMIT,
+    MAX_BLACKOUT_STREAK,
+    MAX_COVER_UPDATE_INTERVAL,
+    MAX_POLL_FRESHNESS,
+    MAX_POLL_PIPELINE_DEPTH,
+    MAX_SCENE_DISPATCH_LIMIT,
+    MIN_COVER_UPDATE_INTERVAL,
+    MIN_SCENE_DISPATCH_LIMIT,
+    POLL_BACKOFF_FACTOR,
+    POLL_BUS_BUDGET,
+    POLL_MIN_INTERVAL,
+    POLL_READ_COST_INITIAL,
+    POLL_SPEEDUP_FACTOR,
     PRESS_REPEAT_DELAY,
     DEVICE_ADDRESS_INVENTORY,
     DEVICE_INVENTORY_ANSWER,
@@ -58,19 +88,33 @@ from .const import (
     ISSUE_NO_BUTTONS_CONFIGURED,
     RECONNECT_DELAY_INITIAL,
     RECONNECT_DELAY_MAX,
+    SCENE_ANSWER_TIMEOUT,
+    STATE_SNAPSHOT_INTERVAL,
+    calibration_signal,
+    channel_signal,
 )
 from .discovery_mixin import NikobusDiscoveryMixin
 from .nkbactuator import NikobusActuator
+from .nkbbusscheduler import BusPriority, NikobusBusScheduler, PrioritizedCommands
+from .nkbcalibrate import TravelFit, fit_travel_times, time_travel
 from .nkbconfig import NikobusConfig
+from .nkbdispatch import DispatchResult, ModuleWrite, dispatch_module_writes
 from .nkbmanual import legacy_config_files_present
+from .nkbmotion import NikobusMotionEngine
+from .nkbpollscheduler import NikobusPollScheduler
+from .nkbsnapshot import RestoredSnapshot, restore_snapshot, take_snapshot
 from .nkbreconcile import (
+    build_cf_trigger_index,
     build_controlled_by_index,
 )
+from .nkbstatetable import ModuleStateTable
 from .nkbstorage import (
     NikobusButtonStorage,
     NikobusCFStorage,
     NikobusModuleStorage,
+    NikobusStateStorage,
 )
+from .router import PlatformEntities, routing_memo
 
 # Typed config entry alias used across the integration. A plain alias
 # (instead of PEP 695 `type X = ...`) keeps compatibility with older
@@ -82,6 +126,12 @@ _LOGGER = logging.getLogger(__name__)
 # Module types supported for polling
 MODULE_TYPES = ("switch_module", "dimmer_module", "roller_module")
 
+
+def _poll_groups(module_data: dict[str, Any]) -> tuple[int, ...]:
+    """Return the status groups a module answers (group 2 above 6 channels)."""
+    return (1,) if len(module_data.get("channels", [])) <= 6 else (1, 2)
+
+
 # Outer-probe parameters passed to nikobus-connect 0.5.20's
 # ``detect_stale_inventory(outer_attempts=N, outer_delay=S)``. The library
 # handles the loop, dedup, and bus-quiet delay internally — these are just
@@ -121,6 +171,43 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
         self._has_feedback_module = _opts.get(CONF_HAS_FEEDBACK_MODULE, config_entry.data.get(CONF_HAS_FEEDBACK_MODULE, False))
         self._prior_gen3 = _opts.get(CONF_PRIOR_GEN3, config_entry.data.get(CONF_PRIOR_GEN3, False))
         self._press_repeat = _opts.get(CONF_PRESS_REPEAT, config_entry.data.get(CONF_PRESS_REPEAT, DEFAULT_PRESS_REPEAT))
+        self._poll_pipeline_depth = max(1, min(MAX_POLL_PIPELINE_DEPTH, int(
+            _opts.get(CONF_POLL_PIPELINE_DEPTH, config_entry.data.get(CONF_POLL_PIPELINE_DEPTH, DEFAULT_POLL_PIPELINE_DEPTH))
+        )))
+        self._blackout_streak = max(1, min(MAX_BLACKOUT_STREAK, int(
+            _opts.get(CONF_BLACKOUT_STREAK, config_entry.data.get(CONF_BLACKOUT_STREAK, DEFAULT_BLACKOUT_STREAK))
+        )))
+        cover_update_ms = max(MIN_COVER_UPDATE_INTERVAL, min(MAX_COVER_UPDATE_INTERVAL, int(
+            _opts.get(CONF_COVER_UPDATE_INTERVAL, config_entry.data.get(CONF_COVER_UPDATE_INTERVAL, DEFAULT_COVER_UPDATE_INTERVAL))
+        )))
+        # Every moving cover's stop deadline and position redraw.
+        self.motion_engine = NikobusMotionEngine(
+            cover_update_ms / 1000,
+            max_stop_lead=COVER_STOP_LEAD_MAX,
+            latency_weight=COVER_STOP_LATENCY_WEIGHT,
+        )
+        self._scene_dispatch_limit = max(MIN_SCENE_DISPATCH_LIMIT, min(MAX_SCENE_DISPATCH_LIMIT, int(
+            _opts.get(CONF_SCENE_DISPATCH_LIMIT, config_entry.data.get(CONF_SCENE_DISPATCH_LIMIT, DEFAULT_SCENE_DISPATCH_LIMIT))
+        )))
+        poll_freshness = max(0, min(MAX_POLL_FRESHNESS, int(
+            _opts.get(CONF_POLL_FRESHNESS, config_entry.data.get(CONF_POLL_FRESHNESS, DEFAULT_POLL_FRESHNESS))
+        )))
+        # The refresh interval is each group's starting poll interval;
+        # the coordinator ticks at the fastest interval a volatile group
+        # can reach and the scheduler picks which groups each tick reads.
+        self._poll_tick = min(
+            float(self._refresh_interval),
+            max(POLL_MIN_INTERVAL, self._refresh_interval / POLL_SPEEDUP_FACTOR),
+        )
+        self._poll_scheduler = NikobusPollScheduler(
+            self._refresh_interval,
+            min_interval=self._poll_tick,
+            max_interval=self._refresh_interval * POLL_BACKOFF_FACTOR,
+            budget_share=POLL_BUS_BUDGET,
+            read_cost=POLL_READ_COST_INITIAL,
+            keepalive_interval=self._refresh_interval,
+            freshness_window=poll_freshness,
+        )
 
         super().__init__(
             hass,
@@ -129,6 +216,9 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
             update_method=self._async_update_data,
             update_interval=self._get_update_interval(),
             config_entry=config_entry,
+            # Most ticks read nothing; ``_async_update_data`` wakes the
+            # listeners itself when a tick actually read something.
+            always_update=False,
         )
 
         self.nikobus_connection = NikobusConnect(self.connection_string)
@@ -139,7 +229,11 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
         # ``_ingest_cf_broadcasts`` after each discovery completes from
         # the library's ``NikobusDiscovery.discovered_cf_broadcasts``.
         self.cf_storage = NikobusCFStorage(hass)
+        # Warm-start snapshot of the state table (see ``nkbsnapshot``).
+        self.state_storage = NikobusStateStorage(hass)
         self.api: NikobusAPI | None = None
+        # The command-handler view the API writes through (write stats).
+        self.api_commands: PrioritizedCommands | None = None
 
         # ``dict_module_data`` is a derived view of ``module_storage.data``,
         # grouped by ``module_type`` for the library's scan planner and for
@@ -151,14 +245,21 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
 
         # Lazy cache: (module_address_upper, channel) -> [button records that trigger it]
         self._controlled_by_index: dict[tuple[str, int], list[dict[str, Any]]] | None = None
+        # Lazy cache: trigger address (canonical or ``triggered_by``) -> CF key.
+        # Rebuilt whenever the CF store is loaded or rewritten.
+        self._cf_trigger_index: dict[str, str] | None = None
 
         self.nikobus_actuator: NikobusActuator | None = None
         self.nikobus_listener: NikobusEventListener | None = None
         self.nikobus_command: NikobusCommandHandler | None = None
         self.nikobus_discovery: NikobusDiscovery | None = None
 
-        # Shared module state buffer — owned here, passed to NikobusCommandHandler
-        self._module_states: dict[str, bytearray] = {}
+        # Shared module state buffer — owned here, passed to NikobusCommandHandler.
+        # One preallocated table for every module (see ``nkbstatetable``).
+        self._module_states = ModuleStateTable()
+        # Priority gate in front of the command handler: user commands,
+        # then press refreshes, then polls (see ``nkbbusscheduler``).
+        self.bus_scheduler = NikobusBusScheduler()
 
         self.discovery_running = False
         # ``discovery_module`` / ``discovery_module_address`` /
@@ -174,7 +275,7 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
         self.discovery_module = None
         self.discovery_module_address: str | None = None
         self.inventory_query_type: InventoryQueryType | None = None
-        self._reload_task = None
+        self._reconcile_task: asyncio.Task[None] | None = None
         # Was the most recent ``start_module_scan`` a scan-all (every
         # module's register table read)? Set by ``start_module_scan``;
         # read by ``_reconcile_post_discovery`` to decide whether to
@@ -218,18 +319,59 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
         self._discovery_finished_event.set()  # idle = already set
         self._pclink_first_response_event: asyncio.Event = asyncio.Event()
         self._discovery_auto_reload: bool = True
+        # Entities each platform added, rebuilt in place by
+        # ``async_reconcile_entities`` when the stores change.
+        self._platform_entities: dict[str, PlatformEntities] = {}
+        self._reconcile_lock = asyncio.Lock()
+        # Seconds each setup phase took, by phase (see ``startup_phase``).
+        self.startup_timings: dict[str, float] = {}
+        # Warm start: what the snapshot put back at connect, the cover
+        # positions the next snapshot saves (``(position, epoch s)`` by
+        # ``(address, channel)``), and the periodic save's unsubscribe.
+        self.restored_snapshot = RestoredSnapshot()
+        self._cover_positions: dict[tuple[str, int], tuple[float, float]] = {}
+        self._snapshot_unsub: Callable[[], None] | None = None
+        # The entry data + options this coordinator was built from; an
+        # update that changes them needs a reload, anything else only a
+        # reconcile.
+        self.applied_config: dict[str, Any] = {**config_entry.data, **config_entry.options}
         self._discovery_module_order: list[str] = []
         self._stopping: bool = False
         self._reconnect_task: asyncio.Task[None] | None = None
         self._last_connected: datetime | None = None
         self._reconnect_attempts: int = 0
+        # Wall time and read count of the most recent poll tick, for
+        # diagnostics (zero reads on ticks with nothing due). ``None``
+        # until the first tick completes.
+        self.last_poll_duration: float | None = None
+        self.last_poll_reads: int = 0
+        # Blackouts the poll sweep detected, and how long the most recent
+        # one took to detect (first failed read sent → reconnect kicked).
+        self.blackouts_detected: int = 0
+        self.last_blackout_detect_time: float | None = None
+        # Shutter channels with a travel-time calibration in progress.
+        self.calibrating: set[tuple[str, int]] = set()
+        # Bumped on every module-store save; anything compiled from the
+        # store (software-scene plans) recompiles when it moves on.
+        self.module_revision: int = 0
+        # Software-scene group writes sent vs. skipped because the state
+        # buffer already held the scene's bytes (diagnostics).
+        self.scene_writes: dict[str, int] = {"group_writes": 0, "skipped": 0, "forced": 0}
+        # Batched scene / grouped-cover dispatch: first-to-last answer
+        # spread per batch and writes whose answer never came.
+        self.scene_dispatch: dict[str, Any] = {
+            "batches": 0,
+            "unanswered": 0,
+            "last_skew_ms": None,
+            "max_skew_ms": 0.0,
+        }
 
     # ------------------------------------------------------------------
     # Backward-compat property so diagnostics.py and other readers work
     # ------------------------------------------------------------------
 
     @property
-    def nikobus_module_states(self) -> dict[str, bytearray]:
+    def nikobus_module_states(self) -> ModuleStateTable:
         """Return the shared module state buffer."""
         return self._module_states
 
@@ -278,6 +420,11 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
         """
         return self._reconnect_attempts
 
+    @property
+    def poll_schedule(self) -> dict[str, Any]:
+        """Adaptive poll scheduler summary, surfaced by diagnostics."""
+        return {"tick_s": self._poll_tick, **self._poll_scheduler.stats()}
+
     def _get_update_interval(self) -> timedelta | None:
         # No poll timer in push mode. A feedback module pushes state
         # unprompted; older PC-Links (prior_gen3) can't sustain the poll
@@ -285,46 +432,42 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
         # frames drive refreshes). Everything else polls on the interval.
         if self._has_feedback_module or self._prior_gen3:
             return None
-        return timedelta(seconds=self._refresh_interval)
+        return timedelta(seconds=self._poll_tick)
 
     # ------------------------------------------------------------------
     # Connect / setup
     # ------------------------------------------------------------------
 
+    @contextlib.contextmanager
+    def startup_phase(self, phase: str) -> Iterator[None]:
+        """Time one phase of setup into ``startup_timings`` and the log."""
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            elapsed = self.startup_timings[phase] = time.monotonic() - started
+            _LOGGER.debug("Startup phase %s took %.3f s", phase, elapsed)
+
     async def connect(self) -> None:
-        """Establish connection and initialize all Nikobus components."""
+        """Establish connection and initialize all Nikobus components.
+
+        The stores load while the transport connects — neither needs the
+        other — and only the protocol stack, which needs both, waits for
+        the two.
+        """
+        load_stores = self.hass.async_create_task(self._async_load_stores())
         try:
-            await self.nikobus_connection.connect()
-        except NikobusConnectionError as err:
-            _LOGGER.error("Failed to connect to Nikobus: %s", err)
+            with self.startup_phase("transport"):
+                await self.nikobus_connection.connect()
+        except BaseException as err:
+            load_stores.cancel()
+            await asyncio.gather(load_stores, return_exceptions=True)
+            if isinstance(err, NikobusConnectionError):
+                _LOGGER.error("Failed to connect to Nikobus: %s", err)
             raise
 
         try:
-            # Module data lives in .storage/nikobus.modules. Boot loads
-            # the persisted store as-is; it does not import inventory
-            # from the legacy ``nikobus_module_config.json`` /
-            # ``nikobus_button_config.json`` files. Those are consulted
-            # only by the explicit "Discover modules" action as the
-            # PC-Link fallback (see ``start_pc_link_inventory``).
-            await self.module_storage.async_load()
-            self._rebuild_dict_module_data()
-
-            self.dict_button_data = await self.button_storage.async_load()
-            await self.cf_storage.async_load()
-
-            # 3.0.0: the legacy friendly-name overlay (importing entity
-            # names from nikobus_module_config.json / nikobus_button_config.json
-            # on every boot) has been removed — entity names are managed in
-            # Home Assistant and preserved across reloads. The files are still
-            # consulted only as the inventory fallback for installs without a
-            # PC-Link (start_pc_link_inventory → _apply_manual_inventory_as_fallback).
-            # Warn if they're still present so users know the name-import no
-            # longer happens.
-            await self._warn_if_legacy_config_files_present()
-
-            self.dict_scene_data = await self.nikobus_config.load_json_data(
-                "nikobus_scene_config.json", "scene"
-            )
+            await load_stores
 
             # 1. Create actuator and discovery (needed before listener)
             self.nikobus_actuator = NikobusActuator(
@@ -358,13 +501,24 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
                 module_states=self._module_states,
             )
             self._initialize_module_states()
+            self._restore_snapshot()
 
-            # 4. Create the high-level API
-            self.api = NikobusAPI(self.nikobus_command, self.dict_module_data)
+            # 4. Create the high-level API. Every API call is a user
+            # action, so it goes to the bus ahead of refreshes and polls.
+            self.api_commands = self.bus_scheduler.commands(
+                self.nikobus_command, BusPriority.INTERACTIVE
+            )
+            self.api = NikobusAPI(self.api_commands, self.dict_module_data)
 
-            await self.nikobus_command.start()
-            await self.nikobus_listener.start()
+            with self.startup_phase("protocol"):
+                await self.nikobus_command.start()
+                await self.nikobus_listener.start()
             self._last_connected = datetime.now(timezone.utc)
+            self._snapshot_unsub = async_track_time_interval(
+                self.hass,
+                self._async_snapshot_tick,
+                timedelta(seconds=STATE_SNAPSHOT_INTERVAL),
+            )
 
         except NikobusDataError:
             raise
@@ -378,17 +532,122 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
                 translation_placeholders={"error": str(err)},
             ) from err
 
+    async def _async_load_stores(self) -> None:
+        """Load the module, button, CF and scene stores concurrently."""
+
+        async def _modules() -> None:
+            # Module data lives in .storage/nikobus.modules. Boot loads
+            # the persisted store as-is; it does not import inventory
+            # from the legacy ``nikobus_module_config.json`` /
+            # ``nikobus_button_config.json`` files. Those are consulted
+            # only by the explicit "Discover modules" action as the
+            # PC-Link fallback (see ``start_pc_link_inventory``).
+            await self.module_storage.async_load()
+            self._rebuild_dict_module_data()
+
+        async def _buttons() -> None:
+            self.dict_button_data = await self.button_storage.async_load()
+
+        async def _central_functions() -> None:
+            await self.cf_storage.async_load()
+            self.rebuild_cf_trigger_index()
+
+        async def _scenes() -> None:
+            self.dict_scene_data = await self.nikobus_config.load_json_data(
+                "nikobus_scene_config.json", "scene"
+            )
+
+        async def _snapshot() -> None:
+            await self.state_storage.async_load()
+
+        with self.startup_phase("stores"):
+            await asyncio.gather(
+                _modules(),
+                _buttons(),
+                _central_functions(),
+                _scenes(),
+                _snapshot(),
+                # 3.0.0: the legacy friendly-name overlay (importing entity
+                # names from nikobus_module_config.json /
+                # nikobus_button_config.json on every boot) has been removed —
+                # entity names are managed in Home Assistant and preserved
+                # across reloads. The files are still consulted only as the
+                # inventory fallback for installs without a PC-Link
+                # (start_pc_link_inventory →
+                # _apply_manual_inventory_as_fallback). Warn if they're still
+                # present so users know the name-import no longer happens.
+                self._warn_if_legacy_config_files_present(),
+            )
+
+    def _restore_snapshot(self) -> None:
+        """Put the saved module states back into the fresh state table.
+
+        Entities then render the last known state until the bus is read;
+        the first sweep reads the modules whose snapshot is oldest first.
+        """
+        self.restored_snapshot = restore_snapshot(
+            self._module_states, self.state_storage.data["nikobus_state"]
+        )
+        self._poll_scheduler.prefer_stalest(self.restored_snapshot.confirmed)
+        if self.restored_snapshot.modules:
+            _LOGGER.debug(
+                "Restored the state of %d of %d modules from the snapshot",
+                self.restored_snapshot.modules,
+                len(self._module_states),
+            )
+
+    def restored_cover_position(self, address: str, channel: int) -> tuple[float, float] | None:
+        """Return a cover's snapshotted ``(position, epoch s)``, if any."""
+        return self.restored_snapshot.positions.get((address.upper(), channel))
+
+    @callback
+    def note_cover_position(self, address: str, channel: int, position: float) -> None:
+        """Remember a cover's displayed position for the next snapshot."""
+        key = (address.upper(), channel)
+        noted = self._cover_positions.get(key)
+        if noted is None or noted[0] != position:
+            self._cover_positions[key] = (position, time.time())
+
+    async def async_save_snapshot(self) -> None:
+        """Save the state table and cover positions for the next start."""
+        if not len(self._module_states):
+            # Nothing connected yet: keep the previous snapshot.
+            return
+        offset = time.time() - time.monotonic()
+        confirmed = dict(self.restored_snapshot.confirmed)
+        for address, at in self._poll_scheduler.confirmed_at().items():
+            confirmed[address] = at + offset
+        self.state_storage.data["nikobus_state"] = take_snapshot(
+            self._module_states,
+            confirmed=confirmed,
+            positions={**self.restored_snapshot.positions, **self._cover_positions},
+        )
+        await self.state_storage.async_save()
+
+    async def _async_snapshot_tick(self, _now: datetime) -> None:
+        await self.async_save_snapshot()
+
+    async def async_first_poll(self) -> None:
+        """Run the first poll sweep after setup, in the background.
+
+        Entities are up by then, from the persisted stores; each module's
+        entities update as its read lands, so the sweep fills state in
+        progressively rather than holding up setup.
+        """
+        with self.startup_phase("first_poll"):
+            await self.async_refresh()
+
     def _initialize_module_states(self) -> None:
         """Pre-allocate state buffers for all configured modules."""
+        addresses: list[str] = []
         for modules in self.dict_module_data.values():
             module_items = modules.items() if isinstance(modules, dict) else (
                 (m.get("address"), m) for m in modules if isinstance(m, dict)
             )
-            for address, info in module_items:
-                if address:
-                    addr_upper = str(address).upper()
-                    if addr_upper not in self._module_states:
-                        self._module_states[addr_upper] = bytearray(12)
+            addresses.extend(str(address).upper() for address, _ in module_items if address)
+        self._module_states.reserve(len(self._module_states) + len(addresses))
+        for address in addresses:
+            self._module_states.ensure(address)
 
     # ------------------------------------------------------------------
     # Listener callbacks
@@ -422,21 +681,16 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
 
             if len(message) >= 21:
                 state_hex = message[9:21]
-                start = 0 if group == 1 else 6
-                buf = self._module_states.get(address)
-                if buf is None:
-                    # Auto-allocate if module wasn't pre-registered
-                    buf = bytearray(12)
-                    self._module_states[address] = buf
-                if start + 6 > len(buf):
-                    # Out-of-range group for this module's buffer
-                    # (e.g. group 2 on a 6-output module). Drop the
-                    # write rather than silently extend the buffer
-                    # and promote the module to a larger size.
-                    pass
-                else:
-                    state_bytes = bytes.fromhex(state_hex)
-                    buf[start : start + 6] = state_bytes
+                # Auto-allocate if module wasn't pre-registered
+                self._module_states.ensure(address)
+                # ``None``: out-of-range group for this module's buffer
+                # (e.g. group 2 on a 6-output module). The write is
+                # dropped rather than promoting the module to a larger size.
+                changed = self._module_states.write_group(address, group, state_hex)
+                if changed is not None:
+                    self._poll_scheduler.observe(
+                        address, group, changed=changed, confirmed=True
+                    )
 
                 # Resolve any pending get_output_state future immediately
                 if self.nikobus_command:
@@ -731,41 +985,80 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
     async def _async_update_data(self) -> None:
         """Refresh latest data from the Nikobus system via polling.
 
-        Total-blackout auto-recovery: if every poll in a single cycle
-        fails (every output module times out), the bus is silent —
-        most likely PC-Link / FTDI idle sleep after the 120 s gap
-        between polls (issue #337). Trigger the same reconnect path
-        the user used to manually invoke (close + reopen + handshake)
-        so the integration self-heals.
+        Total-blackout auto-recovery: once ``_blackout_streak``
+        reads in a row have failed (across ticks, since one tick may
+        read a single group), the bus is silent — most likely PC-Link /
+        FTDI idle sleep after a long gap between polls (issue #337).
+        Trigger the same reconnect path the user used to manually
+        invoke (close + reopen + handshake) so the integration
+        self-heals.
         """
         if self.discovery_running:
             return None
         polled = 0
         failures = 0
+        started = time.monotonic()
         try:
+            # One pipelined pass over every output module, so the
+            # in-flight window stays full across module-type boundaries.
+            # Addresses are unique across types.
+            modules: dict[str, Any] = {}
             for module_type in MODULE_TYPES:
                 if module_type in self.dict_module_data:
-                    polled_n, failed_n = await self._refresh_module_type(
-                        self.dict_module_data[module_type]
-                    )
-                    polled += polled_n
-                    failures += failed_n
+                    modules.update(self.dict_module_data[module_type])
+            candidates = [
+                (str(address).upper(), g)
+                for address, module_data in modules.items()
+                for g in _poll_groups(module_data)
+            ]
+            plan: dict[str, tuple[int, ...]] = {}
+            for address, g in self._poll_scheduler.plan(candidates, self._poll_tick):
+                plan[address] = (*plan.get(address, ()), g)
+            if plan:
+                # Read in the scheduler's order: after a warm start the
+                # first sweep reaches the stalest snapshots first.
+                order = {address: n for n, address in enumerate(plan)}
+                modules = dict(sorted(
+                    modules.items(),
+                    key=lambda item: order.get(str(item[0]).upper(), len(order)),
+                ))
+                polled, failures = await self._refresh_module_type(modules, plan)
+                # Coordinator runs with ``always_update=False``: a tick
+                # that read nothing leaves the entities alone.
+                self.async_update_listeners()
             return None
         except NikobusDataError as err:
             _LOGGER.error("Failed to fetch Nikobus data: %s", err)
             raise UpdateFailed(f"Data refresh failed: {err}") from err
         finally:
+            self.last_poll_duration = time.monotonic() - started
+            self.last_poll_reads = polled
+            if polled:
+                self._poll_scheduler.observe_cycle(self.last_poll_duration, polled)
+                _LOGGER.debug(
+                    "Nikobus poll cycle: %d reads (%d failed, %d deferred) in %.2f s",
+                    polled,
+                    failures,
+                    self._poll_scheduler.deferred_last_tick,
+                    self.last_poll_duration,
+                )
+            streak = self._poll_scheduler.failure_streak
             if (
-                polled > 0
-                and failures == polled
+                failures > 0
+                and streak >= self._blackout_streak
                 and not self._stopping
             ):
+                since = self._poll_scheduler.streak_started
+                self.last_blackout_detect_time = (
+                    time.monotonic() - since if since is not None else None
+                )
+                self.blackouts_detected += 1
                 _LOGGER.warning(
-                    "Nikobus poll cycle: %d/%d commands timed out — "
+                    "Nikobus poll cycle: last %d commands timed out — "
                     "bus silent. Triggering reconnect (issue #337).",
-                    failures,
-                    polled,
+                    streak,
                 )
+                self._poll_scheduler.failure_streak = 0
                 # Background task — don't block the coordinator's
                 # refresh-cycle slot. ``_handle_connection_lost`` is
                 # idempotent (no-op if a reconnect task is already
@@ -776,45 +1069,72 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
                 )
 
     async def _refresh_module_type(
-        self, modules_dict: dict[str, Any]
+        self,
+        modules_dict: dict[str, Any],
+        plan: dict[str, tuple[int, ...]] | None = None,
     ) -> tuple[int, int]:
         """Poll each module, return (polled, failed) counts.
 
+        ``plan`` restricts the sweep to the groups the poll scheduler
+        picked for this tick (keyed by upper-case address); without it
+        every group of every module is read. Each outcome is reported
+        back to the scheduler so it can reschedule the group.
+
+        Group reads are pipelined: up to ``_poll_pipeline_depth`` of them
+        are queued on the command handler at once, so the sweep costs
+        roughly one pass of bus exchanges instead of one host round-trip
+        per group. Answers come back through the handler's own future or
+        the feedback fast path (``resolve_pending_get``).
+
         Per-module / per-group timeouts are still swallowed (logged
-        as ERROR) so a single transient failure doesn't block other
-        modules from refreshing in the same cycle. The aggregate
-        counts roll up to ``_async_update_data`` for blackout
-        detection.
+        at DEBUG) so a single transient failure doesn't block other
+        modules from refreshing in the same cycle. Once
+        ``_blackout_streak`` reads in a row have failed, though, the
+        rest of the sweep is dropped: reads still waiting for a slot
+        are skipped and reads in flight are cancelled, so
+        ``_async_update_data`` can start the reconnect straight away
+        instead of after one timeout per remaining group. ``polled``
+        counts the reads that completed.
         """
+        window = asyncio.Semaphore(self._poll_pipeline_depth)
         polled = 0
         failed = 0
-        for address, module_data in modules_dict.items():
-            normalized = str(address).upper()
-            channels = module_data.get("channels", [])
-            chan_count = len(channels)
-            groups = (1,) if chan_count <= 6 else (1, 2)
-
-            changed = False
-            for g in groups:
-                polled += 1
+        aborted = 0
+        # Set once ``_blackout_streak`` reads in a row have failed: the
+        # bus is silent, so the reads still queued or in flight are
+        # cancelled instead of each waiting out its own timeout.
+        abort = asyncio.Event()
+        read_tasks: list[asyncio.Task[bool]] = []
+
+        def _read_failed(normalized: str, g: int, sent: float) -> None:
+            nonlocal failed
+            failed += 1
+            self._poll_scheduler.record_failure(normalized, g, sent=sent)
+            if (
+                self._poll_scheduler.failure_streak >= self._blackout_streak
+                and not abort.is_set()
+            ):
+                abort.set()
+                current = asyncio.current_task()
+                for task in read_tasks:
+                    if task is not current and not task.done():
+                        task.cancel()
+
+        async def _read_group(normalized: str, g: int) -> bool:
+            """Read one group into the buffer; return whether it changed."""
+            nonlocal polled, aborted
+            current = self._module_states.group_view(normalized, g)
+            before = bytes(current) if current is not None else None
+            async with window:
+                if abort.is_set():
+                    aborted += 1
+                    return False
+                sent = time.monotonic()
                 try:
-                    state_hex = await self.nikobus_command.get_output_state(normalized, g) or ""
-                    if state_hex and len(state_hex) >= 12:
-                        start = 0 if g == 1 else 6
-                        buf = self._module_states.get(normalized)
-                        if buf is None:
-                            buf = bytearray(12)
-                            self._module_states[normalized] = buf
-                        new_bytes = bytes.fromhex(state_hex[:12])
-                        if buf[start : start + 6] != new_bytes:
-                            buf[start : start + 6] = new_bytes
-                            changed = True
-                    else:
-                        failed += 1
-                except asyncio.CancelledError:
-                    raise
+                    async with self.bus_scheduler.slot(BusPriority.POLL):
+                        state_hex = await self.nikobus_command.get_output_state(normalized, g) or ""
                 except Exception as err:
-                    failed += 1
+                    polled += 1
                     # Per-group failures are noise on installs that
                     # hit periodic bus-silent windows (issue #337) —
                     # they show up as N separate ERROR entries in
@@ -829,17 +1149,66 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
                     _LOGGER.debug(
                         "Error refreshing %s group %d: %s", normalized, g, err
                     )
-
+                    _read_failed(normalized, g, sent)
+                    return False
+                polled += 1
+            if not state_hex or len(state_hex) < 12:
+                _read_failed(normalized, g, sent)
+                return False
+            self._module_states.ensure(normalized)
+            changed = bool(self._module_states.write_group(normalized, g, state_hex))
+            if (
+                changed
+                or before is None
+                or before == self._module_states.group_view(normalized, g)
+            ):
+                self._poll_scheduler.record(normalized, g, changed=changed)
+            # Otherwise a feedback frame or press refresh stored these
+            # bytes while the read was in flight and already reported
+            # the change to the scheduler.
+            return changed
+
+        async def _refresh_module(address: str, module_data: dict[str, Any]) -> None:
+            nonlocal aborted
+            normalized = str(address).upper()
+            groups = (
+                _poll_groups(module_data) if plan is None
+                else plan.get(normalized, ())
+            )
+            if not groups:
+                return
+            tasks = [
+                asyncio.ensure_future(_read_group(normalized, g)) for g in groups
+            ]
+            read_tasks.extend(tasks)
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            aborted += sum(
+                isinstance(result, asyncio.CancelledError) for result in results
+            )
             # Only wake this module's entities when its state actually
             # changed. The coordinator's own post-poll ``async_update_
             # listeners`` still re-renders everything (cheaply, since
             # entities diff before writing), so an unchanged module needs
             # no targeted dispatch — which on a quiet bus is every module.
-            if changed:
+            if any(result is True for result in results):
                 await self.async_event_handler(
                     "nikobus_refreshed",
                     {"impacted_module_address": normalized},
                 )
+
+        await asyncio.gather(
+            *(
+                _refresh_module(address, module_data)
+                for address, module_data in modules_dict.items()
+            )
+        )
+        if aborted:
+            _LOGGER.debug(
+                "Nikobus poll cycle aborted: %d read(s) dropped after %d "
+                "failures in a row",
+                aborted,
+                self._poll_scheduler.failure_streak,
+            )
         return polled, failed
 
     # ------------------------------------------------------------------
@@ -854,25 +1223,27 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
             return buf[channel - 1]
         return 0
 
+    @callback
+    def state_generation(self, address: str, group: int) -> int:
+        """Return the generation of one module group's state bytes.
+
+        It moves forward only when the group's bytes change, so an entity
+        that rendered from an equal generation has nothing new to show.
+        """
+        return self._module_states.generation(address.upper(), int(group))
+
     @callback
     def get_bytearray_group_state(self, address: str, group: int) -> bytearray:
         """Return 6-byte group state.
 
-        Callers expect a fixed-length 6-byte response. The library's
-        ``get_bytearray_group_state`` returns the raw slice, which
-        comes back empty for a group whose end position exceeds the
-        module's buffer length (e.g. group 2 on a 6-output module).
-        Pad to six zero bytes in that case so the caller always sees
-        the same shape regardless of module size.
+        Callers expect a fixed-length 6-byte response. A group whose end
+        position exceeds the module's buffer length (e.g. group 2 on a
+        6-output module) or an unknown module reads as six zero bytes,
+        so the caller always sees the same shape regardless of module
+        size.
         """
-        if self.nikobus_command:
-            result = self.nikobus_command.get_bytearray_group_state(
-                address, int(group)
-            )
-            if len(result) < 6:
-                return bytearray(6)
-            return result
-        return bytearray(6)
+        view = self._module_states.group_view(address.upper(), int(group))
+        return bytearray(view) if view is not None else bytearray(6)
 
     @callback
     def set_bytearray_state(self, address: str, channel: int, value: int) -> None:
@@ -881,32 +1252,32 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
             self.nikobus_command.set_bytearray_state(address, channel, value)
 
     def set_bytearray_group_state(
-        self, address: str, group: int | str, value: str
+        self, address: str, group: int | str, value: str, *, confirmed: bool = False
     ) -> None:
         """Update a group in the state buffer from a hex string.
 
         ``group`` accepts an int (1/2) or the string forms ("1"/"2") the
         actuator routes by; it is normalised with ``int(group)`` below.
 
-        Out-of-range group writes are silently ignored. Without this
-        guard, a slice assignment like ``buf[6:12] = ...`` against a
-        6-byte buffer would extend it to 12 bytes — silently
-        promoting a 6-output module to 12 outputs in the state
-        store, which downstream consumers (channel iteration,
-        diagnostics) interpret as real channels.
+        The update is reported to the poll scheduler so groups people
+        use keep a short poll interval. ``confirmed`` marks a value read
+        off the bus (press refresh) rather than one we just wrote.
+
+        Out-of-range group writes are silently ignored: a group 2 write
+        to a 6-output module must not promote it to 12 outputs in the
+        state store, which downstream consumers (channel iteration,
+        diagnostics) would interpret as real channels.
         """
         addr_upper = address.upper()
-        buf = self._module_states.get(addr_upper)
-        if buf is None:
+        try:
+            changed = self._module_states.write_group(addr_upper, int(group), value)
+        except ValueError:
             return
-        start = 0 if int(group) == 1 else 6
-        if start + 6 > len(buf):
+        if changed is None:
             return
-        try:
-            state_bytes = bytes.fromhex(value[:12].ljust(12, "0"))
-            buf[start : start + 6] = state_bytes[:6]
-        except (ValueError, IndexError):
-            pass
+        self._poll_scheduler.observe(
+            addr_upper, int(group), changed=changed, confirmed=confirmed
+        )
 
     # ------------------------------------------------------------------
     # Module metadata helpers
@@ -1047,18 +1418,22 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
         A scene can have several trigger addresses (one Central Function,
         many inputs). The store is keyed on the canonical address, so we
         match the canonical key first and then any address listed in a
-        scene's ``triggered_by``."""
+        scene's ``triggered_by``, through an index rebuilt whenever the CF
+        store changes."""
         if self.cf_storage is None or not bus_address:
             return None
-        addr = str(bus_address).upper()
-        scenes = self.cf_storage.data.get("nikobus_cf", {})
-        cf = scenes.get(addr)
-        if isinstance(cf, dict):
-            return cf
-        for cf in scenes.values():
-            if isinstance(cf, dict) and addr in (cf.get("triggered_by") or []):
-                return cf
-        return None
+        if self._cf_trigger_index is None:
+            self.rebuild_cf_trigger_index()
+        key = self._cf_trigger_index.get(str(bus_address).upper())
+        if key is None:
+            return None
+        cf = self.cf_storage.data.get("nikobus_cf", {}).get(key)
+        return cf if isinstance(cf, dict) else None
+
+    def rebuild_cf_trigger_index(self) -> None:
+        """Re-index the CF store's trigger addresses — call after it changes."""
+        scenes = self.cf_storage.data.get("nikobus_cf") if self.cf_storage else None
+        self._cf_trigger_index = build_cf_trigger_index(scenes)
 
     def get_controlled_by(self, module_address: str, channel: int) -> list[dict[str, Any]]:
         """Return the buttons that trigger a given ``(module_address, channel)``."""
@@ -1086,6 +1461,111 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
         except (IndexError, ValueError, KeyError, TypeError):
             return default
 
+    async def async_calibrate_cover(
+        self, module_id: str, channel: int, cycles: int = DEFAULT_CALIBRATION_CYCLES
+    ) -> TravelFit:
+        """Time full open and close runs of a shutter channel and store them.
+
+        Each run is timed from the move command reaching the bus until
+        the module drops the channel's status byte back to stopped,
+        read every ``CALIBRATION_SAMPLE_INTERVAL``. The fitted per-
+        direction times replace the channel's ``operation_time_up`` /
+        ``operation_time_down`` in the module store and are pushed to
+        the live cover. The shutter ends closed. Raises
+        ``CalibrationError`` when a run doesn't behave like a timed move.
+        """
+        addr = module_id.upper()
+        group = 1 if channel <= 6 else 2
+        key = (addr, channel)
+        self.calibrating.add(key)
+
+        async def _read_byte() -> int | None:
+            try:
+                async with self.bus_scheduler.slot(BusPriority.POLL):
+                    state = await self.nikobus_command.get_output_state(addr, group)
+            except Exception as err:  # noqa: BLE001
+                _LOGGER.debug("Calibration read of %s group %d failed: %s", addr, group, err)
+                return None
+            if not state or len(state) < 12:
+                return None
+            self.set_bytearray_group_state(addr, group, state, confirmed=True)
+            # Let the cover follow the runs like any other observed move.
+            await self.async_event_handler(
+                "nikobus_refreshed", {"impacted_module_address": addr}
+            )
+            return bytes.fromhex(state[:12])[(channel - 1) % 6]
+
+        def _command(
+            direction: str,
+        ) -> Callable[[Callable[[], Awaitable[None]]], Awaitable[None]]:
+            async def _send(on_sent: Callable[[], Awaitable[None]]) -> None:
+                if direction == "opening":
+                    await self.api.open_cover(addr, channel, on_sent)
+                else:
+                    await self.api.close_cover(addr, channel, on_sent)
+
+            return _send
+
+        samples = []
+        try:
+            for _ in range(cycles):
+                for direction in ("opening", "closing"):
+                    samples.append(
+                        await time_travel(
+                            direction,
+                            _command(direction),
+                            _read_byte,
+                            sample_interval=CALIBRATION_SAMPLE_INTERVAL,
+                            timeout=CALIBRATION_TIMEOUT,
+                        )
+                    )
+        finally:
+            self.calibrating.discard(key)
+        fit = fit_travel_times(samples)
+        _LOGGER.info(
+            "Calibrated %s ch%d over %d runs: up %.1f s, down %.1f s, start latency %.2f s",
+            self.address_label(addr), channel, fit.runs,
+            fit.time_up, fit.time_down, fit.start_latency,
+        )
+
+        hit = find_module(self.module_storage.data, addr)
+        channels = hit[1].get("channels") if hit is not None else None
+        if isinstance(channels, list) and 0 < channel <= len(channels):
+            entry = channels[channel - 1]
+            entry["operation_time_up"] = f"{fit.time_up:.1f}"
+            entry["operation_time_down"] = f"{fit.time_down:.1f}"
+            await self.async_on_module_save()
+        async_dispatcher_send(
+            self.hass, calibration_signal(addr), channel, fit.time_up, fit.time_down
+        )
+        return fit
+
+    async def async_dispatch_module_writes(
+        self, label: str, writes: Mapping[str, ModuleWrite]
+    ) -> DispatchResult:
+        """Put one scene's module writes on the bus as a single batch.
+
+        At most ``scene_dispatch_limit`` modules wait for their answer at
+        once. The first-to-last answer spread is logged and kept for
+        diagnostics.
+        """
+        result = await dispatch_module_writes(
+            writes, limit=self._scene_dispatch_limit, timeout=SCENE_ANSWER_TIMEOUT
+        )
+        stats = self.scene_dispatch
+        stats["batches"] += 1
+        stats["unanswered"] += result.sent - result.answered
+        if result.skew is not None:
+            skew_ms = round(result.skew * 1000, 1)
+            stats["last_skew_ms"] = skew_ms
+            stats["max_skew_ms"] = max(stats["max_skew_ms"], skew_ms)
+        _LOGGER.debug(
+            "%s: %d of %d module writes sent, %d answered, actuation skew %s",
+            label, result.sent, result.modules, result.answered,
+            f"{result.skew * 1000:.0f} ms" if result.skew is not None else "n/a",
+        )
+        return result
+
     # ------------------------------------------------------------------
     # Convenience state accessors used by entity platforms
     # ------------------------------------------------------------------
@@ -1144,11 +1624,9 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
             await self.button_storage.async_save()
             self._rebuild_dict_module_data()
             self._invalidate_routing_cache()
-            # Reload so platforms drop entities for the purged addresses.
-            # Schedule rather than await — matches ``_async_options_updated``.
-            self.hass.async_create_task(
-                self.hass.config_entries.async_reload(self.config_entry.entry_id)
-            )
+            self._rebuild_press_routes()
+            # Drop the purged addresses' entities in place.
+            self.hass.async_create_task(self.async_reconcile_entities())
 
         return {
             "removed_modules": removed_modules,
@@ -1185,10 +1663,13 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
         except (TypeError, ValueError):
             repeats = DEFAULT_PRESS_REPEAT
         command = f"#N{address}\r#E1"
-        for i in range(repeats):
-            await self.nikobus_command.queue_command(command)
-            if i < repeats - 1:
-                await asyncio.sleep(PRESS_REPEAT_DELAY)
+        # One slot for the whole burst: polls wait until the last frame
+        # is queued instead of slipping in between the repeats.
+        async with self.bus_scheduler.slot(BusPriority.INTERACTIVE):
+            for i in range(repeats):
+                await self.nikobus_command.queue_command(command)
+                if i < repeats - 1:
+                    await asyncio.sleep(PRESS_REPEAT_DELAY)
 
     async def async_event_handler(self, event: str, data: dict[str, Any]) -> None:
         """Send an HA-originated press, or wake the impacted module's entities.
@@ -1197,12 +1678,23 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
         feedback dispatches the targeted update once the state actually
         changes, so there's nothing to refresh here — returning avoids a
         pointless wake of every entity.
+
+        A refresh wakes only the channels whose bytes changed since the
+        module's last refresh, as recorded by the state table, each on its
+        own ``channel_signal``; the module-wide signal follows for
+        per-module listeners. A refresh that changed nothing wakes nobody.
         """
         if event == "ha_button_pressed":
             await self.async_send_button_press(str(data.get("address") or ""))
             return
 
         if address := data.get("impacted_module_address"):
+            changed = self._module_states.take_changes(str(address).upper())
+            if not changed:
+                return
+            for channel in range(1, changed.bit_length() + 1):
+                if changed & (1 << (channel - 1)):
+                    async_dispatcher_send(self.hass, channel_signal(address, channel))
             async_dispatcher_send(self.hass, f"{DOMAIN}_update_{address}")
 
     # ------------------------------------------------------------------
@@ -1243,6 +1735,9 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
         self.async_update_listeners()
         if self.nikobus_command:
             await self.nikobus_command.stop()
+        # The stopped worker cut off any exchange in flight; the slots
+        # those hold would keep polls and press refreshes waiting forever.
+        self.bus_scheduler.reset()
         if self.nikobus_listener:
             # Stop the listener BEFORE the reconnect runs. If we leave
             # it running, its pending ``read()`` on the old reader
@@ -1298,6 +1793,9 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
                 await self.nikobus_listener.start()
                 self._last_connected = datetime.now(timezone.utc)
                 self._reconnect_attempts = 0
+                # Anything may have changed while the bus was away:
+                # read every group, not just the ones due.
+                self._poll_scheduler.reset()
                 await self._async_update_data()
                 self.async_update_listeners()
                 _LOGGER.info("Nikobus reconnected after %d attempt(s)", attempts)
@@ -1323,13 +1821,28 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
         self._stopping = True
 
         # 1. Cancel background tasks FIRST.
-        for task_attr in ("_reconnect_task", "_reload_task"):
+        for task_attr in ("_reconnect_task", "_reconcile_task"):
             task: asyncio.Task[None] | None = getattr(self, task_attr, None)
             if task and not task.done():
                 task.cancel()
                 with contextlib.suppress(asyncio.CancelledError):
                     await task
             setattr(self, task_attr, None)
+        if self._snapshot_unsub is not None:
+            self._snapshot_unsub()
+            self._snapshot_unsub = None
+        await self.async_save_snapshot()
+        # Store saves are delayed to coalesce bursts; write any still
+        # pending before the entry goes away.
+        await asyncio.gather(*(
+            store.async_flush()
+            for store in (
+                self.module_storage,
+                self.button_storage,
+                self.cf_storage,
+                self.state_storage,
+            )
+        ))
 
         # Cancel the actuator's in-flight press / refresh tasks too, so a
         # button press being processed during unload can't touch the
@@ -1337,6 +1850,7 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
         actuator = getattr(self, "nikobus_actuator", None)
         if actuator:
             actuator.stop()
+        self.motion_engine.stop()
 
         # 2. Then stop subsystems in reverse start order.
         if self.nikobus_listener:
@@ -1349,6 +1863,7 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
                 await self.nikobus_command.stop()
             except NikobusError as err:
                 _LOGGER.error("Failed to stop command handler: %s", err)
+        self.bus_scheduler.reset()
         try:
             await self.nikobus_connection.disconnect()
         except NikobusError as err:
@@ -1361,17 +1876,15 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
     def get_known_entity_unique_ids(self) -> set[str]:
         """Return the set of valid unique_ids for all Nikobus entities."""
         from .router import (
-            build_routing,
-            build_unique_id,
             input_latch_switch_unique_id,
             iter_input_module_children,
             iter_operation_points,
         )
-        known: set[str] = set()
-        routing = build_routing(self.dict_module_data)
-        for specs in routing.values():
-            for spec in specs:
-                known.add(build_unique_id(spec.domain, spec.kind, spec.address, spec.channel))
+        # Channel entities come from the routing memo, which keeps their
+        # ids in step with the modules it re-routed.
+        known: set[str] = set(
+            routing_memo(self.hass, self.config_entry).unique_ids(self.dict_module_data)
+        )
         buttons = self.dict_button_data.get("nikobus_button", {})
         # Button + push-button ids, via the shared op-point enumerator
         # (same guard ladder the button/binary-sensor platforms use).
@@ -1467,11 +1980,43 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
             )
 
     def _invalidate_routing_cache(self) -> None:
-        """Drop the cached router spec so the next access rebuilds it
-        (e.g. after modules are discovered, purged, or edited)."""
-        domain_data = self.hass.data.get(DOMAIN, {})
-        entry_data = domain_data.get(self.config_entry.entry_id, {})
-        entry_data.pop("routing", None)
+        """Have the next routing access re-check the modules (e.g. after
+        they are discovered, purged, or edited); only those whose entry
+        changed are routed again."""
+        routing_memo(self.hass, self.config_entry).invalidate()
+
+    def register_platform_entities(
+        self, platform: str, entities: PlatformEntities
+    ) -> None:
+        """Track a platform's entities for ``async_reconcile_entities``."""
+        self._platform_entities[platform] = entities
+
+    async def async_reconcile_entities(self) -> None:
+        """Bring every platform's entities in line with the stores.
+
+        Adds the entities of new modules, buttons, CFs and scenes, removes
+        those that are gone and replaces those whose record changed —
+        without a config-entry reload, so the bus connection stays up and
+        untouched entities keep their state. Serialised: a reconcile
+        asked for while one runs waits for it, then sees its result.
+        """
+        from . import _async_cleanup_orphan_entities  # local import to avoid cycle
+
+        async with self._reconcile_lock:
+            self._invalidate_routing_cache()
+            # A newly discovered module needs its state row before its
+            # entities read it.
+            self._initialize_module_states()
+            added = removed = 0
+            for entities in self._platform_entities.values():
+                platform_added, platform_removed = await entities.async_reconcile()
+                added += platform_added
+                removed += platform_removed
+            await _async_cleanup_orphan_entities(self.hass, self.config_entry, self)
+            self.refresh_repair_issues()
+        _LOGGER.info(
+            "Reconciled Nikobus entities: %d added, %d removed", added, removed
+        )
 
     async def async_on_module_save(self) -> None:
         """Persist the Store after discovery/user edits, then refresh derived views.
@@ -1480,9 +2025,16 @@ class NikobusDataCoordinator(NikobusDiscoveryMixin, DataUpdateCoordinator[None])
         and by the options flow after a module/channel edit.
         """
         await self.module_storage.async_save()
+        self.module_revision += 1
         self._rebuild_dict_module_data()
         # Clear the cached router spec so newly-discovered modules show up.
         self._invalidate_routing_cache()
+        self._rebuild_press_routes()
+
+    def _rebuild_press_routes(self) -> None:
+        """Recompile the actuator's press-routing table after a store change."""
+        if self.nikobus_actuator is not None:
+            self.nikobus_actuator.rebuild_routes()
 
 
 
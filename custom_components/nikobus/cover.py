@@ -6,6 +6,8 @@ import asyncio
 import logging
 import time
 import uuid
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterator
 from typing import Any
 
 from homeassistant.components.cover import (
@@ -26,13 +28,20 @@ from .const import (
     DEFAULT_COVER_MOVEMENT_BUFFER,
     DEFAULT_COVER_OPERATION_TIME,
     DOMAIN,
+    calibration_signal,
+    channel_signal,
     press_signal,
 )
 from .coordinator import NikobusConfigEntry, NikobusDataCoordinator
 from .entity import NikobusEntity, command_error
 from .nkbreconcile import cf_cover_members, is_pure_roller_cf
 from .nkbtravelcalculator import NikobusTravelCalculator
-from .router import build_unique_id, get_routing, register_output_module_devices
+from .router import (
+    PlatformEntities,
+    build_unique_id,
+    get_routing,
+    register_output_module_devices,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -63,6 +72,10 @@ def _parse_operation_time(value: Any, fallback: float, label: str, address: str)
     return fallback
 
 
+# Signed positioning errors (percentage points) kept per cover for its
+# attributes: the last one and the mean absolute error over this many.
+POSITION_ERROR_HISTORY = 10
+
 # Nikobus Internal States
 STATE_STOPPED = 0x00
 STATE_OPENING = 0x01
@@ -99,27 +112,27 @@ async def async_setup_entry(
 ) -> None:
     """Set up Nikobus cover entities from a config entry."""
     coordinator: NikobusDataCoordinator = entry.runtime_data
-    routing = get_routing(hass, entry, coordinator.dict_module_data)
-    specs = routing.get("cover", [])
-    register_output_module_devices(hass, entry, specs)
-
-    entities = []
-    for spec in specs:
-        op_time_up = _parse_operation_time(
-            spec.operation_time_up,
-            DEFAULT_COVER_OPERATION_TIME,
-            "operation_time_up",
-            spec.address,
-        )
-        op_time_down = _parse_operation_time(
-            spec.operation_time_down,
-            op_time_up,
-            "operation_time_down",
-            spec.address,
-        )
 
-        entities.append(
-            NikobusCoverEntity(
+    def _build() -> Iterator[tuple[CoverEntity, Any]]:
+        routing = get_routing(hass, entry, coordinator.dict_module_data)
+        specs = routing.get("cover", [])
+        register_output_module_devices(hass, entry, specs)
+
+        for spec in specs:
+            op_time_up = _parse_operation_time(
+                spec.operation_time_up,
+                DEFAULT_COVER_OPERATION_TIME,
+                "operation_time_up",
+                spec.address,
+            )
+            op_time_down = _parse_operation_time(
+                spec.operation_time_down,
+                op_time_up,
+                "operation_time_down",
+                spec.address,
+            )
+
+            yield NikobusCoverEntity(
                 coordinator,
                 spec.address,
                 spec.channel,
@@ -128,30 +141,31 @@ async def async_setup_entry(
                 spec.module_model,
                 op_time_up,
                 op_time_down,
-            )
-        )
-
-    # Pure-roller central functions (every member a shutter channel) become
-    # actionable grouped covers. A roller CF bundles its members' open /
-    # close / toggle links, so broadcasting its address can't express a
-    # direction; instead the grouped cover drives the member channels
-    # through the atomic per-module commit path (like a scene). This works
-    # for ``M01`` toggle groups too, because it commands the output state
-    # directly rather than replaying a link.
-    cf_storage = getattr(coordinator, "cf_storage", None)
-    cf_data = cf_storage.data.get("nikobus_cf", {}) if cf_storage is not None else {}
-    if isinstance(cf_data, dict):
-        for bus_address, cf in cf_data.items():
-            if not isinstance(cf, dict) or not is_pure_roller_cf(cf):
-                continue
-            members = cf_cover_members(cf)
-            if not members:
-                continue
-            entities.append(
-                NikobusCFCoverEntity(coordinator, str(bus_address), cf, members)
-            )
-
-    async_add_entities(entities)
+            ), spec
+
+        # Pure-roller central functions (every member a shutter channel)
+        # become actionable grouped covers. A roller CF bundles its members'
+        # open / close / toggle links, so broadcasting its address can't
+        # express a direction; instead the grouped cover drives the member
+        # channels through the atomic per-module commit path (like a
+        # scene). This works for ``M01`` toggle groups too, because it
+        # commands the output state directly rather than replaying a link.
+        cf_storage = getattr(coordinator, "cf_storage", None)
+        cf_data = cf_storage.data.get("nikobus_cf", {}) if cf_storage is not None else {}
+        if isinstance(cf_data, dict):
+            for bus_address, cf in cf_data.items():
+                if not isinstance(cf, dict) or not is_pure_roller_cf(cf):
+                    continue
+                members = cf_cover_members(cf)
+                if not members:
+                    continue
+                yield NikobusCFCoverEntity(
+                    coordinator, str(bus_address), cf, members
+                ), cf
+
+    entities = PlatformEntities(_build, async_add_entities)
+    entities.async_add_initial()
+    coordinator.register_platform_entities("cover", entities)
 
 
 class NikobusCoverEntity(NikobusEntity, CoverEntity, RestoreEntity):
@@ -196,6 +210,8 @@ class NikobusCoverEntity(NikobusEntity, CoverEntity, RestoreEntity):
 
         self._movement_source = "ha"
         self._current_run_limit: float = 0.0
+        # How far from the requested position recent timed stops landed.
+        self._position_errors: deque[float] = deque(maxlen=POSITION_ERROR_HISTORY)
         # Last direction a motion actually ran in — used for the stop
         # command when _state has already been committed to STOPPED
         # (e.g. the 0x03 motor-protection clear, where the old code
@@ -238,9 +254,19 @@ class NikobusCoverEntity(NikobusEntity, CoverEntity, RestoreEntity):
     def _render_state(self) -> Any:
         """Diff on bus state + rounded position so an idle, unchanged poll
         skips the write. Position updates during motion are written
-        directly by the motion loop and so bypass this entirely."""
+        directly by the motion engine's UI tick and so bypass this entirely."""
         return (self._state, self.current_cover_position)
 
+    def _update_signal(self) -> str:
+        """Wake on this cover channel's changes only."""
+        return channel_signal(self._address, self._channel)
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write state and note the position for the warm-start snapshot."""
+        self.coordinator.note_cover_position(self._address, self._channel, self._position)
+        super().async_write_ha_state()
+
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes, merging with parent attributes."""
@@ -251,15 +277,30 @@ class NikobusCoverEntity(NikobusEntity, CoverEntity, RestoreEntity):
             "operation_time_down": self._calculator.time_down,
             "movement_source": self._movement_source,
             "controlled_by": self.coordinator.get_controlled_by(self._address, self._channel),
+            "positioning_error": (
+                round(self._position_errors[-1], 1) if self._position_errors else None
+            ),
+            "positioning_error_mean": (
+                round(sum(abs(e) for e in self._position_errors) / len(self._position_errors), 1)
+                if self._position_errors
+                else None
+            ),
         }
 
     async def async_added_to_hass(self) -> None:
         """Restore state and listen for Nikobus bus events."""
         await super().async_added_to_hass()
+        # The coordinator's warm-start snapshot and HA's restore state
+        # both remember the position; take whichever was saved last.
+        restored = self.coordinator.restored_cover_position(self._address, self._channel)
         if last_state := await self.async_get_last_state():
-            if (pos := last_state.attributes.get(ATTR_CURRENT_POSITION)) is not None:
-                self._position = float(pos)
-                self._calculator.set_position(self._position)
+            if (pos := last_state.attributes.get(ATTR_CURRENT_POSITION)) is not None and (
+                restored is None or last_state.last_updated.timestamp() >= restored[1]
+            ):
+                restored = (float(pos), last_state.last_updated.timestamp())
+        if restored is not None:
+            self._position = restored[0]
+            self._calculator.set_position(self._position)
 
         # Per-address signal keyed by this cover's module address: only
         # this module's covers are woken on a press, instead of a global
@@ -270,8 +311,14 @@ class NikobusCoverEntity(NikobusEntity, CoverEntity, RestoreEntity):
                 self.hass, press_signal(self._address), self._handle_button_pressed
             )
         )
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, calibration_signal(self._address), self._handle_calibrated
+            )
+        )
 
         def _cancel_cover_tasks() -> None:
+            self.coordinator.motion_engine.untrack(self)
             for task_attr in ("_motion_task", "_coalesce_task", "_error_recovery_task"):
                 task = getattr(self, task_attr, None)
                 if task:
@@ -346,6 +393,15 @@ class NikobusCoverEntity(NikobusEntity, CoverEntity, RestoreEntity):
 
         super()._handle_coordinator_update()
 
+    @callback
+    def _handle_calibrated(self, channel: int, time_up: float, time_down: float) -> None:
+        """Adopt travel times measured by the ``calibrate_cover`` action."""
+        if channel != self._channel:
+            return
+        self._calculator.time_up = time_up
+        self._calculator.time_down = time_down
+        self.async_write_ha_state()
+
     async def _handle_button_pressed(self, data: dict[str, Any]) -> None:
         """Handle a physical Nikobus button press event (routed by module).
 
@@ -452,6 +508,7 @@ class NikobusCoverEntity(NikobusEntity, CoverEntity, RestoreEntity):
         """Initialize the virtual travel tracker."""
         if self._motion_task:
             self._motion_task.cancel()
+            self._motion_task = None
 
         self._state = STATE_OPENING if direction == "opening" else STATE_CLOSING
         self._last_motion_direction = direction
@@ -473,45 +530,85 @@ class NikobusCoverEntity(NikobusEntity, CoverEntity, RestoreEntity):
             active_op_time - detection_latency + DEFAULT_COVER_MOVEMENT_BUFFER,
         )
 
-        self._motion_task = self.hass.async_create_task(self._motion_loop())
+        # Travel is linear, so a target position has an exact stop instant;
+        # the shared motion engine fires it there instead of a loop
+        # noticing the crossing on its next tick. The stop goes out early
+        # by the time stop commands have lately taken to reach the bus.
+        run_for = self._current_run_limit
+        if self._target_position is not None:
+            to_target = self._calculator.time_to_position(self._target_position)
+            if to_target is not None:
+                lead = self.coordinator.motion_engine.stop_lead
+                run_for = min(run_for, max(0.0, to_target - lead))
+
+        self.coordinator.motion_engine.track(
+            self, run_for, self._on_motion_deadline, self._on_motion_tick
+        )
         self.async_write_ha_state()
 
-    async def _motion_loop(self) -> None:
-        """Update position periodically while moving."""
-        try:
-            start_time = time.monotonic()
-            # Capture source at loop start; _movement_source must not change
-            # the stop decision mid-iteration after an await.
-            movement_source = self._movement_source
-            while self._state in (STATE_OPENING, STATE_CLOSING):
-                elapsed = time.monotonic() - start_time
-                self._position = self._calculator.current_position()
-
-                if elapsed >= self._current_run_limit or self._should_stop():
-                    if elapsed >= self._current_run_limit and self._target_position is None:
-                        # Reached mechanical end-stop — snap to exact value.
-                        self._position = 100.0 if self._state == STATE_OPENING else 0.0
-                        self._calculator.set_position(self._position)
-                    elif self._target_position is not None:
-                        # Snap to exact target to eliminate 0.5 s tick overshoot.
-                        self._position = float(self._target_position)
-                        self._calculator.set_position(self._position)
-                    await self._stop(send_stop=(movement_source == "ha"))
-                    break
+    @callback
+    def _on_motion_tick(self) -> None:
+        """Redraw the in-transit position (shared motion-engine UI tick)."""
+        if self._state not in (STATE_OPENING, STATE_CLOSING):
+            return
+        self._position = self._calculator.current_position()
+        if self._should_stop():
+            # Crossed the target without a computed deadline behind it.
+            self.coordinator.motion_engine.untrack(self)
+            self._on_motion_deadline()
+            return
+        self.async_write_ha_state()
+
+    @callback
+    def _on_motion_deadline(self) -> None:
+        """Stop at the end of travel or at the target position."""
+        if self._state not in (STATE_OPENING, STATE_CLOSING):
+            return
+        send_stop = self._movement_source == "ha"
+        on_sent = None
+        target = self._target_position
+        if target is None:
+            # Reached mechanical end-stop — snap to exact value.
+            self._position = 100.0 if self._state == STATE_OPENING else 0.0
+        else:
+            if send_stop:
+                on_sent = self._target_stop_sent_handler(target)
+            # Show the target the stop was timed for until the stop
+            # frame's answer says where the shutter really halted.
+            self._position = float(target)
+        self._calculator.stop()
+        self._calculator.set_position(self._position)
+        self._motion_task = self.hass.async_create_task(
+            self._stop(send_stop=send_stop, on_sent=on_sent)
+        )
+
+    def _target_stop_sent_handler(self, target: int) -> Callable[[], Awaitable[None]]:
+        """Build the completion handler of a stop timed for ``target``.
+
+        Measures how long the stop took from its deadline to the bus,
+        feeds that to the engine's stop lead, and records where the
+        shutter — still travelling at its modelled speed until the frame
+        landed — actually halted relative to the target.
+        """
+        issued_at = time.monotonic()
+        issued_from = self._calculator.current_position()
+        direction = 1 if self._state == STATE_OPENING else -1
+        active_time = (
+            self._calculator.time_up if direction == 1 else self._calculator.time_down
+        )
 
+        async def _on_sent() -> None:
+            latency = time.monotonic() - issued_at
+            self.coordinator.motion_engine.record_stop_latency(latency)
+            travelled = latency / active_time * 100.0 if active_time > 0 else 0.0
+            achieved = max(0.0, min(100.0, issued_from + direction * travelled))
+            self._position_errors.append(achieved - target)
+            if self._state == STATE_STOPPED:
+                self._position = achieved
+                self._calculator.set_position(achieved)
                 self.async_write_ha_state()
-                await asyncio.sleep(0.5)
-        except asyncio.CancelledError:
-            pass
-        except Exception as err:
-            _LOGGER.error(
-                "Cover %s ch%d motion loop failed — forcing stop: %s",
-                self._address,
-                self._channel,
-                err,
-                exc_info=True,
-            )
-            await self._stop(send_stop=False)
+
+        return _on_sent
 
     def _should_stop(self) -> bool:
         """Check if cover reached the target position."""
@@ -521,19 +618,25 @@ class NikobusCoverEntity(NikobusEntity, CoverEntity, RestoreEntity):
             return self._target_position is not None and self._position <= self._target_position
         return False
 
-    async def _stop(self, send_stop: bool = False, force_api: bool = False) -> None:
-        """Stop movement and finalize position."""
+    async def _stop(
+        self,
+        send_stop: bool = False,
+        force_api: bool = False,
+        on_sent: Callable[[], Awaitable[None]] | None = None,
+    ) -> None:
+        """Stop movement and finalize position.
+
+        ``on_sent`` runs once the stop frame has gone out on the bus.
+        """
+        self.coordinator.motion_engine.untrack(self)
         task = self._motion_task
         self._motion_task = None
         if task is not None and task is not asyncio.current_task():
-            # Never cancel the task we are running IN: when the motion
-            # loop itself calls _stop (target reached / end-stop), a
+            # Never cancel the task we are running IN: when the deadline
+            # stop task itself calls _stop (target reached / end-stop), a
             # self-cancel would inject CancelledError at the next await
             # — which is the api.stop_cover() call below — and the bus
-            # STOP frame would silently never be sent (the loop's
-            # ``except CancelledError: pass`` swallows it). The loop
-            # ``break``s right after this returns, so not cancelling it
-            # is correct.
+            # STOP frame would silently never be sent.
             task.cancel()
 
         stopped_state = self._state
@@ -557,7 +660,9 @@ class NikobusCoverEntity(NikobusEntity, CoverEntity, RestoreEntity):
                 # 0x03 protection clear) — use the direction the motion
                 # actually ran in instead of an arbitrary "closing".
                 dir_cmd = self._last_motion_direction
-            await self.coordinator.api.stop_cover(self._address, self._channel, dir_cmd)
+            await self.coordinator.api.stop_cover(
+                self._address, self._channel, dir_cmd, completion_handler=on_sent
+            )
 
         self.async_write_ha_state()
 
@@ -579,9 +684,9 @@ class NikobusCFCoverEntity(NikobusEntity, CoverEntity):
 
     Position is modelled at the group level by one travel calculator (seeded
     with the slowest member's run time) so "fully open/closed" reflects the
-    last shutter to finish. The motion loop only advances the displayed
-    position; the real bus stop is sent by the per-module timed-stop tasks,
-    so the loop never cancels itself mid-command.
+    last shutter to finish. The coordinator's shared motion engine redraws
+    that position, ends the modelled travel, and fires the per-module timed
+    stops at their deadline; only the stop commits themselves run as tasks.
     """
 
     _attr_device_class = CoverDeviceClass.SHUTTER
@@ -656,11 +761,12 @@ class NikobusCFCoverEntity(NikobusEntity, CoverEntity):
         self._position: float = 100.0
         self._state = STATE_STOPPED
         self._run_limit: float = 0.0
-        self._motion_task: asyncio.Task[None] | None = None
         # One stop token per module, re-minted on every move so a stale
         # timed stop from a previous activation can't fire on a fresh move.
         self._module_tokens: dict[str, str] = {}
         self._stop_tasks: list[asyncio.Task[None]] = []
+        # First-to-last module answer spread of the last group command.
+        self._last_skew: float | None = None
 
     @property
     def current_cover_position(self) -> int:
@@ -704,22 +810,17 @@ class NikobusCFCoverEntity(NikobusEntity, CoverEntity):
                 }
                 for m in self._members
             ],
+            "last_actuation_skew_ms": (
+                round(self._last_skew * 1000) if self._last_skew is not None else None
+            ),
         }
 
     async def async_added_to_hass(self) -> None:
         """Cancel any pending motion / timed-stop tasks on removal."""
         await super().async_added_to_hass()
 
-        def _cancel_tasks() -> None:
-            self._module_tokens.clear()
-            if self._motion_task:
-                self._motion_task.cancel()
-                self._motion_task = None
-            for task in self._stop_tasks:
-                task.cancel()
-            self._stop_tasks.clear()
-
-        self.async_on_remove(_cancel_tasks)
+        self.async_on_remove(self._cancel_motion)
+        self.async_on_remove(self._cancel_stops)
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open every member shutter."""
@@ -782,49 +883,79 @@ class NikobusCFCoverEntity(NikobusEntity, CoverEntity):
                 if op_time > 0:
                     delay = max(delay, op_time + DEFAULT_COVER_MOVEMENT_BUFFER)
             sent_states[module_id] = state
-            await self._commit_module(module_id, state)
+        await self._commit_modules(sent_states)
 
         # Schedule the timed stop per module once all are moving.
-        for module_id, indexes in commanded.items():
-            token = uuid.uuid4().hex
-            self._module_tokens[module_id] = token
-            task = self.hass.async_create_task(
-                self._delayed_stop(module_id, sent_states[module_id], indexes, delay, token)
-            )
-            self._stop_tasks.append(task)
-            task.add_done_callback(
-                lambda t: self._stop_tasks.remove(t) if t in self._stop_tasks else None
-            )
+        for module_id in commanded:
+            self._module_tokens[module_id] = uuid.uuid4().hex
+        tokens = dict(self._module_tokens)
+
+        @callback
+        def _on_stop_deadline() -> None:
+            for module_id, indexes in commanded.items():
+                task = self.hass.async_create_task(
+                    self._timed_stop(
+                        module_id, sent_states[module_id], indexes, tokens[module_id]
+                    )
+                )
+                self._stop_tasks.append(task)
+                task.add_done_callback(
+                    lambda t: self._stop_tasks.remove(t) if t in self._stop_tasks else None
+                )
+
+        if commanded:
+            self.coordinator.motion_engine.track((self, "stop"), delay, _on_stop_deadline)
 
         self._start_motion(direction)
 
-    async def _commit_module(self, module_id: str, state: bytearray) -> None:
+    async def _commit_modules(self, states: dict[str, bytearray]) -> None:
+        """Commit every member module's state as one dispatch batch."""
+        result = await self.coordinator.async_dispatch_module_writes(
+            f"CF cover {self._bus_address}",
+            {
+                module_id: (
+                    lambda on_answered, m=module_id, st=state: self._commit_module(
+                        m, st, completion_handler=on_answered
+                    )
+                )
+                for module_id, state in states.items()
+            },
+        )
+        self._last_skew = result.skew
+
+    async def _commit_module(
+        self,
+        module_id: str,
+        state: bytearray,
+        completion_handler: Callable[[], Awaitable[None]] | None = None,
+    ) -> bool:
         """Stage and push a whole module's state in one bus commit (per group)."""
         num_chans = self.coordinator.get_module_channel_count(module_id)
         self.coordinator.set_bytearray_group_state(module_id, 1, state[:6].hex())
         if num_chans > 6:
             self.coordinator.set_bytearray_group_state(module_id, 2, state[6:12].hex())
-        await self.coordinator.api.set_output_states_for_module(address=module_id)
+        await self.coordinator.api.set_output_states_for_module(
+            address=module_id, completion_handler=completion_handler
+        )
         await self.coordinator.async_event_handler(
             "nikobus_refreshed", {"impacted_module_address": module_id}
         )
+        return True
 
-    async def _delayed_stop(
+    async def _timed_stop(
         self,
         module_id: str,
         sent_state: bytearray,
         indexes: set[int],
-        delay: float,
         token: str,
     ) -> None:
-        """Send the bus stop once travel time elapses.
+        """Send the bus stop once travel time has elapsed.
 
         Composes the stop frame from the module's CURRENT state at timeout,
         not the activation snapshot: a channel redirected during travel (by a
         wall button, another scene, or a direct cover) is left alone — only
         channels still doing what we commanded are forced to STOPPED.
         """
-        await asyncio.sleep(delay)
         if self._module_tokens.get(module_id) != token:
             return
 
@@ -854,6 +985,7 @@ class NikobusCFCoverEntity(NikobusEntity, CoverEntity):
         self._position = self._calculator.current_position()
         self._state = STATE_STOPPED
 
+        stop_states: dict[str, bytearray] = {}
         for module_id, members in self._members_by_module().items():
             current = self.coordinator.nikobus_module_states.get(module_id, bytearray(12))
             state = bytearray(current)
@@ -861,13 +993,13 @@ class NikobusCFCoverEntity(NikobusEntity, CoverEntity):
                 idx = member["channel"] - 1
                 if 0 <= idx < len(state):
                     state[idx] = STATE_STOPPED
-            await self._commit_module(module_id, state)
+            stop_states[module_id] = state
+        await self._commit_modules(stop_states)
 
         self.async_write_ha_state()
 
     def _start_motion(self, direction: str) -> None:
         """Start the group-level position model for the UI."""
-        self._cancel_motion()
         self._state = STATE_OPENING if direction == "opening" else STATE_CLOSING
         active = (
             self._calculator.time_up if direction == "opening" else self._calculator.time_down
@@ -875,39 +1007,38 @@ class NikobusCFCoverEntity(NikobusEntity, CoverEntity):
         self._calculator.start_travel(direction)
         self._position = self._calculator.current_position()
         self._run_limit = max(DEFAULT_COVER_MOVEMENT_BUFFER, active)
-        self._motion_task = self.hass.async_create_task(self._motion_loop())
+        self.coordinator.motion_engine.track(
+            self, self._run_limit, self._on_travel_done, self._on_motion_tick
+        )
         self.async_write_ha_state()
 
-    async def _motion_loop(self) -> None:
-        """Advance the displayed position until travel completes.
+    @callback
+    def _on_motion_tick(self) -> None:
+        """Redraw the group position (shared motion-engine UI tick)."""
+        self._position = self._calculator.current_position()
+        self.async_write_ha_state()
 
-        Does not send bus frames — the hardware stop is the job of the
-        per-module timed-stop tasks — so this loop can be cancelled freely
-        without ever swallowing a STOP command.
+    @callback
+    def _on_travel_done(self) -> None:
+        """End the modelled travel once the slowest member has arrived.
+
+        Sends no bus frames — the hardware stop is the job of the
+        per-module timed stops — so ending the model early or late never
+        swallows a STOP command.
         """
-        try:
-            start = time.monotonic()
-            while self._state in (STATE_OPENING, STATE_CLOSING):
-                elapsed = time.monotonic() - start
-                self._position = self._calculator.current_position()
-                if elapsed >= self._run_limit:
-                    self._position = 100.0 if self._state == STATE_OPENING else 0.0
-                    self._calculator.set_position(self._position)
-                    self._state = STATE_STOPPED
-                    self.async_write_ha_state()
-                    break
-                self.async_write_ha_state()
-                await asyncio.sleep(0.5)
-        except asyncio.CancelledError:
-            pass
+        if self._state not in (STATE_OPENING, STATE_CLOSING):
+            return
+        self._position = 100.0 if self._state == STATE_OPENING else 0.0
+        self._calculator.stop()
+        self._calculator.set_position(self._position)
+        self._state = STATE_STOPPED
+        self.async_write_ha_state()
 
     def _cancel_motion(self) -> None:
-        task = self._motion_task
-        self._motion_task = None
-        if task is not None and task is not asyncio.current_task():
-            task.cancel()
+        self.coordinator.motion_engine.untrack(self)
 
     def _cancel_stops(self) -> None:
+        self.coordinator.motion_engine.untrack((self, "stop"))
         self._module_tokens.clear()
         for task in self._stop_tasks:
             task.cancel()
@@ -10,10 +10,20 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
 
 from .const import (
+    CONF_BLACKOUT_STREAK,
     CONF_CONNECTION_STRING,
+    CONF_COVER_UPDATE_INTERVAL,
     CONF_HAS_FEEDBACK_MODULE,
+    CONF_POLL_FRESHNESS,
+    CONF_POLL_PIPELINE_DEPTH,
     CONF_PRIOR_GEN3,
     CONF_REFRESH_INTERVAL,
+    CONF_SCENE_DISPATCH_LIMIT,
+    DEFAULT_BLACKOUT_STREAK,
+    DEFAULT_COVER_UPDATE_INTERVAL,
+    DEFAULT_POLL_FRESHNESS,
+    DEFAULT_POLL_PIPELINE_DEPTH,
+    DEFAULT_SCENE_DISPATCH_LIMIT,
     DOMAIN,
 )
 from .coordinator import NikobusConfigEntry, NikobusDataCoordinator
@@ -232,6 +242,26 @@ async def async_get_config_entry_diagnostics(
                 CONF_REFRESH_INTERVAL,
                 entry.data.get(CONF_REFRESH_INTERVAL, 0),
             ),
+            "poll_pipeline_depth": entry.options.get(
+                CONF_POLL_PIPELINE_DEPTH,
+                entry.data.get(CONF_POLL_PIPELINE_DEPTH, DEFAULT_POLL_PIPELINE_DEPTH),
+            ),
+            "poll_freshness": entry.options.get(
+                CONF_POLL_FRESHNESS,
+                entry.data.get(CONF_POLL_FRESHNESS, DEFAULT_POLL_FRESHNESS),
+            ),
+            "blackout_streak": entry.options.get(
+                CONF_BLACKOUT_STREAK,
+                entry.data.get(CONF_BLACKOUT_STREAK, DEFAULT_BLACKOUT_STREAK),
+            ),
+            "cover_update_interval": entry.options.get(
+                CONF_COVER_UPDATE_INTERVAL,
+                entry.data.get(CONF_COVER_UPDATE_INTERVAL, DEFAULT_COVER_UPDATE_INTERVAL),
+            ),
+            "scene_dispatch_limit": entry.options.get(
+                CONF_SCENE_DISPATCH_LIMIT,
+                entry.data.get(CONF_SCENE_DISPATCH_LIMIT, DEFAULT_SCENE_DISPATCH_LIMIT),
+            ),
         },
         "coordinator": {
             "connection_status": coordinator.connection_status,
@@ -241,12 +271,44 @@ async def async_get_config_entry_diagnostics(
                 if coordinator.last_connected
                 else None
             ),
+            "startup_timings_s": {
+                phase: round(seconds, 3)
+                for phase, seconds in coordinator.startup_timings.items()
+            },
+            "snapshot_restored_modules": coordinator.restored_snapshot.modules,
             "module_count": len(coordinator.dict_module_data),
             "button_count": len(
                 coordinator.dict_button_data.get("nikobus_button", {})
             ),
             "scene_count": len(coordinator.dict_scene_data.get("scene", [])),
             "discovery_phase": coordinator.discovery_phase,
+            "last_poll_duration_s": (
+                round(coordinator.last_poll_duration, 3)
+                if coordinator.last_poll_duration is not None
+                else None
+            ),
+            "last_poll_reads": coordinator.last_poll_reads,
+            "blackouts_detected": coordinator.blackouts_detected,
+            "last_blackout_detect_s": (
+                round(coordinator.last_blackout_detect_time, 3)
+                if coordinator.last_blackout_detect_time is not None
+                else None
+            ),
+            "poll_schedule": coordinator.poll_schedule,
+            "bus_queue_wait": coordinator.bus_scheduler.stats(),
+            "write_combining": (
+                coordinator.api_commands.write_stats()
+                if coordinator.api_commands is not None
+                else None
+            ),
+            "press_refresh_reads": (
+                coordinator.nikobus_actuator.refresh_stats
+                if coordinator.nikobus_actuator is not None
+                else None
+            ),
+            "cover_motion": coordinator.motion_engine.stats(),
+            "scene_writes": coordinator.scene_writes,
+            "scene_dispatch": coordinator.scene_dispatch,
             "raw_hex_states": raw_module_states,
         },
         "discovery_quality": {
@@ -145,11 +145,14 @@ class NikobusDiscoveryMixin:
         _discovery_module_order: list[str]
         _discovery_scope: str
         _last_module_scan_was_full: bool
-        _reload_task: asyncio.Task[None] | None
+        _reconcile_task: asyncio.Task[None] | None
 
         def _rebuild_dict_module_data(self) -> None: ...
         def _invalidate_routing_cache(self) -> None: ...
         def invalidate_controlled_by_index(self) -> None: ...
+        def rebuild_cf_trigger_index(self) -> None: ...
+        async def async_reconcile_entities(self) -> None: ...
+        def _rebuild_press_routes(self) -> None: ...
         async def async_send_button_press(self, address: str) -> None: ...
 
     def channel_label_map(self) -> dict[tuple[str, int], str]:
@@ -332,6 +335,7 @@ class NikobusDiscoveryMixin:
                 carried += 1
 
         self.cf_storage.data["nikobus_cf"] = flat
+        self.rebuild_cf_trigger_index()
         await self.cf_storage.async_save()
         _LOGGER.info(
             "CF broadcasts persisted: %d discovered, %d names carried over (%s)",
@@ -529,6 +533,7 @@ class NikobusDiscoveryMixin:
         self._rebuild_dict_module_data()
         self._invalidate_routing_cache()
         self.invalidate_controlled_by_index()
+        self._rebuild_press_routes()
 
         _LOGGER.info(
             "Post-discovery reconciliation: probed=%d present=%d absent=%d "
@@ -605,23 +610,25 @@ class NikobusDiscoveryMixin:
         )
         self._discovery_finished_event.set()
 
-        # Skip the auto-reload when the options flow triggered the discovery;
-        # the flow will reload via its final async_create_entry call.
+        # Skip the auto-reconcile when the options flow triggered the
+        # discovery; the flow reconciles when it finishes.
         if not self._discovery_auto_reload:
             return
 
-        if self._reload_task and not self._reload_task.done():
+        if self._reconcile_task and not self._reconcile_task.done():
             return
 
-        async def _reload() -> None:
+        # Add / remove only the entities the discovery changed — the bus
+        # connection and every untouched entity stay up.
+        async def _reconcile() -> None:
             try:
-                await self.hass.config_entries.async_reload(self.config_entry.entry_id)
+                await self.async_reconcile_entities()
             except asyncio.CancelledError:
                 raise
             except Exception:
-                _LOGGER.exception("Failed to reload config entry after discovery")
+                _LOGGER.exception("Failed to reconcile entities after discovery")
 
-        self._reload_task = self.hass.async_create_task(_reload())
+        self._reconcile_task = self.hass.async_create_task(_reconcile())
 
     # ------------------------------------------------------------------
     # Discovery progress API (called by options flow / buttons / sensors)
@@ -957,6 +964,7 @@ class NikobusDiscoveryMixin:
             await self.module_storage.async_save()
             await self.button_storage.async_save()
             self._rebuild_dict_module_data()
+            self._rebuild_press_routes()
         return changed
 
     async def start_module_scan(
@@ -1159,6 +1167,7 @@ class NikobusDiscoveryMixin:
                         cf["name"] = hit
                         names_persisted = True
             if names_persisted or purged_nkb_scenes:
+                self.rebuild_cf_trigger_index()
                 await self.cf_storage.async_save()
 
         dev_reg = dr.async_get(self.hass)
@@ -1260,13 +1269,11 @@ class NikobusDiscoveryMixin:
             len(cf_name_by_addr),
         )
 
-        # The surfaced-scene set changed — reload so entities are rebuilt:
+        # The surfaced-scene set changed — reconcile so entities follow:
         # names just applied surface previously-hidden (unnamed) button-backed
         # light-scenes, and purging stale duplicates tears theirs down.
         if purged_nkb_scenes or names_persisted:
-            self.hass.async_create_task(
-                self.hass.config_entries.async_reload(self.config_entry.entry_id)
-            )
+            self.hass.async_create_task(self.async_reconcile_entities())
 
         return {
             "devices": devices_named,
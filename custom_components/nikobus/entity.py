@@ -93,6 +93,9 @@ class NikobusEntity(CoordinatorEntity[NikobusDataCoordinator]):
 
         #: Last ``(available, render_state)`` actually written, for diffing.
         self._last_render: tuple[bool, Any] | None = None
+        #: ``(available, group generation)`` the last coordinator render
+        #: read; ``None`` makes the next update render in full.
+        self._rendered_generation: tuple[bool, int] | None = None
 
     def _invalidate_optimistic(self) -> None:
         """Drop optimistic caches before the real state is read (override)."""
@@ -106,6 +109,25 @@ class NikobusEntity(CoordinatorEntity[NikobusDataCoordinator]):
         """
         return _NO_DIFF
 
+    def _update_signal(self) -> str:
+        """Return the dispatcher signal that wakes this entity (override).
+
+        The module-wide signal by default. An entity showing one output
+        channel returns that channel's ``channel_signal`` instead, so a
+        change on another channel of the module leaves it asleep.
+        """
+        return f"{DOMAIN}_update_{self._address}"
+
+    def _state_group(self) -> int | None:
+        """Return the module group (1/2) this entity renders from (override).
+
+        An entity whose displayed state is read from one group of its
+        module's state buffer returns that group, and is skipped outright
+        while the group's generation is unchanged. The default ``None``
+        renders on every update.
+        """
+        return None
+
     @callback
     def _handle_coordinator_update(self) -> None:
         """Write HA state on a coordinator update, skipping the write when
@@ -114,17 +136,29 @@ class NikobusEntity(CoordinatorEntity[NikobusDataCoordinator]):
         Each output module is polled every cycle and entities are woken
         per module; without this, every channel re-rendered (and recom-
         puted its attributes) every cycle even when its byte was
-        unchanged. Diffing on ``(available, render_state)`` collapses an
-        unchanged cycle to a cheap comparison.
+        unchanged. An entity reading one module group first compares that
+        group's generation with the one it last rendered, which settles
+        an unchanged module without evaluating any state; otherwise
+        diffing on ``(available, render_state)`` collapses an unchanged
+        cycle to a cheap comparison.
         """
+        group = self._state_group()
+        if group is not None:
+            stamp = (
+                self.available,
+                self.coordinator.state_generation(self._address, group),
+            )
+            if stamp == self._rendered_generation:
+                return
         self._invalidate_optimistic()
         state = self._render_state()
-        if state is not _NO_DIFF:
-            signature = (self.available, state)
-            if signature == self._last_render:
-                return
+        if state is _NO_DIFF:
+            super()._handle_coordinator_update()
+        elif (signature := (self.available, state)) != self._last_render:
             self._last_render = signature
-        super()._handle_coordinator_update()
+            super()._handle_coordinator_update()
+        if group is not None:
+            self._rendered_generation = stamp
 
     @callback
     def async_write_ha_state(self) -> None:
@@ -144,10 +178,14 @@ class NikobusEntity(CoordinatorEntity[NikobusDataCoordinator]):
 
         Refreshing the cache on every write, whatever its source, keeps
         the diff honest while preserving the redundant-poll optimization.
+        A write from outside the coordinator render may show optimistic
+        state the buffer doesn't hold, so it also drops the rendered
+        generation: the next update renders in full.
         """
         state = self._render_state()
         if state is not _NO_DIFF:
             self._last_render = (self.available, state)
+        self._rendered_generation = None
         super().async_write_ha_state()
 
     @property
@@ -167,9 +205,10 @@ class NikobusEntity(CoordinatorEntity[NikobusDataCoordinator]):
         """Register targeted signal listener for this specific module address."""
         await super().async_added_to_hass()
 
-        signal = f"{DOMAIN}_update_{self._address}"
         self.async_on_remove(
-            async_dispatcher_connect(self.hass, signal, self._handle_coordinator_update)
+            async_dispatcher_connect(
+                self.hass, self._update_signal(), self._handle_coordinator_update
+            )
         )
 
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections.abc import Iterator
 from typing import Any
 
 from homeassistant.components.light import ATTR_BRIGHTNESS, ColorMode, LightEntity
@@ -12,10 +13,15 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from .const import operation_signal
+from .const import channel_signal, operation_signal
 from .coordinator import NikobusConfigEntry, NikobusDataCoordinator
 from .entity import NikobusEntity, command_error
-from .router import build_unique_id, get_routing, register_output_module_devices
+from .router import (
+    PlatformEntities,
+    build_unique_id,
+    get_routing,
+    register_output_module_devices,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -29,36 +35,32 @@ async def async_setup_entry(
 ) -> None:
     """Set up Nikobus light entities from a config entry."""
     coordinator: NikobusDataCoordinator = entry.runtime_data
-    entities: list[LightEntity] = []
 
-    routing = get_routing(hass, entry, coordinator.dict_module_data)
-    specs = routing.get("light", [])
-    register_output_module_devices(hass, entry, specs)
+    def _build() -> Iterator[tuple[LightEntity, Any]]:
+        routing = get_routing(hass, entry, coordinator.dict_module_data)
+        specs = routing.get("light", [])
+        register_output_module_devices(hass, entry, specs)
 
-    for spec in specs:
-        if spec.kind == "dimmer_light":
-            entities.append(
-                NikobusDimmerEntity(
-                    coordinator, spec.address, spec.channel, 
+        for spec in specs:
+            if spec.kind == "dimmer_light":
+                yield NikobusDimmerEntity(
+                    coordinator, spec.address, spec.channel,
                     spec.channel_description, spec.module_desc, spec.module_model
-                )
-            )
-        elif spec.kind == "relay_switch":
-            entities.append(
-                NikobusRelayEntity(
-                    coordinator, spec.address, spec.channel, 
+                ), spec
+            elif spec.kind == "relay_switch":
+                yield NikobusRelayEntity(
+                    coordinator, spec.address, spec.channel,
                     spec.channel_description, spec.module_desc, spec.module_model
-                )
-            )
-        elif spec.kind == "cover_binary":
-            entities.append(
-                NikobusCoverLightEntity(
-                    coordinator, spec.address, spec.channel, 
+                ), spec
+            elif spec.kind == "cover_binary":
+                yield NikobusCoverLightEntity(
+                    coordinator, spec.address, spec.channel,
                     spec.channel_description, spec.module_desc, spec.module_model
-                )
-            )
+                ), spec
 
-    async_add_entities(entities)
+    entities = PlatformEntities(_build, async_add_entities)
+    entities.async_add_initial()
+    coordinator.register_platform_entities("light", entities)
 
 
 class NikobusBaseLight(NikobusEntity, LightEntity, RestoreEntity):
@@ -118,6 +120,14 @@ class NikobusBaseLight(NikobusEntity, LightEntity, RestoreEntity):
         """Diff on the resolved on/off so an unchanged poll skips the write."""
         return self.is_on
 
+    def _update_signal(self) -> str:
+        """Wake on this channel's changes only."""
+        return channel_signal(self._address, self._channel)
+
+    def _state_group(self) -> int | None:
+        """The channel's byte lives in group 1 (channels 1-6) or 2 (7-12)."""
+        return 1 if self._channel <= 6 else 2
+
     @callback
     def _handle_button_operation(self) -> None:
         """A press impacted this module — drop optimistic state so the
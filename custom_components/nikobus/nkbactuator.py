@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import itertools
 import logging
 import time
 import uuid
@@ -13,7 +15,7 @@ from typing import TYPE_CHECKING, Any
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.dispatcher import async_dispatcher_send
-from nikobus_connect.discovery import find_module, find_operation_point
+from nikobus_connect.discovery import find_module
 
 from .const import (
     BURST_DETECT_GAP_COUNT,
@@ -24,6 +26,7 @@ from .const import (
     EVENT_BUTTON_OPERATION,
     EVENT_BUTTON_PRESSED,
     FRAME_CADENCE_S,
+    IMMEDIATE_REFRESH_DELAY,
     MAX_EXTENDED_RELEASE_MS,
     REFRESH_DELAY,
     RELEASE_THRESHOLD_MS,
@@ -31,6 +34,8 @@ from .const import (
     operation_signal,
     press_signal,
 )
+from .nkbbusscheduler import BusPriority
+from .nkbpredict import link_action, predict_byte
 
 if TYPE_CHECKING:
     from .coordinator import NikobusDataCoordinator
@@ -50,6 +55,8 @@ class PressState:
     than the wire could deliver them (gap < ``BURST_GAP_THRESHOLD_S``),
     we know a bridge stall just drained into us and extend the
     release threshold to absorb the next likely stall.
+    ``release_deadline`` is the deadline this press currently holds in
+    the actuator's release heap.
     """
     address: str
     press_start: float
@@ -57,7 +64,8 @@ class PressState:
     press_id: str
     module_address: str | None
     channel: int | None
-    release_task: asyncio.Task[None] | None = None
+    release_deadline: float | None = None
+    predicted_modules: frozenset[str] = frozenset()
     last_timer_threshold: int = 0
     frame_count: int = 1
     recent_gaps: deque[float] = field(
@@ -66,6 +74,118 @@ class PressState:
     current_release_threshold_ms: float = float(RELEASE_THRESHOLD_MS)
 
 
+@dataclass(frozen=True)
+class PressRoute:
+    """Precomputed routing for one bus address.
+
+    ``module_address`` / ``channel`` are the op-point's primary link
+    (carried on every press event); ``impacted`` lists each
+    ``(module_address, group, is_dimmer)`` the press refreshes, with
+    channels 1-6 in group ``"1"`` and 7-12 in group ``"2"``.
+    ``actions`` holds the ``(module_address, channel, action)`` links
+    whose effect ``nkbpredict`` can compute; ``predictable`` names the
+    modules every link of which is among them.
+    """
+
+    module_address: str | None
+    channel: int | None
+    impacted: tuple[tuple[str, str, bool], ...]
+    actions: tuple[tuple[str, int, str], ...] = ()
+    predictable: frozenset[str] = frozenset()
+
+
+def build_press_routes(
+    button_data: dict[str, Any], module_data: dict[str, Any]
+) -> dict[str, PressRoute]:
+    """Compile ``bus_address -> PressRoute`` from the button/module stores.
+
+    Walks the stores in the same order as ``find_operation_point``, so
+    an address claimed by two op-points routes to the first one, as the
+    scan did.
+    """
+    routes: dict[str, PressRoute] = {}
+    buttons = (button_data or {}).get("nikobus_button")
+    if not isinstance(buttons, dict):
+        return routes
+    for button in buttons.values():
+        if not isinstance(button, dict):
+            continue
+        op_points = button.get("operation_points")
+        if not isinstance(op_points, dict):
+            continue
+        for op_point in op_points.values():
+            if not isinstance(op_point, dict):
+                continue
+            bus_address = op_point.get("bus_address")
+            if not isinstance(bus_address, str) or not bus_address.strip():
+                continue
+            key = bus_address.strip().upper()
+            if key not in routes:
+                routes[key] = _compile_route(op_point, module_data)
+    return routes
+
+
+def _compile_route(op_point: dict[str, Any], module_data: dict[str, Any]) -> PressRoute:
+    primary: tuple[str | None, int | None] | None = None
+    impacted: dict[tuple[str, str], bool] = {}
+    actions: dict[tuple[str, int], str] = {}
+    unpredictable: set[str] = set()
+    for link in op_point.get("linked_modules") or []:
+        if not isinstance(link, dict):
+            continue
+        module_address = (link.get("module_address") or "").upper()
+        if not module_address:
+            continue
+        outputs = link.get("outputs")
+        if primary is None:
+            channel: int | None = None
+            if isinstance(outputs, list) and outputs and isinstance(outputs[0], dict):
+                ch_val = outputs[0].get("channel")
+                if isinstance(ch_val, int):
+                    channel = ch_val
+            primary = (module_address, channel)
+        hit = find_module(module_data, module_address)
+        module_type = hit[1].get("module_type") if hit is not None else None
+        is_dimmer = module_type == "dimmer_module"
+        for out in outputs or []:
+            if not isinstance(out, dict):
+                continue
+            channel = out.get("channel")
+            if not isinstance(channel, int):
+                continue
+            group = "1" if channel <= 6 else "2"
+            impacted.setdefault((module_address, group), is_dimmer)
+            action = link_action(module_type, out.get("mode"))
+            if action is None:
+                unpredictable.add(module_address)
+            else:
+                actions.setdefault((module_address, channel), action)
+    module_address, channel = primary or (None, None)
+    return PressRoute(
+        module_address=module_address,
+        channel=channel,
+        impacted=tuple((addr, group, dimmer) for (addr, group), dimmer in impacted.items()),
+        actions=tuple((addr, ch, action) for (addr, ch), action in actions.items()),
+        predictable=frozenset(addr for addr, _ch in actions) - unpredictable,
+    )
+
+
+@dataclass
+class _ModuleRefresh:
+    """Post-press reads pending for one module, merged across presses.
+
+    ``immediate_at`` is when the quick read runs (``None`` once done or
+    for dimmer-only plans); ``settle_at`` is the latest settle deadline
+    of the presses merged so far.
+    """
+
+    settle_at: float
+    immediate_at: float | None = None
+    groups: set[str] = field(default_factory=set)
+    buttons: set[str] = field(default_factory=set)
+    press_id: str = ""
+
+
 class NikobusActuator:
     """Handles button press events and triggers targeted module refreshes."""
 
@@ -79,32 +199,54 @@ class NikobusActuator:
         """Initialize the Nikobus actuator.
 
         ``module_data`` is the live caller-owned dict wrapped by the Store
-        (``{"nikobus_module": {addr: entry}}``). We hold a reference rather
-        than a copy so ``on_module_save`` mutations are visible immediately.
+        (``{"nikobus_module": {addr: entry}}``). We hold references rather
+        than copies; presses route through a table compiled from both,
+        which the coordinator rebuilds via ``rebuild_routes`` whenever
+        either store changes.
         """
         self._hass = hass
         self._coordinator = coordinator
         self._dict_button_data = dict_button_data
         self._module_data = module_data
         self._press_states: dict[str, PressState] = {}
+        # Keyed by module address: one merged refresh plan per module.
         self._module_refresh_tasks: dict[str, asyncio.Task[None]] = {}
+        self._module_refreshes: dict[str, _ModuleRefresh] = {}
+        self._refresh_reads_requested = 0
+        self._refresh_reads_issued = 0
+        self._predicted_presses = 0
+        # Release detection: one heap of (deadline, seq, address, press_id)
+        # and one loop timer armed for its earliest entry.
+        self._release_heap: list[tuple[float, int, str, str]] = []
+        self._release_seq = itertools.count()
+        self._release_timer: asyncio.TimerHandle | None = None
+        self._release_timer_at: float | None = None
+        self._routes: dict[str, PressRoute] = {}
+        self.rebuild_routes()
+
+    def rebuild_routes(self) -> None:
+        """Recompile the press-routing table from the button/module stores."""
+        self._routes = build_press_routes(self._dict_button_data, self._module_data)
 
     def stop(self) -> None:
-        """Cancel all in-flight press-release and module-refresh tasks.
+        """Cancel the release timer and all in-flight module-refresh tasks.
 
         Called from ``NikobusDataCoordinator.stop()`` so a config-entry
         unload/reload doesn't leave a button-press handler running against
         a torn-down command handler / connection. Tasks self-terminate in
         a few seconds anyway, but cancelling makes teardown deterministic.
         """
-        for state in self._press_states.values():
-            if state.release_task and not state.release_task.done():
-                state.release_task.cancel()
+        if self._release_timer is not None:
+            self._release_timer.cancel()
+        self._release_timer = None
+        self._release_timer_at = None
+        self._release_heap.clear()
         self._press_states.clear()
         for task in self._module_refresh_tasks.values():
             if not task.done():
                 task.cancel()
         self._module_refresh_tasks.clear()
+        self._module_refreshes.clear()
 
     async def handle_button_press(self, address: str) -> None:
         """Handle incoming button frames with frame-count duration tracking.
@@ -125,9 +267,12 @@ class NikobusActuator:
             state.recent_gaps.append(gap)
             self._update_release_threshold(state)
             self._maybe_fire_frame_count_timers(state)
+            self._schedule_release(state)
             return
 
-        module_address, channel = self._derive_button_context(normalized_address)
+        route = self._routes.get(normalized_address)
+        module_address = route.module_address if route else None
+        channel = route.channel if route else None
         press_id = f"{normalized_address}-{current_time:.3f}-{uuid.uuid4().hex[:8]}"
 
         state = PressState(
@@ -139,12 +284,14 @@ class NikobusActuator:
             channel=channel,
         )
         self._press_states[normalized_address] = state
+        if route is not None and route.actions:
+            state.predicted_modules = await self._apply_prediction(route, press_id)
 
-        # Start background task for release detection. Timer events
-        # are now fired synchronously inside handle_button_press as
-        # frame_count crosses each threshold (see
-        # _maybe_fire_frame_count_timers) — no async sleeps needed.
-        state.release_task = self._hass.async_create_task(self._wait_for_release(state))
+        # Arm release detection. Timer events are fired synchronously
+        # inside handle_button_press as frame_count crosses each
+        # threshold (see _maybe_fire_frame_count_timers) — no async
+        # sleeps needed.
+        self._schedule_release(state)
 
         # Fire immediate press event for Binary Sensors
         self._fire_event(EVENT_BUTTON_PRESSED, state, state_value="pressed", duration=None)
@@ -156,6 +303,7 @@ class NikobusActuator:
             "module_address": state.module_address,
             "channel": state.channel,
             "bucket": 0,
+            "predicted_modules": state.predicted_modules,
         }
         self._hass.async_create_task(self.button_discovery(state.address, press_context=press_context))
 
@@ -213,28 +361,73 @@ class NikobusActuator:
             # real release isn't held up by stale burst state.
             state.current_release_threshold_ms = float(RELEASE_THRESHOLD_MS)
 
-    async def _wait_for_release(self, state: PressState) -> None:
-        """Monitor for the absence of button frames to detect a release.
+    @staticmethod
+    def _release_due(state: PressState) -> float:
+        return state.last_press_time + state.current_release_threshold_ms / 1000
+
+    def _schedule_release(self, state: PressState) -> None:
+        """Make sure the release heap holds a deadline for ``state``.
+
+        A later frame only moves the deadline out, so the entry already
+        queued stays put and is re-checked when it fires; a new entry is
+        pushed only when the deadline moves in (the release threshold
+        relaxed back to baseline).
+        """
+        deadline = self._release_due(state)
+        if state.release_deadline is not None and state.release_deadline <= deadline:
+            return
+        state.release_deadline = deadline
+        heapq.heappush(
+            self._release_heap,
+            (deadline, next(self._release_seq), state.address, state.press_id),
+        )
+        self._arm_release_timer()
+
+    def _arm_release_timer(self) -> None:
+        """Point the single loop timer at the earliest release deadline."""
+        if not self._release_heap:
+            return
+        deadline = self._release_heap[0][0]
+        if self._release_timer is not None:
+            if self._release_timer_at is not None and self._release_timer_at <= deadline:
+                return
+            self._release_timer.cancel()
+        self._release_timer_at = deadline
+        self._release_timer = asyncio.get_running_loop().call_later(
+            max(0.0, deadline - time.monotonic()), self._on_release_timer
+        )
+
+    def _on_release_timer(self) -> None:
+        """Release every press whose silence has reached its threshold.
 
         Uses the per-press adaptive release threshold so a burst-flush
         followed by silence isn't misclassified as a release. Press
         duration is computed from frame_count (wire-time anchor)
         rather than wall-clock — see ``PressState`` docstring.
         """
-        try:
-            while True:
-                await asyncio.sleep(0.05)
-                active_state = self._press_states.get(state.address)
-                if not active_state or active_state.press_id != state.press_id:
-                    return
-
-                silence_ms = (time.monotonic() - active_state.last_press_time) * 1000
-                if silence_ms >= active_state.current_release_threshold_ms:
-                    duration = active_state.frame_count * FRAME_CADENCE_S
-                    await self._handle_release(active_state, duration)
-                    return
-        except asyncio.CancelledError:
-            pass
+        self._release_timer = None
+        self._release_timer_at = None
+        now = time.monotonic()
+        while self._release_heap and self._release_heap[0][0] <= now:
+            deadline, _seq, address, press_id = heapq.heappop(self._release_heap)
+            state = self._press_states.get(address)
+            if (
+                state is None
+                or state.press_id != press_id
+                or state.release_deadline != deadline
+            ):
+                continue  # released already, or superseded by an earlier entry
+            state.release_deadline = None
+            if self._release_due(state) > now:
+                # Frames kept arriving; wait out the silence from the last one.
+                self._schedule_release(state)
+                continue
+            # Hand the address to the next press before the release is
+            # processed, so a frame arriving meanwhile starts a new one.
+            self._press_states.pop(address, None)
+            duration = state.frame_count * FRAME_CADENCE_S
+            self._hass.async_create_task(self._handle_release(state, duration))
+        self._arm_release_timer()
 
     async def _handle_release(self, state: PressState, press_duration: float) -> None:
         """Cleanup and process module updates upon button release."""
@@ -256,56 +449,33 @@ class NikobusActuator:
             "module_address": state.module_address,
             "channel": state.channel,
             "bucket": bucket,
+            "predicted_modules": state.predicted_modules,
         }
 
         # Trigger module state synchronization
         self._hass.async_create_task(self.button_discovery(state.address, press_context=press_context))
-        self._press_states.pop(state.address, None)
+        if self._press_states.get(state.address) is state:
+            self._press_states.pop(state.address, None)
 
     async def button_discovery(self, address: str, press_context: dict[str, Any] | None = None) -> None:
         """Identify impacted modules and trigger targeted refreshes."""
-        hit = find_operation_point(self._dict_button_data, address)
-        if hit is None:
+        route = self._routes.get(address.upper())
+        if route is None:
             _LOGGER.info("Press from unknown button %s — run discovery to populate it", address)
             return
-        _physical_addr, _key_label, op_point = hit
-        await self.process_button_modules(op_point, address, press_context)
-
-    def _derive_impacted_modules(self, op_point: dict[str, Any]) -> list[tuple[str, str]]:
-        """Return the unique (module_address, group) pairs this op-point affects.
-
-        Derived from ``linked_modules`` — channels 1-6 live in feedback group 1,
-        7-12 in group 2.
-        """
-        seen: set[tuple[str, str]] = set()
-        for link in op_point.get("linked_modules") or []:
-            if not isinstance(link, dict):
-                continue
-            module_address = (link.get("module_address") or "").upper()
-            if not module_address:
-                continue
-            for out in link.get("outputs") or []:
-                if not isinstance(out, dict):
-                    continue
-                channel = out.get("channel")
-                if not isinstance(channel, int):
-                    continue
-                group = "1" if channel <= 6 else "2"
-                seen.add((module_address, group))
-        return list(seen)
+        await self.process_button_modules(route, address, press_context)
 
-    async def process_button_modules(self, op_point: dict[str, Any], button_address: str, press_context: dict[str, Any] | None) -> None:
+    async def process_button_modules(self, route: PressRoute, button_address: str, press_context: dict[str, Any] | None) -> None:
         """Refresh states for specific modules impacted by this op-point."""
         press_id = (press_context or {}).get("press_id") or f"{button_address}-{uuid.uuid4().hex[:8]}"
 
-        impacted = self._derive_impacted_modules(op_point)
+        impacted = route.impacted
+        predicted = (press_context or {}).get("predicted_modules") or frozenset()
         _LOGGER.debug("[%s] Button %s impacts %d module(s)", press_id, button_address, len(impacted))
 
-        for addr, group in impacted:
+        for addr, group, is_dimmer in impacted:
 
-            # Determine if this specific module is a dimmer BEFORE debouncing.
-            hit = find_module(self._module_data, addr)
-            is_dimmer = hit is not None and hit[1].get("module_type") == "dimmer_module"
+            # Dimmers are only refreshed on release (decided BEFORE planning).
             requires_long_press = is_dimmer
             is_initial_press = press_context is not None and press_context.get("duration_s") == 0.0
 
@@ -330,73 +500,155 @@ class NikobusActuator:
             )
 
             # ==========================================
-            # 2. Strict Module Debouncer (Prevents UI Jumps)
+            # 2. Merge into the module's pending refresh (UI Update Only)
             # ==========================================
-            cache_key = f"{addr}_{group}"
-            if cache_key in self._module_refresh_tasks:
-                _LOGGER.debug("[%s] Cancelling pending refresh for module %s group %s", press_id, addr, group)
-                self._module_refresh_tasks[cache_key].cancel()
+            self._plan_refresh(
+                addr, group, requires_long_press, button_address.upper(), press_id,
+                predicted=addr in predicted,
+            )
 
-            # ==========================================
-            # 3. Delayed State Fetch Task (UI Update Only)
-            # ==========================================
-            async def _refresh_task(
-                m_addr: str = addr,
-                m_group: str = group,
-                m_press_id: str = press_id,
-                m_requires_long_press: bool = requires_long_press,
-            ) -> None:
-                try:
-                    # STEP 1: Immediate UI Update (Skip for dimmers)
-                    if not m_requires_long_press:
-                        _LOGGER.debug("[%s] Immediate refresh of module %s group %s", m_press_id, m_addr, m_group)
-                        await asyncio.sleep(0.3)
-
-                        # Skip while the button is still held — a read now
-                        # would collide on the bus; defer to the release.
-                        if button_address.upper() in self._press_states:
-                            _LOGGER.debug("[%s] Button still held — deferring refresh to release", m_press_id)
-                            return
-
-                        try:
-                            new_state = await self._coordinator.nikobus_command.get_output_state(m_addr, m_group)
-                            if new_state:
-                                _LOGGER.debug("[%s] Module %s read %s on immediate refresh", m_press_id, m_addr, new_state)
-                                self._coordinator.set_bytearray_group_state(m_addr, m_group, new_state)
-                                await self._coordinator.async_event_handler("nikobus_refreshed", {"impacted_module_address": m_addr})
-                        except asyncio.CancelledError:
-                            raise
-                        except Exception as err:
-                            _LOGGER.debug("[%s] Immediate refresh of module %s failed: %s", m_press_id, m_addr, err)
-
-                    # Read again once the outputs have settled.
-                    delay = DIMMER_DELAY if m_requires_long_press else max(0, REFRESH_DELAY - 0.3)
-                    _LOGGER.debug("[%s] Waiting %.1fs for module %s to settle", m_press_id, delay, m_addr)
-
-                    await asyncio.sleep(delay)
-
-                    _LOGGER.debug("[%s] Reading settled state of module %s group %s", m_press_id, m_addr, m_group)
-                    new_state = await self._coordinator.nikobus_command.get_output_state(m_addr, m_group)
-
-                    if new_state:
-                        _LOGGER.debug("[%s] Module %s settled at %s", m_press_id, m_addr, new_state)
-                        self._coordinator.set_bytearray_group_state(m_addr, m_group, new_state)
-                        await self._coordinator.async_event_handler("nikobus_refreshed", {"impacted_module_address": m_addr})
-                    else:
-                        _LOGGER.warning("[%s] Module %s returned an empty settled state", m_press_id, m_addr)
-
-                except asyncio.CancelledError:
-                    _LOGGER.debug("[%s] Refresh of module %s cancelled by a newer press", m_press_id, m_addr)
-                    return
-                except Exception as err:
-                    _LOGGER.error("[%s] Failed to refresh module %s group %s: %s", m_press_id, m_addr, m_group, err)
-                finally:
-                    # Clean up the task reference when done
-                    if self._module_refresh_tasks.get(cache_key) == asyncio.current_task():
-                        self._module_refresh_tasks.pop(cache_key, None)
-
-            # Schedule the newly requested refresh
-            self._module_refresh_tasks[cache_key] = self._hass.async_create_task(_refresh_task())
+    async def _apply_prediction(self, route: PressRoute, press_id: str) -> frozenset[str]:
+        """Write the bytes this press is expected to produce; return the
+        modules whose every link was predicted.
+
+        The values are provisional: the settled post-press read still
+        goes out and overwrites them with what the module reports.
+        """
+        unpredicted: set[str] = set()
+        changed: set[str] = set()
+        for addr, channel, action in route.actions:
+            current = self._coordinator.get_bytearray_state(addr, channel)
+            value = predict_byte(action, current)
+            if value is None:
+                unpredicted.add(addr)
+                continue
+            if value != current:
+                self._coordinator.set_bytearray_state(addr, channel, value)
+                changed.add(addr)
+        if changed:
+            self._predicted_presses += 1
+            _LOGGER.debug("[%s] Predicted new state for module(s) %s", press_id, sorted(changed))
+        for addr in changed:
+            await self._coordinator.async_event_handler("nikobus_refreshed", {"impacted_module_address": addr})
+        return route.predictable - unpredicted
+
+    def _plan_refresh(
+        self,
+        addr: str,
+        group: str,
+        requires_long_press: bool,
+        button_address: str,
+        press_id: str,
+        *,
+        predicted: bool = False,
+    ) -> None:
+        """Merge a group read into the module's pending post-press refresh.
+
+        Every press that touches a module folds into one plan: the groups
+        are unioned and the settle read moves out to the latest deadline,
+        so two buttons (or both groups of one button) cost one immediate
+        read pass and one settled read pass instead of one of each per
+        ``(module, group)``. Dimmers, and modules whose new state was
+        ``predicted`` from the links, skip the immediate read.
+        """
+        now = time.monotonic()
+        delay = DIMMER_DELAY if requires_long_press else REFRESH_DELAY
+        # What a per-(module, group) refresh would have read.
+        self._refresh_reads_requested += 1 if requires_long_press else 2
+
+        plan = self._module_refreshes.get(addr)
+        if plan is None:
+            plan = _ModuleRefresh(settle_at=now + delay)
+            self._module_refreshes[addr] = plan
+            self._module_refresh_tasks[addr] = self._hass.async_create_task(
+                self._run_module_refresh(addr, plan)
+            )
+        else:
+            _LOGGER.debug("[%s] Merging module %s group %s into pending refresh", press_id, addr, group)
+        plan.groups.add(group)
+        plan.buttons.add(button_address)
+        plan.press_id = press_id
+        plan.settle_at = max(plan.settle_at, now + delay)
+        # A prediction is verified by the settled read alone.
+        if not requires_long_press and not predicted:
+            plan.immediate_at = max(plan.immediate_at or 0.0, now + IMMEDIATE_REFRESH_DELAY)
+
+    async def _run_module_refresh(self, addr: str, plan: _ModuleRefresh) -> None:
+        """Carry out a module's merged refresh plan."""
+        try:
+            while True:
+                now = time.monotonic()
+                if plan.immediate_at is not None and plan.immediate_at <= now:
+                    plan.immediate_at = None
+                    # Skip while a button is still held — a read now
+                    # would collide on the bus; the release re-plans.
+                    if any(b in self._press_states for b in plan.buttons):
+                        _LOGGER.debug("[%s] Button still held — deferring refresh of module %s to release", plan.press_id, addr)
+                        continue
+                    _LOGGER.debug("[%s] Immediate refresh of module %s groups %s", plan.press_id, addr, sorted(plan.groups))
+                    try:
+                        await self._read_module_groups(addr, plan.press_id, sorted(plan.groups))
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as err:
+                        _LOGGER.debug("[%s] Immediate refresh of module %s failed: %s", plan.press_id, addr, err)
+                    continue
+                due = plan.settle_at if plan.immediate_at is None else min(plan.immediate_at, plan.settle_at)
+                if due > now:
+                    # Deadlines may move out while sleeping; re-check on wake.
+                    await asyncio.sleep(due - now)
+                    continue
+                if any(b in self._press_states for b in plan.buttons):
+                    plan.settle_at = now + REFRESH_DELAY
+                    continue
+                break
+
+            # Presses from here on start a fresh plan.
+            if self._module_refreshes.get(addr) is plan:
+                self._module_refreshes.pop(addr, None)
+            groups = sorted(plan.groups)
+            _LOGGER.debug("[%s] Reading settled state of module %s groups %s", plan.press_id, addr, groups)
+            await self._read_module_groups(addr, plan.press_id, groups, settled=True)
+
+        except asyncio.CancelledError:
+            _LOGGER.debug("[%s] Refresh of module %s cancelled", plan.press_id, addr)
+            return
+        except Exception as err:
+            _LOGGER.error("[%s] Failed to refresh module %s: %s", plan.press_id, addr, err)
+        finally:
+            if self._module_refreshes.get(addr) is plan:
+                self._module_refreshes.pop(addr, None)
+            # Clean up the task reference when done
+            if self._module_refresh_tasks.get(addr) == asyncio.current_task():
+                self._module_refresh_tasks.pop(addr, None)
+
+    async def _read_module_groups(
+        self, addr: str, press_id: str, groups: list[str], *, settled: bool = False
+    ) -> None:
+        """Read ``groups`` of a module back to back in one bus slot."""
+        changed = False
+        async with self._coordinator.bus_scheduler.slot(BusPriority.PRESS_REFRESH):
+            for group in groups:
+                self._refresh_reads_issued += 1
+                new_state = await self._coordinator.nikobus_command.get_output_state(addr, group)
+                if new_state:
+                    _LOGGER.debug("[%s] Module %s group %s read %s", press_id, addr, group, new_state)
+                    self._coordinator.set_bytearray_group_state(addr, group, new_state, confirmed=True)
+                    changed = True
+                elif settled:
+                    _LOGGER.warning("[%s] Module %s returned an empty settled state", press_id, addr)
+        if changed:
+            await self._coordinator.async_event_handler("nikobus_refreshed", {"impacted_module_address": addr})
+
+    @property
+    def refresh_stats(self) -> dict[str, int]:
+        """Post-press read counts for diagnostics."""
+        return {
+            "reads_requested": self._refresh_reads_requested,
+            "reads_issued": self._refresh_reads_issued,
+            "reads_saved": max(0, self._refresh_reads_requested - self._refresh_reads_issued),
+            "predicted_presses": self._predicted_presses,
+        }
 
     def _fire_event(self, event_type: str, state: PressState, **kwargs: Any) -> None:
         """Helper to fire standardized Nikobus events and log them."""
@@ -436,27 +688,6 @@ class NikobusActuator:
                     seen.add(addr)
                     async_dispatcher_send(self._hass, press_signal(addr), payload)
 
-    def _derive_button_context(self, address: str) -> tuple[str | None, int | None]:
-        """Determine the primary (module_address, channel) link from discovery."""
-        hit = find_operation_point(self._dict_button_data, address)
-        if hit is None:
-            return (None, None)
-        _physical_addr, _key_label, op_point = hit
-        for link in op_point.get("linked_modules") or []:
-            if not isinstance(link, dict):
-                continue
-            module_addr = link.get("module_address")
-            if not module_addr:
-                continue
-            channel: int | None = None
-            outputs = link.get("outputs")
-            if isinstance(outputs, list) and outputs:
-                ch_val = outputs[0].get("channel")
-                if isinstance(ch_val, int):
-                    channel = ch_val
-            return (module_addr.upper(), channel)
-        return (None, None)
-
     def _get_bucket(self, duration: float) -> int:
         """Map press duration to a discrete bucket (0-3)."""
         return min(int(duration), 3)
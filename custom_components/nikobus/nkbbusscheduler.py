@@ -0,0 +1,260 @@
+"""Priority admission for requests the integration puts on the Nikobus bus."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+import contextlib
+from dataclasses import dataclass
+from enum import IntEnum
+import time
+from typing import Any
+import weakref
+
+# Longest a channel write holds its slot waiting for its answer. An
+# answer that never comes (the connection dropped mid-exchange) must not
+# hold back less urgent classes for good.
+WRITE_HOLD_TIMEOUT = 5.0
+
+
+class BusPriority(IntEnum):
+    """Request classes, most urgent first."""
+
+    INTERACTIVE = 0
+    PRESS_REFRESH = 1
+    POLL = 2
+    BACKGROUND = 3
+
+
+@dataclass
+class _ClassStats:
+    """Queue-wait bookkeeping for one request class."""
+
+    requests: int = 0
+    delayed: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+
+class NikobusBusScheduler:
+    """Admit bus requests in priority order.
+
+    The library's command handler is a single FIFO: whatever was queued
+    first goes out first. This gate sits in front of it. A request takes
+    a slot of its class before it is handed to the handler and gives it
+    back once its exchange is done. ``INTERACTIVE`` requests are always
+    admitted at once; any other class waits while a request of a more
+    urgent class is in flight or waiting. Lower classes take one slot
+    per frame, so a poll sweep yields to a light tap between two reads
+    instead of after the whole sweep.
+
+    ``reset`` drops every slot when the connection is lost: exchanges in
+    flight then never finish, and the slots they hold would otherwise
+    block the less urgent classes for good.
+
+    Time spent waiting for a slot is recorded per class for diagnostics.
+    Pure asyncio — no HA or bus access; ``clock`` is injectable for tests.
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize the scheduler."""
+        self._clock = clock
+        # Moves on with every ``reset``; a slot taken before one is not
+        # given back after it.
+        self.generation = 0
+        self._in_flight: dict[BusPriority, int] = dict.fromkeys(BusPriority, 0)
+        self._waiters: dict[BusPriority, list[asyncio.Future[None]]] = {
+            p: [] for p in BusPriority
+        }
+        self._stats: dict[BusPriority, _ClassStats] = {
+            p: _ClassStats() for p in BusPriority
+        }
+
+    def _blocked(self, priority: BusPriority) -> bool:
+        if priority == BusPriority.INTERACTIVE:
+            return False
+        return any(
+            self._in_flight[p] or self._waiters[p]
+            for p in BusPriority
+            if p < priority
+        )
+
+    async def acquire(self, priority: BusPriority) -> None:
+        """Wait until a request of ``priority`` may go to the bus."""
+        stats = self._stats[priority]
+        stats.requests += 1
+        if not self._blocked(priority) and not self._waiters[priority]:
+            self._in_flight[priority] += 1
+            return
+        started = self._clock()
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters[priority].append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future in self._waiters[priority]:
+                self._waiters[priority].remove(future)
+            elif future.done() and not future.cancelled():
+                # Admitted in the same loop turn it was cancelled.
+                self.release(priority)
+            self._wake()
+            raise
+        waited = self._clock() - started
+        stats.delayed += 1
+        stats.total_wait += waited
+        stats.max_wait = max(stats.max_wait, waited)
+
+    def release(self, priority: BusPriority, *, generation: int | None = None) -> None:
+        """Give back a slot taken with ``acquire``.
+
+        ``generation`` is the scheduler's generation when the slot was
+        taken; a slot ``reset`` already dropped is not released twice.
+        """
+        if generation is not None and generation != self.generation:
+            return
+        if self._in_flight[priority] > 0:
+            self._in_flight[priority] -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        """Admit waiters, most urgent class first."""
+        for priority in BusPriority:
+            waiters = self._waiters[priority]
+            while waiters and not self._blocked(priority):
+                future = waiters.pop(0)
+                if future.done():
+                    continue
+                self._in_flight[priority] += 1
+                future.set_result(None)
+            if waiters:
+                # Everything less urgent stays behind this class.
+                return
+
+    def reset(self) -> None:
+        """Drop every slot in flight and admit the waiters.
+
+        Called when the connection is lost: the exchanges holding slots
+        were cut off and will never give them back.
+        """
+        self.generation += 1
+        for priority in BusPriority:
+            self._in_flight[priority] = 0
+        self._wake()
+
+    @contextlib.asynccontextmanager
+    async def slot(self, priority: BusPriority) -> AsyncIterator[None]:
+        """Hold a slot of ``priority`` for the duration of the block."""
+        await self.acquire(priority)
+        generation = self.generation
+        try:
+            yield
+        finally:
+            self.release(priority, generation=generation)
+
+    def commands(self, handler: Any, priority: BusPriority) -> PrioritizedCommands:
+        """Return a view of ``handler`` whose requests take ``priority`` slots."""
+        return PrioritizedCommands(self, handler, priority)
+
+    def stats(self) -> dict[str, dict[str, float | int]]:
+        """Return per-class queue-wait figures for diagnostics."""
+        return {
+            priority.name.lower(): {
+                "requests": stats.requests,
+                "delayed": stats.delayed,
+                "mean_wait_ms": round(
+                    stats.total_wait / stats.delayed * 1000, 1
+                ) if stats.delayed else 0.0,
+                "max_wait_ms": round(stats.max_wait * 1000, 1),
+                "in_flight": self._in_flight[priority],
+                "waiting": len(self._waiters[priority]),
+            }
+            for priority, stats in self._stats.items()
+        }
+
+
+class PrioritizedCommands:
+    """Command-handler view that takes a scheduler slot per request.
+
+    Handed to ``NikobusAPI`` in place of the handler itself, so every
+    API call is admitted through the scheduler. Anything that is not a
+    bus request (buffer accessors, ``bus_lock``) passes straight through.
+
+    Channel writes for one module group that arrive while an earlier one
+    is still queued join its frame inside the handler and get its
+    future back; ``write_stats`` counts channel writes against the
+    distinct frames they became.
+    """
+
+    def __init__(
+        self, scheduler: NikobusBusScheduler, handler: Any, priority: BusPriority
+    ) -> None:
+        """Initialize the view."""
+        self._scheduler = scheduler
+        self._handler = handler
+        self._priority = priority
+        self._channel_writes = 0
+        self._frames = 0
+        self._seen_frames: weakref.WeakSet[asyncio.Future[Any]] = weakref.WeakSet()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._handler, name)
+
+    async def get_output_state(self, *args: Any, **kwargs: Any) -> str:
+        """Read a module group once a slot is free."""
+        async with self._scheduler.slot(self._priority):
+            return await self._handler.get_output_state(*args, **kwargs)
+
+    async def query(self, *args: Any, **kwargs: Any) -> Any:
+        """Run a query exchange once a slot is free."""
+        async with self._scheduler.slot(self._priority):
+            return await self._handler.query(*args, **kwargs)
+
+    async def queue_command(self, *args: Any, **kwargs: Any) -> None:
+        """Queue a raw command once a slot is free."""
+        async with self._scheduler.slot(self._priority):
+            await self._handler.queue_command(*args, **kwargs)
+
+    async def set_output_states(self, *args: Any, **kwargs: Any) -> None:
+        """Queue a whole-module write once a slot is free."""
+        async with self._scheduler.slot(self._priority):
+            await self._handler.set_output_states(*args, **kwargs)
+
+    async def set_output_state(self, *args: Any, **kwargs: Any) -> Any:
+        """Queue a channel write; the slot is held until it is answered,
+        or at most ``WRITE_HOLD_TIMEOUT`` seconds."""
+        scheduler = self._scheduler
+        await scheduler.acquire(self._priority)
+        generation = scheduler.generation
+        try:
+            future = await self._handler.set_output_state(*args, **kwargs)
+        except BaseException:
+            scheduler.release(self._priority, generation=generation)
+            raise
+        self._channel_writes += 1
+        if not isinstance(future, asyncio.Future):
+            self._frames += 1
+            scheduler.release(self._priority, generation=generation)
+            return future
+        if future not in self._seen_frames:
+            self._seen_frames.add(future)
+            self._frames += 1
+
+        def _release(*_: Any) -> None:
+            nonlocal generation
+            if generation is None:
+                return
+            scheduler.release(self._priority, generation=generation)
+            generation = None
+            expiry.cancel()
+
+        expiry = asyncio.get_running_loop().call_later(WRITE_HOLD_TIMEOUT, _release)
+        future.add_done_callback(_release)
+        return future
+
+    def write_stats(self) -> dict[str, int]:
+        """Return channel writes vs. the set-output frames they became."""
+        return {
+            "channel_writes": self._channel_writes,
+            "frames": self._frames,
+            "combined": self._channel_writes - self._frames,
+        }
@@ -0,0 +1,126 @@
+"""Measure a shutter channel's real travel times off the bus.
+
+A roller module drives its output for its own operation time and then
+drops the channel's status byte back to stopped. Timing that from the
+moment a move command reaches the bus gives the travel time the cover
+model should use, instead of a typed-in guess or the 30 s default
+padded with ``DEFAULT_COVER_MOVEMENT_BUFFER``.
+
+The status byte is only known when it is read, so each transition is
+bracketed by two reads — the last one still showing the old state and
+the first one showing the new — and placed at their midpoint.
+
+Pure asyncio — the caller supplies the bus command and the status read.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+import time
+
+_STOPPED = 0x00
+_OPENING = 0x01
+_CLOSING = 0x02
+
+
+class CalibrationError(Exception):
+    """A calibration run did not behave like a timed shutter move."""
+
+
+@dataclass(frozen=True)
+class TravelSample:
+    """One timed run: seconds from the command to moving and to stopped."""
+
+    direction: str
+    start_latency: float
+    stop_after: float
+
+
+@dataclass(frozen=True)
+class TravelFit:
+    """Travel times fitted from one or more runs per direction."""
+
+    time_up: float
+    time_down: float
+    start_latency: float
+    runs: int
+
+
+async def time_travel(
+    direction: str,
+    command: Callable[[Callable[[], Awaitable[None]]], Awaitable[None]],
+    read_byte: Callable[[], Awaitable[int | None]],
+    *,
+    sample_interval: float,
+    timeout: float,
+    clock: Callable[[], float] = time.monotonic,
+) -> TravelSample:
+    """Run one move and time it from the channel's status byte.
+
+    ``command`` starts the move and calls its argument once the command
+    is on the bus; ``read_byte`` reads the channel's status byte back
+    (``None`` when the read failed).
+    """
+    moving = _OPENING if direction == "opening" else _CLOSING
+    sent = asyncio.Event()
+    command_at = 0.0
+
+    async def _on_sent() -> None:
+        nonlocal command_at
+        command_at = clock()
+        sent.set()
+
+    await command(_on_sent)
+    try:
+        await asyncio.wait_for(sent.wait(), timeout)
+    except TimeoutError as err:
+        raise CalibrationError("move command was never sent") from err
+
+    last_before = command_at
+    started_at: float | None = None
+    while clock() - command_at < timeout:
+        value = await read_byte()
+        read_at = clock()
+        if value is None:
+            await asyncio.sleep(sample_interval)
+            continue
+        if started_at is None:
+            if value == moving:
+                started_at = (last_before + read_at) / 2
+            elif value != _STOPPED:
+                raise CalibrationError(f"channel reported {value:#04x} instead of moving")
+            elif read_at - command_at > sample_interval * 4:
+                raise CalibrationError("channel never started moving")
+        elif value == _STOPPED:
+            stopped_at = (last_before + read_at) / 2
+            return TravelSample(
+                direction,
+                start_latency=max(0.0, started_at - command_at),
+                stop_after=stopped_at - command_at,
+            )
+        elif value != moving:
+            raise CalibrationError(f"channel reported {value:#04x} while moving")
+        last_before = read_at
+        await asyncio.sleep(sample_interval)
+    raise CalibrationError(f"channel still {direction} after {timeout:.0f} s")
+
+
+def fit_travel_times(samples: list[TravelSample]) -> TravelFit:
+    """Average the runs of each direction into the cover model's times.
+
+    A travel time is counted from the command reaching the bus to the
+    module stopping, which is where the cover model starts and ends its
+    clock; the start latency inside it is reported separately.
+    """
+    ups = [s.stop_after for s in samples if s.direction == "opening"]
+    downs = [s.stop_after for s in samples if s.direction == "closing"]
+    if not ups or not downs:
+        raise CalibrationError("need at least one timed run in each direction")
+    return TravelFit(
+        time_up=sum(ups) / len(ups),
+        time_down=sum(downs) / len(downs),
+        start_latency=sum(s.start_latency for s in samples) / len(samples),
+        runs=len(samples),
+    )
@@ -0,0 +1,92 @@
+"""Dispatch the module writes of one scene as a single batch.
+
+A scene or grouped cover touching several modules used to queue one
+module's write, notify, then move on to the next. The library sends
+frames one at a time either way, so what a batch changes is what sits
+between them: every module write is handed to the command queue at
+once, without per-module bookkeeping in between, and the frames follow
+each other on the wire as closely as the bus allows.
+
+``limit`` bounds how many of the batch's modules may be queued and not
+yet answered. A large scene then never fills the command queue in one
+go, and a light tap issued meanwhile waits behind at most ``limit``
+frames rather than the whole scene.
+
+A write reports its frame being answered through the completion
+handler it is given; the spread between the first and last answer is
+the batch's actuation skew.
+
+Pure asyncio — the caller supplies the writes.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass
+import time
+
+# A write gets the completion handler to pass to the library and returns
+# whether it put anything on the bus.
+ModuleWrite = Callable[[Callable[[], Awaitable[None]]], Awaitable[bool]]
+
+
+@dataclass(frozen=True)
+class DispatchResult:
+    """How one batch of module writes landed."""
+
+    modules: int
+    sent: int
+    answered: int
+    skew: float | None
+
+
+async def dispatch_module_writes(
+    writes: Mapping[str, ModuleWrite],
+    *,
+    limit: int,
+    timeout: float,
+    clock: Callable[[], float] = time.monotonic,
+) -> DispatchResult:
+    """Run ``writes`` with at most ``limit`` awaiting their answer at once.
+
+    A write whose answer doesn't come within ``timeout`` frees its slot
+    and is left out of the skew. Every write runs even when one fails;
+    the first failure is raised once all are done.
+    """
+    slots = asyncio.Semaphore(max(1, limit))
+    answered_at: dict[str, float] = {}
+    sent = 0
+
+    async def _run(module_id: str, write: ModuleWrite) -> None:
+        nonlocal sent
+        async with slots:
+            answered = asyncio.Event()
+
+            async def _on_answered() -> None:
+                answered_at[module_id] = clock()
+                answered.set()
+
+            if not await write(_on_answered):
+                return
+            sent += 1
+            try:
+                await asyncio.wait_for(answered.wait(), timeout)
+            except TimeoutError:
+                pass
+
+    results = await asyncio.gather(
+        *(_run(module_id, write) for module_id, write in writes.items()),
+        return_exceptions=True,
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+    times = list(answered_at.values())
+    return DispatchResult(
+        modules=len(writes),
+        sent=sent,
+        answered=len(times),
+        skew=max(times) - min(times) if times else None,
+    )
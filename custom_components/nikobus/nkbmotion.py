@@ -0,0 +1,217 @@
+"""One shared scheduler for every moving time-based cover."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+import heapq
+import itertools
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+# A loop timer may run up to the clock resolution early; deadlines this
+# close count as due rather than re-arming a near-zero timer.
+_DUE_TOLERANCE = 0.001
+
+
+@dataclass
+class _Motion:
+    """One tracked cover: when it must stop and how to redraw it."""
+
+    deadline: float
+    on_deadline: Callable[[], None]
+    on_tick: Callable[[], None] | None
+    seq: int
+
+
+class NikobusMotionEngine:
+    """Drive all cover motion from one deadline timer and one UI tick.
+
+    A cover that starts moving registers the instant its travel model
+    says it must stop. The engine keeps those deadlines in a heap behind
+    a single loop timer aimed at the earliest one, so each stop fires at
+    its computed time rather than on the next poll of a per-cover loop.
+    While anything moves, one periodic tick redraws every moving cover
+    at ``ui_interval``; with nothing moving there is no timer at all.
+    The number of timers stays at two however many covers move.
+
+    Deadlines are in event-loop time and armed with ``loop.call_at``.
+    The engine also keeps a smoothed figure of how long a stop command
+    takes from its deadline to the bus (``record_stop_latency``); covers
+    read it back as ``stop_lead`` and issue a stop that much early.
+
+    Callbacks run in the event loop and must not block; a cover that has
+    bus work to do on its deadline spawns its own task. Pure asyncio —
+    no HA or bus access.
+    """
+
+    def __init__(
+        self,
+        ui_interval: float,
+        *,
+        max_stop_lead: float = 1.0,
+        latency_weight: float = 0.25,
+    ) -> None:
+        """Initialize the engine."""
+        self._ui_interval = ui_interval
+        self._max_stop_lead = max_stop_lead
+        self._latency_weight = latency_weight
+        self._stop_latency: float | None = None
+        self._latency_samples = 0
+        self._motions: dict[Hashable, _Motion] = {}
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._seq = itertools.count()
+        self._deadline_timer: asyncio.TimerHandle | None = None
+        self._deadline_timer_at: float | None = None
+        self._tick_timer: asyncio.TimerHandle | None = None
+        self._deadline_stops = 0
+        self._ticks = 0
+        self._peak_moving = 0
+
+    @property
+    def ui_interval(self) -> float:
+        """Seconds between two position redraws of a moving cover."""
+        return self._ui_interval
+
+    @property
+    def stop_lead(self) -> float:
+        """Seconds a timed stop should be issued ahead of its target."""
+        if self._stop_latency is None:
+            return 0.0
+        return min(self._max_stop_lead, self._stop_latency)
+
+    def record_stop_latency(self, seconds: float) -> None:
+        """Fold one measured deadline-to-bus stop latency into the average."""
+        seconds = max(0.0, seconds)
+        self._latency_samples += 1
+        if self._stop_latency is None:
+            self._stop_latency = seconds
+        else:
+            self._stop_latency += self._latency_weight * (seconds - self._stop_latency)
+
+    def track(
+        self,
+        key: Hashable,
+        delay: float,
+        on_deadline: Callable[[], None],
+        on_tick: Callable[[], None] | None = None,
+    ) -> float:
+        """Track ``key`` until ``delay`` seconds from now; return the deadline.
+
+        Tracking a key again replaces its earlier deadline.
+        """
+        deadline = asyncio.get_running_loop().time() + max(0.0, delay)
+        seq = next(self._seq)
+        self._motions[key] = _Motion(deadline, on_deadline, on_tick, seq)
+        self._peak_moving = max(self._peak_moving, len(self._motions))
+        heapq.heappush(self._heap, (deadline, seq, key))
+        self._arm_deadline_timer()
+        if on_tick is not None and self._tick_timer is None:
+            self._tick_timer = asyncio.get_running_loop().call_later(
+                self._ui_interval, self._on_tick
+            )
+        return deadline
+
+    def untrack(self, key: Hashable) -> None:
+        """Forget ``key``; its deadline callback will not run."""
+        # The heap entry stays behind and is dropped when it surfaces.
+        self._motions.pop(key, None)
+        if not self._motions:
+            self._cancel_timers()
+
+    def is_tracked(self, key: Hashable) -> bool:
+        """Return whether ``key`` is still waiting for its deadline."""
+        return key in self._motions
+
+    def stop(self) -> None:
+        """Drop every tracked motion and cancel the timers."""
+        self._motions.clear()
+        self._cancel_timers()
+
+    def _cancel_timers(self) -> None:
+        for timer in (self._deadline_timer, self._tick_timer):
+            if timer is not None:
+                timer.cancel()
+        self._deadline_timer = None
+        self._deadline_timer_at = None
+        self._tick_timer = None
+        self._heap.clear()
+
+    def _arm_deadline_timer(self) -> None:
+        """Point the single loop timer at the earliest live deadline."""
+        while self._heap:
+            _deadline, seq, key = self._heap[0]
+            motion = self._motions.get(key)
+            if motion is not None and motion.seq == seq:
+                break
+            heapq.heappop(self._heap)  # untracked or re-tracked since
+        if not self._heap:
+            return
+        deadline = self._heap[0][0]
+        if self._deadline_timer is not None:
+            if self._deadline_timer_at is not None and self._deadline_timer_at <= deadline:
+                return
+            self._deadline_timer.cancel()
+        self._deadline_timer_at = deadline
+        self._deadline_timer = asyncio.get_running_loop().call_at(
+            deadline, self._on_deadline_timer
+        )
+
+    def _on_deadline_timer(self) -> None:
+        """Hand every motion whose deadline has passed to its callback."""
+        self._deadline_timer = None
+        self._deadline_timer_at = None
+        now = asyncio.get_running_loop().time() + _DUE_TOLERANCE
+        while self._heap and self._heap[0][0] <= now:
+            _deadline, seq, key = heapq.heappop(self._heap)
+            motion = self._motions.get(key)
+            if motion is None or motion.seq != seq:
+                continue
+            del self._motions[key]
+            self._deadline_stops += 1
+            self._run(motion.on_deadline, key)
+        if not self._motions:
+            self._cancel_timers()
+            return
+        self._arm_deadline_timer()
+
+    def _on_tick(self) -> None:
+        """Redraw every moving cover, then re-arm while any still moves."""
+        self._tick_timer = None
+        self._ticks += 1
+        for key, motion in list(self._motions.items()):
+            if motion.on_tick is not None and self._motions.get(key) is motion:
+                self._run(motion.on_tick, key)
+        if self._tick_timer is None and any(
+            m.on_tick is not None for m in self._motions.values()
+        ):
+            self._tick_timer = asyncio.get_running_loop().call_later(
+                self._ui_interval, self._on_tick
+            )
+
+    @staticmethod
+    def _run(callback: Callable[[], None], key: Hashable) -> None:
+        # One failing cover must not stall every other cover's motion.
+        try:
+            callback()
+        except Exception:  # noqa: BLE001
+            _LOGGER.exception("Cover motion callback failed for %r", key)
+
+    def stats(self) -> dict[str, float | int]:
+        """Return motion figures for diagnostics."""
+        return {
+            "moving": len(self._motions),
+            "peak_moving": self._peak_moving,
+            "deadline_stops": self._deadline_stops,
+            "ui_ticks": self._ticks,
+            "ui_interval_s": self._ui_interval,
+            "stop_latency_ms": (
+                round(self._stop_latency * 1000, 1)
+                if self._stop_latency is not None
+                else None
+            ),
+            "stop_latency_samples": self._latency_samples,
+            "stop_lead_ms": round(self.stop_lead * 1000, 1),
+        }
@@ -0,0 +1,289 @@
+"""Adaptive per-(module, group) poll scheduler for Nikobus output modules."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Collection, Mapping
+from dataclasses import dataclass
+import time
+
+PollKey = tuple[str, int]
+
+
+@dataclass
+class GroupSchedule:
+    """Polling bookkeeping for one module group."""
+
+    interval: float
+    next_due: float = 0.0
+    last_confirmed: float | None = None
+    last_changed: float | None = None
+    last_polled: float | None = None
+    last_failed: float | None = None
+    reads: int = 0
+    changes: int = 0
+
+
+class NikobusPollScheduler:
+    """Decide which module groups a poll tick should read.
+
+    Every group starts at ``base_interval``. A read that finds changed
+    bytes halves the group's interval (down to ``min_interval``), a read
+    that finds the same bytes doubles it (up to ``max_interval``), so
+    volatile modules are polled more often and quiet ones back off
+    exponentially. A group never read yet is always due and is not
+    counted against the budget, so the first sweep and the sweep after
+    a reconnect still read everything.
+
+    The budget caps the reads of one tick at ``budget_share`` of the
+    tick's length in bus time, using the measured cost of a read. Due
+    groups that don't fit stay due and go first on the next tick, most
+    overdue first.
+
+    Presses, feedback frames and our own writes update a group between
+    polls; ``observe`` feeds those in so a busy group speeds up instead
+    of backing off when the next poll finds the bytes already current.
+    ``last_confirmed`` is the freshness ledger shared by the poll sweep
+    and the press refreshes: a due group whose bytes were read off the
+    bus less than ``freshness_window`` ago is skipped (and counted in
+    ``skipped_fresh_total``) instead of being read a second time.
+    If no read at all has gone out for ``keepalive_interval``, the
+    most overdue group is read anyway so the PC-Link never sits idle
+    long enough to fall asleep (issue #337). ``failure_streak`` counts
+    reads that failed since the last one that was answered, across
+    ticks, for blackout detection; ``streak_started`` is when the first
+    read of the current streak was sent. Only groups that have answered
+    before count: a module that is powered off or absent never answers,
+    and its reads failing says nothing about the bus. Such a group is
+    planned outside the budget only until its first failed read; after
+    that it is due on a backed-off interval like any other group.
+
+    ``prefer_stalest`` orders the groups not read yet by how old the
+    state restored for them at startup is, so the first sweep replaces
+    the least trustworthy snapshot first.
+
+    Pure bookkeeping — no HA or bus access; ``clock`` is injectable for
+    tests.
+    """
+
+    def __init__(
+        self,
+        base_interval: float,
+        *,
+        min_interval: float,
+        max_interval: float,
+        budget_share: float,
+        read_cost: float,
+        keepalive_interval: float | None = None,
+        freshness_window: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.min_interval = min_interval
+        self.max_interval = max(max_interval, min_interval)
+        self.base_interval = max(min_interval, min(base_interval, self.max_interval))
+        self.budget_share = budget_share
+        self.read_cost = read_cost
+        self.keepalive_interval = (
+            base_interval if keepalive_interval is None else keepalive_interval
+        )
+        self.freshness_window = freshness_window
+        self._clock = clock
+        self._groups: dict[PollKey, GroupSchedule] = {}
+        self._last_read: float | None = None
+        # Groups that have answered at least once, kept across ``reset``.
+        self._answered: set[PollKey] = set()
+        self._restored_at: dict[str, float] = {}
+        self.deferred_last_tick = 0
+        self.skipped_fresh_last_tick = 0
+        self.skipped_fresh_total = 0
+        self.failure_streak = 0
+        self.streak_started: float | None = None
+
+    def _entry(self, key: PollKey) -> GroupSchedule:
+        entry = self._groups.get(key)
+        if entry is None:
+            entry = GroupSchedule(interval=self.base_interval)
+            self._groups[key] = entry
+        return entry
+
+    def plan(self, candidates: Collection[PollKey], tick: float) -> list[PollKey]:
+        """Return the groups to read this tick, most overdue first."""
+        now = self._clock()
+        never_read: list[PollKey] = []
+        due: list[tuple[float, PollKey]] = []
+        fresh = 0
+        for key in candidates:
+            entry = self._groups.get(key)
+            if entry is None or (
+                entry.last_confirmed is None and entry.last_failed is None
+            ):
+                never_read.append(key)
+            elif entry.next_due > now:
+                continue
+            elif (
+                entry.last_confirmed is not None
+                and now - entry.last_confirmed < self.freshness_window
+            ):
+                # Read off the bus moments ago (press refresh, feedback):
+                # skip it and count from that read instead.
+                fresh += 1
+                entry.next_due = entry.last_confirmed + max(
+                    entry.interval, self.freshness_window
+                )
+            else:
+                due.append((entry.next_due, key))
+        self.skipped_fresh_last_tick = fresh
+        self.skipped_fresh_total += fresh
+        if self._restored_at:
+            never_read.sort(
+                key=lambda key: self._restored_at.get(key[0], float("-inf"))
+            )
+        due.sort()
+        budget = max(1, int(tick * self.budget_share / self.read_cost))
+        self.deferred_last_tick = max(0, len(due) - budget)
+        planned = never_read + [key for _due, key in due[:budget]]
+        if (
+            not planned
+            and self._last_read is not None
+            and now - self._last_read >= self.keepalive_interval
+        ):
+            keepalive = min(
+                (
+                    (self._groups[key].next_due, key)
+                    for key in candidates
+                    if key in self._groups
+                ),
+                default=None,
+            )
+            if keepalive is not None:
+                planned.append(keepalive[1])
+        return planned
+
+    def prefer_stalest(self, restored_at: Mapping[str, float]) -> None:
+        """Read the groups not read yet stalest-restored first.
+
+        ``restored_at`` maps an address to when the state restored for
+        it was last read off the bus; a module with nothing restored
+        counts as stalest of all. Only the order changes — every group
+        not read yet is still planned on the next tick.
+        """
+        self._restored_at = dict(restored_at)
+
+    def confirmed_at(self) -> dict[str, float]:
+        """Return when each module was last read off the bus, on the
+        scheduler's clock — the latest of its groups."""
+        confirmed: dict[str, float] = {}
+        for (address, _group), entry in self._groups.items():
+            if entry.last_confirmed is not None and entry.last_confirmed > confirmed.get(
+                address, float("-inf")
+            ):
+                confirmed[address] = entry.last_confirmed
+        return confirmed
+
+    def record(self, address: str, group: int, *, changed: bool) -> None:
+        """Record a successful read and reschedule the group."""
+        now = self._clock()
+        entry = self._entry((address, group))
+        entry.reads += 1
+        entry.last_confirmed = now
+        self._answered.add((address, group))
+        self._last_read = now
+        self.failure_streak = 0
+        self.streak_started = None
+        # Same bytes as the buffer, but ``observe`` saw them change since
+        # the previous poll: the group is busy, so hold its interval.
+        quiet = entry.last_changed is None or (
+            entry.last_polled is not None and entry.last_changed <= entry.last_polled
+        )
+        if changed:
+            entry.changes += 1
+            entry.last_changed = now
+            entry.interval = max(self.min_interval, entry.interval / 2)
+        elif quiet:
+            entry.interval = min(self.max_interval, entry.interval * 2)
+        entry.last_polled = now
+        entry.next_due = now + entry.interval
+
+    def record_failure(
+        self, address: str, group: int, *, sent: float | None = None
+    ) -> None:
+        """Record a failed read.
+
+        A group that has answered before stays due on the next tick and
+        the failure counts toward ``failure_streak``; ``sent`` is when
+        the failed read went out, and the first failure of a streak
+        stamps ``streak_started`` with it. A group that never answered
+        backs off instead, its interval doubling with each failure.
+        """
+        now = self._clock()
+        key = (address, group)
+        entry = self._entry(key)
+        entry.last_failed = now
+        self._last_read = now
+        if key not in self._answered:
+            entry.interval = min(self.max_interval, entry.interval * 2)
+            entry.next_due = now + entry.interval
+            return
+        entry.next_due = min(entry.next_due, now)
+        if self.failure_streak == 0:
+            self.streak_started = now if sent is None else sent
+        self.failure_streak += 1
+
+    def observe(
+        self, address: str, group: int, *, changed: bool, confirmed: bool
+    ) -> None:
+        """Record a group update that happened outside the poll sweep.
+
+        A change speeds the group up like a changed poll read.
+        ``confirmed`` means the bytes were read off the bus (press
+        refresh, feedback frame): the ledger marks the group fresh, so a
+        poll falling due within ``freshness_window`` skips it. An
+        unconfirmed change (our own write) keeps the next poll no later
+        than one shortened interval away, so the bus still gets to
+        confirm it.
+        """
+        now = self._clock()
+        entry = self._entry((address, group))
+        if changed:
+            entry.changes += 1
+            entry.last_changed = now
+            entry.interval = max(self.min_interval, entry.interval / 2)
+        if confirmed:
+            entry.last_confirmed = now
+            self._answered.add((address, group))
+            self._last_read = now
+            self.failure_streak = 0
+            self.streak_started = None
+        elif changed and entry.last_confirmed is not None:
+            entry.next_due = min(entry.next_due, now + entry.interval)
+
+    def observe_cycle(self, duration: float, reads: int) -> None:
+        """Fold a sweep's per-read bus time into the read-cost estimate."""
+        if reads <= 0 or duration <= 0:
+            return
+        self.read_cost = 0.8 * self.read_cost + 0.2 * (duration / reads)
+
+    def reset(self) -> None:
+        """Forget every group so the next tick reads them all."""
+        self._groups.clear()
+        self._restored_at.clear()
+        self._last_read = None
+        self.failure_streak = 0
+        self.streak_started = None
+
+    def stats(self) -> dict[str, float | int | None]:
+        """Return a summary for diagnostics."""
+        intervals = [entry.interval for entry in self._groups.values()]
+        return {
+            "tracked_groups": len(intervals),
+            "min_interval_s": min(intervals) if intervals else None,
+            "max_interval_s": max(intervals) if intervals else None,
+            "mean_interval_s": (
+                round(sum(intervals) / len(intervals), 1) if intervals else None
+            ),
+            "read_cost_s": round(self.read_cost, 3),
+            "deferred_last_tick": self.deferred_last_tick,
+            "freshness_window_s": self.freshness_window,
+            "skipped_fresh_last_tick": self.skipped_fresh_last_tick,
+            "skipped_fresh_total": self.skipped_fresh_total,
+        }
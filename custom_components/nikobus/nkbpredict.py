@@ -0,0 +1,71 @@
+"""Predict output bytes a wall-button press will produce.
+
+A button's decoded links (``linked_modules[*].outputs[*].mode``) say
+what each output does when the button is pressed. For the modes whose
+effect follows from the link alone, the new channel byte can be written
+to the state buffer the moment the press frame arrives, instead of
+waiting for the post-press bus read. The read still happens; it is what
+confirms (or corrects) the prediction.
+
+Only the immediate transition is predicted. A timed mode's later
+expiry (``M02 (On + Operating time)`` turning off after ``t1``) is left
+to the next poll. Modes whose outcome depends on state the bus does not
+report (pushbutton, impulse, light scenes, dimmer ramps, a stopped
+shutter's next direction) predict nothing.
+
+Pure — no HA or bus access.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from .nkbnames import _mode_code as mode_code
+
+_ON = 0xFF
+_OFF = 0x00
+_OPENING = 0x01
+_CLOSING = 0x02
+_STOPPED = 0x00
+
+# (module_type, mode code) -> action.
+_LINK_ACTIONS: dict[tuple[str, str], str] = {
+    ("switch_module", "M01"): "toggle",
+    ("switch_module", "M02"): "on",
+    ("switch_module", "M03"): "off",
+    ("roller_module", "M01"): "cycle",
+    ("roller_module", "M02"): "open",
+    ("roller_module", "M03"): "close",
+    ("roller_module", "M04"): "stop",
+    ("roller_module", "M06"): "open",
+    ("roller_module", "M07"): "close",
+}
+
+
+def link_action(module_type: Any, mode: Any) -> str | None:
+    """Return the predictable action of a link, or ``None``."""
+    code = mode_code(mode) if isinstance(mode, str) else None
+    if not code or not isinstance(module_type, str):
+        return None
+    return _LINK_ACTIONS.get((module_type, code))
+
+
+def predict_byte(action: str, current: int) -> int | None:
+    """Return the channel byte ``action`` leaves behind, or ``None``."""
+    if action == "toggle":
+        return _OFF if current else _ON
+    if action == "on":
+        return _ON
+    if action == "off":
+        return _OFF
+    if action == "open":
+        return _OPENING
+    if action == "close":
+        return _CLOSING
+    if action == "stop":
+        return _STOPPED
+    if action == "cycle":
+        # A moving shutter stops; a stopped one's direction alternates
+        # inside the module and cannot be told from here.
+        return _STOPPED if current in (_OPENING, _CLOSING) else None
+    return None
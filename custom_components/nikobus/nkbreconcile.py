@@ -3,14 +3,16 @@
 Stateless data-crunching extracted from ``coordinator.py``: member-set
 keys (used to match ``.nkb`` scene groups, classified CF entries and
 routing-graph op-points against each other), the ``controlled_by``
-index, and the registry-only-residue checks. None of these touch Home
-Assistant — they take the integration's button/module store dicts and
-return plain data — so they live here, away from the coordinator's HA
-lifecycle, and are unit-tested in isolation.
+index, the CF trigger index, the registry-only-residue checks and the
+entity-record diff behind in-place entity reconciliation. None of these
+touch Home Assistant — they take the integration's button/module store
+dicts and return plain data — so they live here, away from the
+coordinator's HA lifecycle, and are unit-tested in isolation.
 """
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from typing import Any
 
 from .const import INPUT_ONLY_BUTTON_TYPES
@@ -167,6 +169,43 @@ def build_controlled_by_index(
     return index
 
 
+def build_cf_trigger_index(cf_data: dict[str, Any] | None) -> dict[str, str]:
+    """Build a ``trigger_address_upper -> canonical CF key`` index.
+
+    A CF's own key wins over any ``triggered_by`` entry, and among
+    ``triggered_by`` entries the first CF in store order wins — the same
+    precedence a scan of the ``nikobus_cf`` store has.
+    """
+    index: dict[str, str] = {}
+    if not isinstance(cf_data, dict):
+        return index
+    for key, cf in cf_data.items():
+        if isinstance(cf, dict):
+            index[str(key).upper()] = key
+    for key, cf in cf_data.items():
+        if not isinstance(cf, dict):
+            continue
+        for addr in cf.get("triggered_by") or []:
+            index.setdefault(str(addr).upper(), key)
+    return index
+
+
+def diff_entity_records(
+    old: Mapping[str, Any], new: Mapping[str, Any]
+) -> tuple[list[str], list[str], list[str]]:
+    """Compare two ``{unique_id: source record}`` snapshots.
+
+    Returns ``(added, removed, changed)`` unique_ids: in ``new`` only, in
+    ``old`` only, and in both but built from a record that no longer
+    compares equal. A unique_id in none of the three lists is an entity
+    whose record is unchanged and which can keep running as it is.
+    """
+    added = [uid for uid in new if uid not in old]
+    removed = [uid for uid in old if uid not in new]
+    changed = [uid for uid in new if uid in old and old[uid] != new[uid]]
+    return added, removed, changed
+
+
 def classify_button_status(
     phys: dict[str, Any],
     remaining_modules: set[str],
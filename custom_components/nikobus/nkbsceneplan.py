@@ -0,0 +1,141 @@
+"""Compile a software scene into per-module activation plans.
+
+A scene in ``nikobus_scene_config.json`` is a flat list of
+``(module, channel, state)`` members. Resolving one means looking up the
+module's type and, for a shutter, its operation time in the module
+store — a store scan per member. None of that changes between two
+activations, only when the module store is saved, so a scene resolves
+its members once into a :class:`ScenePlan` and reuses it until the
+store's revision moves on.
+
+Each module's share of the plan is a byte mask and the value bytes
+under it; activating is a merge of those into the module's current
+state buffer.
+
+Pure — no HA or bus access.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+import logging
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_STOPPED = 0x00
+STATE_OPEN = 0x01
+STATE_CLOSE = 0x02
+STATE_ON = 0xFF
+STATE_OFF = 0x00
+
+_STATE_MAPPING = {
+    "switch_module": {"on": STATE_ON, "off": STATE_OFF, "true": STATE_ON, "false": STATE_OFF},
+    "roller_module": {"open": STATE_OPEN, "close": STATE_CLOSE, "stop": STATE_STOPPED}
+}
+
+_MODULE_BYTES = 12
+
+
+def state_to_byte(module_type: str | None, state: Any) -> int | None:
+    """Convert a friendly scene state to the channel's output byte."""
+    if module_type == "dimmer_module":
+        try:
+            return max(0, min(int(state), 255))
+        except (ValueError, TypeError):
+            return None
+
+    clean_state = str(state).lower()
+    return _STATE_MAPPING.get(module_type or "", {}).get(clean_state)
+
+
+@dataclass(frozen=True)
+class ModulePlan:
+    """What one scene writes to one module."""
+
+    module_id: str
+    mask: bytes
+    values: bytes
+    groups: tuple[int, ...]
+    roller_indexes: frozenset[int]
+
+    def merge(self, current: bytes | bytearray | None) -> bytearray:
+        """Return ``current`` with the scene's channels written over it."""
+        base = bytes(current or b"")[:_MODULE_BYTES].ljust(_MODULE_BYTES, b"\x00")
+        mask = int.from_bytes(self.mask, "big")
+        merged = (int.from_bytes(base, "big") & ~mask) | int.from_bytes(self.values, "big")
+        return bytearray(merged.to_bytes(_MODULE_BYTES, "big"))
+
+
+@dataclass(frozen=True)
+class ScenePlan:
+    """A scene resolved against one revision of the module store."""
+
+    revision: Any
+    modules: tuple[ModulePlan, ...]
+    stop_delay: float
+
+
+def compile_scene(
+    channels: Iterable[dict[str, Any]],
+    *,
+    revision: Any,
+    module_type: Callable[[str], str | None],
+    channel_count: Callable[[str], int],
+    operation_time: Callable[[str, int, str], float],
+    stop_buffer: float,
+) -> ScenePlan:
+    """Resolve a scene's members into per-module plans.
+
+    Members that name no module, carry a state the module type can't
+    take, or a channel outside the module buffer are dropped, as a live
+    activation always did. All rollers in the scene share one stop
+    deadline: the longest per-channel ``operation_time + stop_buffer``
+    across every module, which absorbs bus contention when several
+    modules are commanded back to back.
+    """
+    masks: dict[str, bytearray] = {}
+    values: dict[str, bytearray] = {}
+    rollers: dict[str, set[int]] = {}
+    stop_delay = 0.0
+
+    for channel_info in channels:
+        module_id = (channel_info.get("module_id") or "").upper()
+        chan_num = channel_info.get("channel")
+        if not module_id or chan_num is None:
+            continue
+
+        m_type = module_type(module_id)
+        byte_val = state_to_byte(m_type, channel_info.get("state"))
+        if byte_val is None:
+            continue
+        try:
+            idx = int(chan_num) - 1
+        except (ValueError, TypeError):
+            _LOGGER.warning("Scene channel number %r is not a valid integer — skipping", chan_num)
+            continue
+
+        if not 0 <= idx < _MODULE_BYTES:
+            continue
+        masks.setdefault(module_id, bytearray(_MODULE_BYTES))[idx] = 0xFF
+        values.setdefault(module_id, bytearray(_MODULE_BYTES))[idx] = byte_val
+
+        if m_type == "roller_module" and byte_val in (STATE_OPEN, STATE_CLOSE):
+            direction = "up" if byte_val == STATE_OPEN else "down"
+            op_time = operation_time(module_id, chan_num, direction)
+            if op_time > 0:
+                rollers.setdefault(module_id, set()).add(idx)
+                stop_delay = max(stop_delay, op_time + stop_buffer)
+
+    modules = tuple(
+        ModulePlan(
+            module_id=module_id,
+            mask=bytes(mask),
+            values=bytes(values[module_id]),
+            groups=(1, 2) if channel_count(module_id) > 6 else (1,),
+            roller_indexes=frozenset(rollers.get(module_id, ())),
+        )
+        for module_id, mask in masks.items()
+    )
+    return ScenePlan(revision=revision, modules=modules, stop_delay=stop_delay)
@@ -0,0 +1,109 @@
+"""Warm-start snapshot of module output states and cover positions.
+
+After a restart every module's state row starts zeroed, and until the
+first poll sweep reaches a module its entities show it all off — on a
+large bus, or in push mode where nothing polls at all, that can last a
+while. The coordinator therefore keeps a compact snapshot in
+``.storage/nikobus.state``, one entry per module::
+
+    {"<address>": {
+        "state": "<row as hex>",
+        "confirmed": <epoch s the bytes were last read off the bus>,
+        "positions": {"<channel>": [<cover position>, <epoch s>], ...},
+    }}
+
+and writes it back into the state table at connect time, so entities
+render the last known state straight away. The bus overrides it as soon
+as each module is read; ``confirmed`` lets the first sweep read the
+stalest modules first.
+
+Pure — no HA or bus access.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from .nkbstatetable import ModuleStateTable
+
+CoverKey = tuple[str, int]
+
+
+@dataclass
+class RestoredSnapshot:
+    """What a snapshot put back, for the scheduler and the covers."""
+
+    modules: int = 0
+    confirmed: dict[str, float] = field(default_factory=dict)
+    positions: dict[CoverKey, tuple[float, float]] = field(default_factory=dict)
+
+
+def take_snapshot(
+    states: ModuleStateTable,
+    *,
+    confirmed: Mapping[str, float],
+    positions: Mapping[CoverKey, tuple[float, float]],
+) -> dict[str, dict[str, Any]]:
+    """Return the snapshot of every row in ``states``.
+
+    ``confirmed`` maps an address to when its bytes were last read off
+    the bus; ``positions`` maps ``(address, channel)`` to a cover's
+    ``(position, epoch s)``. Both are epoch seconds.
+    """
+    snapshot: dict[str, dict[str, Any]] = {}
+    for address, row in states.items():
+        entry: dict[str, Any] = {"state": row.hex()}
+        if (at := confirmed.get(address)) is not None:
+            entry["confirmed"] = round(at, 1)
+        snapshot[address] = entry
+    for (address, channel), (position, at) in positions.items():
+        entry = snapshot.get(address)
+        if entry is not None:
+            entry.setdefault("positions", {})[str(channel)] = [
+                round(position, 1), round(at, 1)
+            ]
+    return snapshot
+
+
+def restore_snapshot(
+    states: ModuleStateTable, snapshot: Mapping[str, Any]
+) -> RestoredSnapshot:
+    """Write ``snapshot`` back into ``states``.
+
+    Only modules the table already holds are restored, and only when the
+    saved row has the row's length — a module since removed or replaced
+    by another type is left zeroed. Malformed entries are skipped. The
+    restored bytes are not reported as changes: nothing has happened on
+    the bus.
+    """
+    restored = RestoredSnapshot()
+    for address, entry in snapshot.items():
+        row = states.get(address)
+        if row is None or not isinstance(entry, Mapping):
+            continue
+        try:
+            data = bytes.fromhex(entry.get("state", ""))
+        except (TypeError, ValueError):
+            continue
+        if len(data) != len(row):
+            continue
+        states[address] = data
+        states.take_changes(address)
+        restored.modules += 1
+
+        confirmed = entry.get("confirmed")
+        if isinstance(confirmed, (int, float)):
+            restored.confirmed[address] = float(confirmed)
+        positions = entry.get("positions")
+        if not isinstance(positions, Mapping):
+            continue
+        for channel, saved in positions.items():
+            try:
+                position, at = (float(value) for value in saved)
+                key = (address, int(channel))
+            except (TypeError, ValueError):
+                continue
+            restored.positions[key] = (max(0.0, min(100.0, position)), at)
+    return restored
@@ -0,0 +1,247 @@
+"""Module output states packed into one preallocated buffer.
+
+Every output module's state is twelve bytes — two groups of six output
+bytes. Keeping each in its own ``bytearray`` meant a fresh allocation
+for every module the bus ever reported, and every comparison of a
+group against a frame sliced a new copy out of it. The table instead
+reserves one fixed slot per module in a single ``bytearray``, indexed
+by address, and reads and writes groups through ``memoryview`` windows
+onto that buffer.
+
+It is a mapping of address to :class:`ModuleStateRow`, which behaves
+like the ``bytearray`` the library's command handler expects, so the
+coordinator and the handler share the same table as their state
+buffer. Whichever path writes a group — a frame through
+:meth:`ModuleStateTable.write_group` or the handler assigning into a
+row — a write that actually changes its bytes sets the changed
+channels in the module's change mask and moves the group's generation
+forward. An entity that remembers the generation it last rendered can
+tell an unchanged group with one integer compare, and the mask tells
+which channels' entities need waking at all.
+
+Pure — no HA or bus access.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, MutableMapping
+from typing import Any
+
+ROW_BYTES = 12
+GROUP_BYTES = 6
+
+_DEFAULT_CAPACITY = 16
+
+
+def _changed_channels(before: Any, after: Any, first: int = 0) -> int:
+    """Bitmask of the bytes that differ, bit ``first`` for the first byte."""
+    mask = 0
+    for index, (old, new) in enumerate(zip(before, after)):
+        if old != new:
+            mask |= 1 << (first + index)
+    return mask
+
+
+class ModuleStateRow:
+    """One module's output bytes, a window onto the table's buffer.
+
+    Indexing returns an int and slicing a ``bytearray`` copy, as on a
+    ``bytearray``. Unlike one, a row never changes length: a slice
+    assignment must put back as many bytes as it replaces.
+    """
+
+    __slots__ = ("_address", "_table", "_view")
+
+    def __init__(self, table: ModuleStateTable, address: str, view: memoryview) -> None:
+        self._table = table
+        self._address = address
+        self._view = view
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._view)
+
+    def __getitem__(self, key: int | slice) -> Any:
+        if isinstance(key, slice):
+            return bytearray(self._view[key])
+        return self._view[key]
+
+    def __setitem__(self, key: int | slice, value: Any) -> None:
+        before = self._view.tobytes()
+        self._view[key] = value
+        changed = _changed_channels(before, self._view)
+        if changed:
+            self._table._mark(self._address, changed)
+
+    def __bytes__(self) -> bytes:
+        return self._view.tobytes()
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ModuleStateRow):
+            other = other._view
+        if not isinstance(other, (bytes, bytearray, memoryview)):
+            return NotImplemented
+        return self._view == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def hex(self) -> str:
+        """Return the row as a hex string."""
+        return self._view.hex()
+
+    def __repr__(self) -> str:
+        return f"ModuleStateRow({self._view.hex()!r})"
+
+
+class ModuleStateTable(MutableMapping[str, ModuleStateRow]):
+    """Address -> :class:`ModuleStateRow`, backed by one buffer."""
+
+    def __init__(self, capacity: int = _DEFAULT_CAPACITY) -> None:
+        self._buffer = bytearray(max(1, capacity) * ROW_BYTES)
+        self._view = memoryview(self._buffer)
+        self._slots: dict[str, int] = {}
+        self._rows: dict[str, ModuleStateRow] = {}
+        self._free: list[int] = list(range(max(1, capacity) - 1, -1, -1))
+        self._changed: dict[str, int] = {}
+        # Two generations per slot, stamped from one table-wide tick so a
+        # reused slot never repeats a generation its last owner had.
+        self._generations: list[int] = [0] * (2 * max(1, capacity))
+        self._tick = 0
+
+    # -- mapping ---------------------------------------------------------
+
+    def __getitem__(self, address: str) -> ModuleStateRow:
+        return self._rows[address]
+
+    def __setitem__(self, address: str, value: Any) -> None:
+        """Copy ``value`` (up to twelve bytes) into the module's slot.
+
+        A row keeps its length when written with as many bytes again;
+        any other length re-windows the slot — a six-output module's
+        row stays six bytes long.
+        """
+        data = bytes(value)
+        if len(data) > ROW_BYTES:
+            raise ValueError(f"module state is {len(data)} bytes, at most {ROW_BYTES} fit")
+        row = self._rows.get(address)
+        if row is not None and len(row) == len(data):
+            row[:] = data
+            return
+        slot = self._slots.get(address)
+        if slot is None:
+            slot = self._allocate()
+            self._slots[address] = slot
+        start = slot * ROW_BYTES
+        self._view[start : start + ROW_BYTES] = bytes(ROW_BYTES)
+        self._view[start : start + len(data)] = data
+        self._rows[address] = ModuleStateRow(
+            self, address, self._view[start : start + len(data)]
+        )
+        self._tick += 1
+        self._generations[2 * slot : 2 * slot + 2] = [self._tick, self._tick]
+
+    def __delitem__(self, address: str) -> None:
+        del self._rows[address]
+        self._free.append(self._slots.pop(address))
+        self._changed.pop(address, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    # -- slots -----------------------------------------------------------
+
+    def reserve(self, count: int) -> None:
+        """Make room for ``count`` modules without growing again later."""
+        if count > len(self._buffer) // ROW_BYTES:
+            self._grow(count)
+
+    def ensure(self, address: str) -> ModuleStateRow:
+        """Return the module's row, allocating a zeroed twelve-byte one."""
+        row = self._rows.get(address)
+        if row is None:
+            self[address] = bytes(ROW_BYTES)
+            row = self._rows[address]
+        return row
+
+    def _allocate(self) -> int:
+        if not self._free:
+            self._grow(2 * (len(self._buffer) // ROW_BYTES))
+        return self._free.pop()
+
+    def _grow(self, capacity: int) -> None:
+        # Copy into a new buffer and re-point every row at it. The old
+        # buffer may still have views exported (a caller's group view),
+        # so it is left to be collected rather than resized in place.
+        old = len(self._buffer) // ROW_BYTES
+        buffer = bytearray(capacity * ROW_BYTES)
+        buffer[: len(self._buffer)] = self._buffer
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        for address, slot in self._slots.items():
+            start = slot * ROW_BYTES
+            length = len(self._rows[address])
+            self._rows[address]._view = self._view[start : start + length]
+        self._free[:0] = range(capacity - 1, old - 1, -1)
+        self._generations.extend([0] * (2 * (capacity - old)))
+
+    # -- groups ----------------------------------------------------------
+
+    def group_view(self, address: str, group: int) -> memoryview | None:
+        """Return a read-only view of one group, or ``None`` when the
+        module is unknown or has no such group.
+
+        The view is only good until the table next grows — read it, don't
+        keep it.
+        """
+        row = self._rows.get(address)
+        start = (group - 1) * GROUP_BYTES
+        if row is None or start < 0 or start + GROUP_BYTES > len(row):
+            return None
+        return row._view[start : start + GROUP_BYTES].toreadonly()
+
+    def write_group(self, address: str, group: int, state_hex: str) -> bool | None:
+        """Write a group from the first twelve hex digits of ``state_hex``.
+
+        Returns whether the group's bytes changed, or ``None`` — and
+        writes nothing — when the module is unknown or has no such group
+        (group 2 of a six-output module). Raises ``ValueError`` on bad hex.
+        """
+        row = self._rows.get(address)
+        start = (group - 1) * GROUP_BYTES
+        if row is None or start < 0 or start + GROUP_BYTES > len(row):
+            return None
+        data = bytes.fromhex(state_hex[: 2 * GROUP_BYTES].ljust(2 * GROUP_BYTES, "0"))
+        target = row._view[start : start + GROUP_BYTES]
+        changed = _changed_channels(target, data, start)
+        if not changed:
+            return False
+        target[:] = data
+        self._mark(address, changed)
+        return True
+
+    def _mark(self, address: str, channels: int) -> None:
+        self._tick += 1
+        slot = 2 * self._slots[address]
+        if channels & 0x03F:
+            self._generations[slot] = self._tick
+        if channels & 0xFC0:
+            self._generations[slot + 1] = self._tick
+        self._changed[address] = self._changed.get(address, 0) | channels
+
+    def generation(self, address: str, group: int) -> int:
+        """Return the group's generation: it changes whenever the group's
+        bytes do, and only then. ``0`` for an unknown module."""
+        slot = self._slots.get(address)
+        if slot is None or group not in (1, 2):
+            return 0
+        return self._generations[2 * slot + group - 1]
+
+    def take_changes(self, address: str) -> int:
+        """Return and clear the module's change mask — bit ``n - 1`` for
+        channel ``n`` — covering writes since the last call."""
+        return self._changed.pop(address, 0)
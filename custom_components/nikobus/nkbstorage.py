@@ -1,6 +1,6 @@
 """HA-native persistence for Nikobus discovery data.
 
-Two parallel Stores back the integration:
+Two parallel Stores back the integration's discovery data:
 
 * ``.storage/nikobus.buttons`` (``NikobusButtonStorage``) — button discovery
   results. Schema unchanged since nikobus-connect 0.3.0.
@@ -24,18 +24,33 @@ Two parallel Stores back the integration:
           ...
       }}
 
-The nikobus-connect discovery engine owns both dicts and mutates them in
+A third, ``.storage/nikobus.state`` (``NikobusStateStorage``), holds the
+warm-start snapshot of module states described in ``nkbsnapshot``.
+
+The nikobus-connect discovery engine owns both discovery dicts and mutates them in
 place; the integration calls ``async_save()`` through the callbacks it hands
 the library.
+
+``async_save()`` doesn't write straight away. It skips a dict whose content
+hasn't changed since it was last written successfully (or loaded), and
+otherwise schedules one delayed write, which every further save until then
+joins. Discovery callbacks and options-flow edits arriving in bursts then
+cost one write of the (possibly several hundred KB) document, not one each.
+``async_flush()`` writes a pending save at once; the coordinator calls it at
+unload, and HA's final-write stage runs one still pending at shutdown.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.storage import Store
 
 _LOGGER = logging.getLogger(__name__)
@@ -49,6 +64,18 @@ MODULE_STORAGE_VERSION = 1
 CF_STORAGE_KEY = "nikobus.cfs"
 CF_STORAGE_VERSION = 1
 
+STATE_STORAGE_KEY = "nikobus.state"
+STATE_STORAGE_VERSION = 1
+
+# Seconds a save waits for further saves to join it before writing.
+SAVE_DELAY = 10
+
+
+def _digest(data: dict[str, Any]) -> bytes:
+    """Content hash of a store's dict, to tell whether it changed."""
+    encoded = json.dumps(data, separators=(",", ":"), default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
 
 class _NikobusStore:
     """Shared HA ``Store`` wrapper keyed by a single root mapping.
@@ -62,9 +89,15 @@ class _NikobusStore:
     _root_key: str
 
     def __init__(self, hass: HomeAssistant, key: str, version: int) -> None:
+        self._hass = hass
         self._store: Store[dict[str, Any]] = Store(hass, version, key)
         self._key = key
         self._data: dict[str, Any] = {self._root_key: {}}
+        # Hash of the content last loaded or written successfully.
+        self._saved_digest: bytes | None = None
+        # A scheduled write: its delay timer and its shutdown fallback.
+        self._cancel_delay: CALLBACK_TYPE | None = None
+        self._cancel_final_write: CALLBACK_TYPE | None = None
 
     async def async_load(self) -> dict[str, Any]:
         """Load persisted data, returning the live mutable dict."""
@@ -73,26 +106,74 @@ class _NikobusStore:
             self._data = loaded
         else:
             self._data = {self._root_key: {}}
+        self._saved_digest = _digest(self._data)
         return self._data
 
     async def async_save(self) -> None:
-        """Persist the current in-memory dict to storage.
+        """Schedule a write of the in-memory dict, if it changed.
+
+        Saves while a write is already scheduled join it: the write
+        takes the dict as it is when it runs.
+        """
+        if self.pending or _digest(self._data) == self._saved_digest:
+            return
+        self._cancel_delay = async_call_later(
+            self._hass, SAVE_DELAY, self._async_delay_elapsed
+        )
+        self._cancel_final_write = self._hass.bus.async_listen_once(
+            EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_final_write
+        )
 
-        A failed write (disk full, read-only filesystem, …) is logged
+    @property
+    def pending(self) -> bool:
+        """Return True while a write is scheduled."""
+        return self._cancel_delay is not None
+
+    async def async_flush(self) -> None:
+        """Write a scheduled save now instead of after its delay."""
+        if self._cancel_delay is not None:
+            self._cancel_delay()
+        if self._cancel_final_write is not None:
+            self._cancel_final_write()
+        await self._async_write()
+
+    async def _async_delay_elapsed(self, _now: Any) -> None:
+        if self._cancel_final_write is not None:
+            self._cancel_final_write()
+        await self._async_write()
+
+    async def _async_final_write(self, _event: Event) -> None:
+        # The listener is gone once it fired; only the timer is left.
+        self._cancel_final_write = None
+        if self._cancel_delay is not None:
+            self._cancel_delay()
+        await self._async_write()
+
+    async def _async_write(self) -> None:
+        """Write the dict if a write was scheduled.
+
+        The content counts as saved only once the write succeeded. A
+        failed write (disk full, read-only filesystem, …) is logged
         loudly instead of bubbling up: the in-memory dict stays correct
-        and the next save retries, whereas an exception here would abort
-        the middle of a discovery/reconciliation pass that already
-        mutated state.
+        and the next save writes it again, whereas an exception here
+        would abort the unload that flushes it.
         """
+        if self._cancel_delay is None:
+            return
+        self._cancel_delay = self._cancel_final_write = None
+        digest = _digest(self._data)
         try:
             await self._store.async_save(self._data)
         except (OSError, HomeAssistantError):
+            self._saved_digest = None
             _LOGGER.exception(
                 "Failed to persist %s to storage — in-memory data is "
                 "intact and will be saved again on the next change, but "
                 "the on-disk copy is stale until then",
                 self._key,
             )
+            return
+        self._saved_digest = digest
 
     @property
     def data(self) -> dict[str, Any]:
@@ -145,3 +226,18 @@ class NikobusCFStorage(_NikobusStore):
 
     def __init__(self, hass: HomeAssistant) -> None:
         super().__init__(hass, CF_STORAGE_KEY, CF_STORAGE_VERSION)
+
+
+class NikobusStateStorage(_NikobusStore):
+    """Wrap a HA ``Store`` for the warm-start state snapshot.
+
+    Written by the coordinator every few minutes and at shutdown, read
+    once at connect time — see ``nkbsnapshot``.
+
+    Storage shape: ``{"nikobus_state": {address: {...}}}``.
+    """
+
+    _root_key = "nikobus_state"
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        super().__init__(hass, STATE_STORAGE_KEY, STATE_STORAGE_VERSION)
@@ -63,3 +63,20 @@ class NikobusTravelCalculator:
         if self._direction == 1:
             return min(100.0, self._start_pos + progress)
         return max(0.0, self._start_pos - progress)
+
+    def time_to_position(self, target: float) -> float | None:
+        """Seconds of the current travel left until ``target`` is reached.
+
+        Travel is linear, so the stop instant follows from the distance
+        left and the active run time. ``None`` when not travelling, or
+        when ``target`` lies behind the direction of travel.
+        """
+        if self._direction is None:
+            return None
+        active_time = self.time_up if self._direction == 1 else self.time_down
+        if active_time <= 0:
+            return None
+        distance = (target - self.current_position()) * self._direction
+        if distance < 0:
+            return None
+        return distance / 100.0 * active_time
@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+import copy
+import hashlib
+import json
 import logging
-from collections.abc import Iterable, Iterator, Mapping
+from collections.abc import Callable, Iterable, Iterator, Mapping
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
 
 from .const import BRAND, CATEGORY_OUTPUT_MODULES, DOMAIN
+from .nkbreconcile import diff_entity_records
+
+if TYPE_CHECKING:
+    from homeassistant.helpers.entity import Entity
+    from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,6 +56,7 @@ def register_output_module_devices(
 
 
 _ROUTING_CACHE_KEY = "routing"
+_ROUTED_DOMAINS = ("cover", "switch", "light")
 
 _CAPABILITIES = {
     "roller_module": {"cover", "switch", "light"},
@@ -227,20 +236,78 @@ def _modules_to_address_map(modules: Any) -> dict[str, Mapping[str, Any]]:
     return {}
 
 
+def routing_memo(hass: HomeAssistant, entry: ConfigEntry) -> RoutingMemo:
+    """Return the entry's routing memo, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    entry_data = domain_data.setdefault(entry.entry_id, {})
+    memo = entry_data.get(_ROUTING_CACHE_KEY)
+    if memo is None:
+        memo = entry_data[_ROUTING_CACHE_KEY] = RoutingMemo()
+    return memo
+
+
 def get_routing(
     hass: HomeAssistant, entry: ConfigEntry, dict_module_data: Mapping[str, Any]
 ) -> dict[str, list[EntitySpec]]:
-    """Retrieve or build the entity routing spec from the cache."""
-    domain_data = hass.data.setdefault(DOMAIN, {})
-    entry_data = domain_data.setdefault(entry.entry_id, {})
-    routing = entry_data.get(_ROUTING_CACHE_KEY)
+    """Retrieve the entity routing spec, refreshing modules that changed."""
+    return routing_memo(hass, entry).routing(dict_module_data)
 
-    if routing is None:
-        _LOGGER.debug("Building entity routing for config entry %s", entry.entry_id)
-        routing = build_routing(dict_module_data)
-        entry_data[_ROUTING_CACHE_KEY] = routing
 
-    return routing
+# A platform's entity builder yields each entity with the source record it
+# was built from: its routing spec, op-point, CF or scene record.
+EntityBuilder = Callable[[], Iterable[tuple["Entity", Any]]]
+
+
+class PlatformEntities:
+    """The entities one platform added, kept in step with the stores.
+
+    Every entity is tracked with a copy of the record it was built from.
+    :meth:`async_reconcile` runs the builder again and compares records
+    by unique_id: a new entity is added, a vanished one removed, one
+    whose record changed is replaced, and every other entity keeps
+    running untouched. Removing an entity leaves its registry entry —
+    user names, areas and entity_id survive a replacement; orphan
+    cleanup drops the entries of entities that are gone for good.
+    """
+
+    def __init__(
+        self, build: EntityBuilder, async_add_entities: AddConfigEntryEntitiesCallback
+    ) -> None:
+        self._build = build
+        self._async_add_entities = async_add_entities
+        self._entities: dict[str, tuple[Entity, Any]] = {}
+
+    def _collect(self) -> dict[str, tuple[Entity, Any]]:
+        return {
+            entity.unique_id: (entity, copy.deepcopy(record))
+            for entity, record in self._build()
+        }
+
+    def async_add_initial(self) -> None:
+        """Build the platform's entities and add them all."""
+        self._entities = self._collect()
+        self._async_add_entities([entity for entity, _ in self._entities.values()])
+
+    async def async_reconcile(self) -> tuple[int, int]:
+        """Rebuild from the stores; return ``(added, removed)`` counts.
+
+        A replaced entity counts once on each side.
+        """
+        built = self._collect()
+        added, removed, changed = diff_entity_records(
+            {uid: record for uid, (_, record) in self._entities.items()},
+            {uid: record for uid, (_, record) in built.items()},
+        )
+        for uid in (*removed, *changed):
+            entity, _ = self._entities.pop(uid)
+            if entity.hass is not None:
+                await entity.async_remove()
+        new = [*added, *changed]
+        for uid in new:
+            self._entities[uid] = built[uid]
+        if new:
+            self._async_add_entities([built[uid][0] for uid in new])
+        return len(new), len(removed) + len(changed)
 
 
 def build_routing(
@@ -252,7 +319,16 @@ def build_routing(
     even if it belongs to a versatile module (like a roller module used for lights).
     """
     routing: dict[str, list[EntitySpec]] = {"cover": [], "switch": [], "light": []}
+    for module_type, address, module_data in _iter_output_modules(dict_module_data):
+        for spec in _route_module(module_type, address, module_data):
+            routing[spec.domain].append(spec)
+    return routing
+
 
+def _iter_output_modules(
+    dict_module_data: Mapping[str, Any],
+) -> Iterator[tuple[str, str, Mapping[str, Any]]]:
+    """Yield ``(module_type, address, module_data)`` for every output module."""
     for module_type, modules in dict_module_data.items():
         # Input-class modules (PC-Logic, Modular Interface) and opaque
         # modules (Audio Distribution) don't drive output relays; the
@@ -261,57 +337,133 @@ def build_routing(
         # switch entities for their channels.
         if module_type in INPUT_MODULE_TYPES or module_type in OPAQUE_MODULE_TYPES:
             continue
+        for address, module_data in _modules_to_address_map(modules).items():
+            yield module_type, address, module_data
+
+
+def _route_module(
+    module_type: str, address: str, module_data: Mapping[str, Any]
+) -> tuple[EntitySpec, ...]:
+    """Route one module's channels, in channel order."""
+    specs: list[EntitySpec] = []
+    module_desc = module_data.get("description", f"Module {address}")
+    module_model = module_data.get("model", "Unknown")
+
+    for channel_index, channel_info in enumerate(
+        module_data.get("channels", []), start=1
+    ):
+        if not isinstance(channel_info, Mapping):
+            _LOGGER.warning(
+                "Channel %d for module %s is not a dict — skipping",
+                channel_index, address,
+            )
+            continue
+        channel_description = channel_info.get("description", "")
+
+        # Skip channels explicitly marked as unused.
+        #   * ``entity_type: "disabled"`` — set from the "Customize a
+        #     module" options flow to hide a channel.
+        #   * ``description`` prefixed with ``not_in_use`` — the
+        #     legacy convention from hand-edited config files; still
+        #     honoured for backwards compatibility.
+        if channel_info.get("entity_type") == "disabled":
+            continue
+        if channel_description.startswith("not_in_use"):
+            continue
 
-        modules_map = _modules_to_address_map(modules)
-
-        for address, module_data in modules_map.items():
-            module_desc = module_data.get("description", f"Module {address}")
-            module_model = module_data.get("model", "Unknown")
-
-            for channel_index, channel_info in enumerate(
-                module_data.get("channels", []), start=1
-            ):
-                if not isinstance(channel_info, Mapping):
-                    _LOGGER.warning(
-                        "Channel %d for module %s is not a dict — skipping",
-                        channel_index, address,
-                    )
-                    continue
-                channel_description = channel_info.get("description", "")
-
-                # Skip channels explicitly marked as unused.
-                #   * ``entity_type: "disabled"`` — set from the "Customize a
-                #     module" options flow to hide a channel.
-                #   * ``description`` prefixed with ``not_in_use`` — the
-                #     legacy convention from hand-edited config files; still
-                #     honoured for backwards compatibility.
-                if channel_info.get("entity_type") == "disabled":
-                    continue
-                if channel_description.startswith("not_in_use"):
-                    continue
-
-                entity_type = _resolve_entity_type(module_type, channel_info)
-                domain, kind = _map_entity_type(module_type, entity_type)
-
-                if domain not in routing:
-                    _LOGGER.error("Resolved unknown domain '%s' for channel %s", domain, address)
-                    continue
-
-                routing[domain].append(
-                    EntitySpec(
-                        domain=domain,
-                        kind=kind,
-                        address=address,
-                        channel=channel_index,
-                        channel_description=channel_description,
-                        module_desc=module_desc,
-                        module_model=module_model,
-                        operation_time_up=channel_info.get("operation_time_up"),
-                        operation_time_down=channel_info.get("operation_time_down"),
-                    )
-                )
+        entity_type = _resolve_entity_type(module_type, channel_info)
+        domain, kind = _map_entity_type(module_type, entity_type)
 
-    return routing
+        if domain not in _ROUTED_DOMAINS:
+            _LOGGER.error("Resolved unknown domain '%s' for channel %s", domain, address)
+            continue
+
+        specs.append(
+            EntitySpec(
+                domain=domain,
+                kind=kind,
+                address=address,
+                channel=channel_index,
+                channel_description=channel_description,
+                module_desc=module_desc,
+                module_model=module_model,
+                operation_time_up=channel_info.get("operation_time_up"),
+                operation_time_down=channel_info.get("operation_time_down"),
+            )
+        )
+
+    return tuple(specs)
+
+
+def _module_digest(module_data: Mapping[str, Any]) -> bytes:
+    """Content hash of one module entry — equal entries hash equal."""
+    encoded = json.dumps(module_data, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(encoded, digest_size=16).digest()
+
+
+class RoutingMemo:
+    """Entity routing kept per module, keyed on each entry's content hash.
+
+    A refresh hashes every module entry but routes only those whose hash
+    moved — a save that touched one module re-routes that module alone —
+    and keeps the set of routed unique_ids in step with the same diff.
+    The memo refreshes on first use and after :meth:`invalidate`; in
+    between it hands out the routing it last built.
+    """
+
+    def __init__(self) -> None:
+        self._modules: dict[tuple[str, str], tuple[bytes, tuple[EntitySpec, ...]]] = {}
+        self._routing: dict[str, list[EntitySpec]] | None = None
+        self._unique_ids: set[str] = set()
+
+    def invalidate(self) -> None:
+        """Re-check every module entry on next use."""
+        self._routing = None
+
+    def routing(self, dict_module_data: Mapping[str, Any]) -> dict[str, list[EntitySpec]]:
+        """Return the routing spec, as ``build_routing`` would build it."""
+        if self._routing is None:
+            self._refresh(dict_module_data)
+        assert self._routing is not None
+        return self._routing
+
+    def unique_ids(self, dict_module_data: Mapping[str, Any]) -> frozenset[str]:
+        """Return the unique_ids of every routed channel entity."""
+        if self._routing is None:
+            self._refresh(dict_module_data)
+        return frozenset(self._unique_ids)
+
+    def _refresh(self, dict_module_data: Mapping[str, Any]) -> None:
+        modules: dict[tuple[str, str], tuple[bytes, tuple[EntitySpec, ...]]] = {}
+        routed = 0
+        for module_type, address, module_data in _iter_output_modules(dict_module_data):
+            key = (module_type, address)
+            digest = _module_digest(module_data)
+            cached = self._modules.get(key)
+            if cached is not None and cached[0] == digest:
+                modules[key] = cached
+                continue
+            specs = _route_module(module_type, address, module_data)
+            if cached is not None:
+                self._unique_ids.difference_update(_spec_ids(cached[1]))
+            self._unique_ids.update(_spec_ids(specs))
+            modules[key] = (digest, specs)
+            routed += 1
+        for key in self._modules.keys() - modules.keys():
+            self._unique_ids.difference_update(_spec_ids(self._modules[key][1]))
+
+        routing: dict[str, list[EntitySpec]] = {domain: [] for domain in _ROUTED_DOMAINS}
+        for _digest, specs in modules.values():
+            for spec in specs:
+                routing[spec.domain].append(spec)
+        self._modules = modules
+        self._routing = routing
+        _LOGGER.debug("Routed %d of %d output modules", routed, len(modules))
+
+
+def _spec_ids(specs: Iterable[EntitySpec]) -> Iterator[str]:
+    for spec in specs:
+        yield build_unique_id(spec.domain, spec.kind, spec.address, spec.channel)
 
 
 def _resolve_entity_type(module_type: str, channel_info: Mapping[str, Any]) -> str:
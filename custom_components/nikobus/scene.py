@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import uuid
+from collections.abc import Awaitable, Callable, Iterator
 from typing import Any
 
 from homeassistant.components.scene import Scene
@@ -15,6 +16,7 @@ from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from .button import op_point_display_name
 from .const import (
     CATEGORY_SCENES,
+    DEFAULT_COVER_MOVEMENT_BUFFER,
     DOMAIN,
     EVENT_SCENE_ACTIVATED,
     press_signal,
@@ -22,24 +24,13 @@ from .const import (
 from .coordinator import NikobusConfigEntry, NikobusDataCoordinator
 from .entity import NikobusEntity, command_error
 from .nkbreconcile import is_pure_roller_cf, is_surfaced_cf_scene
+from .nkbsceneplan import STATE_STOPPED, ScenePlan, compile_scene, state_to_byte
+from .router import PlatformEntities
 
 _LOGGER = logging.getLogger(__name__)
 
 PARALLEL_UPDATES = 0
 
-# Nikobus State Constants
-STATE_STOPPED = 0x00
-STATE_OPEN = 0x01
-STATE_CLOSE = 0x02
-STATE_ON = 0xFF
-STATE_OFF = 0x00
-
-_STATE_MAPPING = {
-    "switch_module": {"on": STATE_ON, "off": STATE_OFF, "true": STATE_ON, "false": STATE_OFF},
-    "roller_module": {"open": STATE_OPEN, "close": STATE_CLOSE, "stop": STATE_STOPPED}
-}
-
-
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: NikobusConfigEntry,
@@ -65,47 +56,45 @@ async def async_setup_entry(
     broadcasts.
     """
     coordinator: NikobusDataCoordinator = entry.runtime_data
-    entities: list[Scene] = []
 
-    if coordinator.dict_scene_data:
-        scenes = coordinator.dict_scene_data.get("scene", [])
+    def _build() -> Iterator[tuple[Scene, Any]]:
+        if coordinator.dict_scene_data:
+            scenes = coordinator.dict_scene_data.get("scene", [])
 
-        for scene in scenes:
-            scene_id = scene.get("id")
-            if not scene_id:
-                _LOGGER.warning("Skipping Nikobus scene with missing ID")
-                continue
+            for scene in scenes:
+                scene_id = scene.get("id")
+                if not scene_id:
+                    _LOGGER.warning("Skipping Nikobus scene with missing ID")
+                    continue
 
-            entities.append(
-                NikobusSceneEntity(
+                yield NikobusSceneEntity(
                     coordinator=coordinator,
                     scene_config=scene,
-                )
-            )
+                ), scene
 
-    cf_data = coordinator.cf_storage.data.get("nikobus_cf", {}) if coordinator.cf_storage else {}
-    for bus_address, cf in cf_data.items():
-        if not isinstance(cf, dict):
-            continue
-        # A pure-roller CF becomes a grouped cover (cover platform), not a
-        # scene/broadcast — skip it here.
-        if is_pure_roller_cf(cf):
-            continue
-        # A button-backed light-scene (fired by a real wall button / IR)
-        # is only a scene once the .nkb import has named it; an unnamed one
-        # is just a button the user already has and is not surfaced as a
-        # (phantom, unnamed) scene. The bare 38xx CFs always surface.
-        if not is_surfaced_cf_scene(cf):
-            continue
-        entities.append(
-            NikobusCFSceneEntity(
+        cf_data = coordinator.cf_storage.data.get("nikobus_cf", {}) if coordinator.cf_storage else {}
+        for bus_address, cf in cf_data.items():
+            if not isinstance(cf, dict):
+                continue
+            # A pure-roller CF becomes a grouped cover (cover platform), not
+            # a scene/broadcast — skip it here.
+            if is_pure_roller_cf(cf):
+                continue
+            # A button-backed light-scene (fired by a real wall button / IR)
+            # is only a scene once the .nkb import has named it; an unnamed
+            # one is just a button the user already has and is not surfaced
+            # as a (phantom, unnamed) scene. The bare 38xx CFs always surface.
+            if not is_surfaced_cf_scene(cf):
+                continue
+            yield NikobusCFSceneEntity(
                 coordinator=coordinator,
                 bus_address=bus_address,
                 cf_config=cf,
-            )
-        )
+            ), cf
 
-    async_add_entities(entities)
+    entities = PlatformEntities(_build, async_add_entities)
+    entities.async_add_initial()
+    coordinator.register_platform_entities("scene", entities)
 
 
 class NikobusCFSceneEntity(NikobusEntity, Scene):
@@ -298,11 +287,30 @@ class NikobusSceneEntity(NikobusEntity, Scene):
 
         self._channels = scene_config.get("channels", [])
         self._feedback_leds = self._normalize_feedback_leds(scene_config.get("feedback_led"))
+        # Members resolved against the module store; recompiled when the
+        # store's revision moves on (see ``_activation_plan``).
+        self._plan: ScenePlan | None = None
+        # ``force_write``: resend every group even when the state buffer
+        # already holds the scene's bytes (e.g. outputs switched locally
+        # on an install without a feedback module).
+        self._force_write = bool(scene_config.get("force_write", False))
+        # First-to-last module answer spread of the last activation.
+        self._last_skew: float | None = None
 
         # Guard against overlapping roller release tasks
         self._module_tokens: dict[str, str] = {}
         self._roller_stop_tasks: list[asyncio.Task[None]] = []
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        parent = super().extra_state_attributes or {}
+        return {
+            **parent,
+            "last_actuation_skew_ms": (
+                round(self._last_skew * 1000) if self._last_skew is not None else None
+            ),
+        }
+
     async def async_added_to_hass(self) -> None:
         """Register cleanup of pending roller-stop tasks on removal."""
         await super().async_added_to_hass()
@@ -324,6 +332,24 @@ class NikobusSceneEntity(NikobusEntity, Scene):
         except Exception as err:
             raise command_error(err) from err
 
+    def _activation_plan(self) -> ScenePlan:
+        """Return the compiled plan, recompiling after a module-store save."""
+        revision = self.coordinator.module_revision
+        if self._plan is None or self._plan.revision != revision:
+            self._plan = compile_scene(
+                self._channels,
+                revision=revision,
+                module_type=self.coordinator.get_module_type,
+                channel_count=self.coordinator.get_module_channel_count,
+                operation_time=lambda module_id, channel, direction: (
+                    self.coordinator.get_cover_operation_time(
+                        module_id, channel, direction=direction
+                    )
+                ),
+                stop_buffer=DEFAULT_COVER_MOVEMENT_BUFFER,
+            )
+        return self._plan
+
     async def _activate(self) -> None:
         """Activate the scene by setting multiple module channels."""
         _LOGGER.info("Activating Nikobus scene: %s", self.name)
@@ -331,101 +357,120 @@ class NikobusSceneEntity(NikobusEntity, Scene):
         # 1. Handle Feedback LEDs (Toggles) first if defined
         await self._process_feedback_leds()
 
-        module_updates: dict[str, bytearray] = {}
-        roller_tasks: dict[str, dict[str, Any]] = {}
-
-        # 2. Build the state map for all impacted modules
-        for channel_info in self._channels:
-            module_id = (channel_info.get("module_id") or "").upper()
-            chan_num = channel_info.get("channel")
-            state = channel_info.get("state")
-
-            if not module_id or chan_num is None:
-                continue
-
-            module_type = self.coordinator.get_module_type(module_id)
-            byte_val = self._state_to_byte(module_type, state)
+        plan = self._activation_plan()
+        states = self.coordinator.nikobus_module_states
 
-            if byte_val is None:
-                continue
-
-            if module_id not in module_updates:
-                # Start with current known state from coordinator
-                current = self.coordinator.nikobus_module_states.get(module_id, bytearray(12))
-                module_updates[module_id] = bytearray(current)
+        # 2. Merge each module's plan into its current state and hand
+        #    every module write to the bus as one batch
+        final_states = {
+            module_plan.module_id: module_plan.merge(states.get(module_plan.module_id))
+            for module_plan in plan.modules
+        }
+        writes = {
+            module_plan.module_id: (
+                lambda on_answered, mp=module_plan: self._apply_module_state(
+                    mp.module_id,
+                    final_states[mp.module_id],
+                    mp.groups,
+                    force=self._force_write,
+                    completion_handler=on_answered,
+                )
+            )
+            for module_plan in plan.modules
+        }
+        try:
+            result = await self.coordinator.async_dispatch_module_writes(
+                f"Scene {self.name}", writes
+            )
+            self._last_skew = result.skew
+        finally:
+            # 3. Schedule roller release for every module that has rollers
+            for module_plan in plan.modules:
+                if module_plan.roller_indexes:
+                    self._schedule_roller_stop(
+                        module_plan.module_id,
+                        final_states[module_plan.module_id],
+                        set(module_plan.roller_indexes),
+                        plan.stop_delay,
+                    )
 
-            # Update specific channel (0-indexed)
-            try:
-                idx = int(chan_num) - 1
-            except (ValueError, TypeError):
-                _LOGGER.warning("Scene channel number %r is not a valid integer — skipping", chan_num)
-                continue
-            if 0 <= idx < len(module_updates[module_id]):
-                module_updates[module_id][idx] = byte_val
-
-            # Track rollers that need a timed stop
-            if module_type == "roller_module" and byte_val in (STATE_OPEN, STATE_CLOSE):
-                # Determine direction based on the state being sent
-                direction = "up" if byte_val == STATE_OPEN else "down"
-                op_time = self.coordinator.get_cover_operation_time(module_id, chan_num, direction=direction)
-
-                if op_time > 0:
-                    module_task = roller_tasks.setdefault(module_id, {"indexes": set(), "delay": 0})
-                    module_task["indexes"].add(idx)
-                    # Use the specific direction's time + buffer
-                    module_task["delay"] = max(module_task["delay"], op_time + 3.0)
-
-        # 3. Commit updates to hardware
-        # All rollers in the scene share the same stop deadline: the
-        # longest per-channel ``op_time + 3 s`` across every impacted
-        # cover, regardless of which module it sits on. This gives each
-        # cover the most generous buffer the scene asks for, which
-        # absorbs bus contention when several modules are commanded
-        # back to back. The previous per-module max meant a cover with
-        # the longest op_time on a busy bus could see its stop fire
-        # before the motor reached the end-stop — manifesting as a
-        # cover that froze at e.g. 86 % when the same scene worked
-        # cleanly when triggered manually on an idle bus.
-        global_delay = max(
-            (info["delay"] for info in roller_tasks.values()),
-            default=0.0,
+    def _schedule_roller_stop(
+        self, module_id: str, sent_state: bytearray, indexes: set[int], delay: float
+    ) -> None:
+        """Stop this activation's rollers on ``module_id`` after ``delay``."""
+        token = uuid.uuid4().hex
+        self._module_tokens[module_id] = token
+        task = self.hass.async_create_task(
+            self._delayed_roller_stop(module_id, sent_state, indexes, delay, token)
+        )
+        self._roller_stop_tasks.append(task)
+        task.add_done_callback(
+            lambda t: self._roller_stop_tasks.remove(t) if t in self._roller_stop_tasks else None
         )
 
-        for module_id, final_state in module_updates.items():
-            await self._apply_module_state(module_id, final_state)
-
-            # 4. Schedule roller release if needed
-            if module_id in roller_tasks:
-                task_info = roller_tasks[module_id]
-                token = uuid.uuid4().hex
-                self._module_tokens[module_id] = token
-                task = self.hass.async_create_task(
-                    self._delayed_roller_stop(
-                        module_id, final_state, task_info["indexes"], global_delay, token
-                    )
-                )
-                self._roller_stop_tasks.append(task)
-                task.add_done_callback(
-                    lambda t: self._roller_stop_tasks.remove(t) if t in self._roller_stop_tasks else None
-                )
-
-    async def _apply_module_state(self, module_id: str, state: bytearray) -> None:
-        """Push the bytearray state to the Nikobus module via coordinator."""
-        num_chans = self.coordinator.get_module_channel_count(module_id)
+    async def _apply_module_state(
+        self,
+        module_id: str,
+        state: bytearray,
+        groups: tuple[int, ...] | None = None,
+        *,
+        force: bool = False,
+        completion_handler: Callable[[], Awaitable[None]] | None = None,
+    ) -> bool:
+        """Push the bytearray state to the Nikobus module via coordinator.
+
+        Only groups whose six bytes differ from the state buffer are
+        written; ``force`` writes every group regardless. Skipped group
+        writes are counted in ``coordinator.scene_writes``. Returns
+        whether anything was sent; ``completion_handler`` runs once the
+        module has answered it.
+        """
+        if groups is None:
+            groups = (1, 2) if self.coordinator.get_module_channel_count(module_id) > 6 else (1,)
 
-        # Update Group 1 (1-6)
-        self.coordinator.set_bytearray_group_state(module_id, 1, state[:6].hex())
+        # Group 1 is channels 1-6, group 2 channels 7-12.
+        current = self.coordinator.nikobus_module_states.get(module_id)
+        changed = [
+            group
+            for group in groups
+            if force
+            or current is None
+            or current[(group - 1) * 6:group * 6] != state[(group - 1) * 6:group * 6]
+        ]
+        stats = self.coordinator.scene_writes
+        stats["group_writes"] += len(changed)
+        stats["skipped"] += len(groups) - len(changed)
+        if force:
+            stats["forced"] += len(groups)
+        if not changed:
+            _LOGGER.debug("Scene write to %s skipped — already in target state", module_id)
+            return False
 
-        # Update Group 2 (7-12) if applicable
-        if num_chans > 6:
-            self.coordinator.set_bytearray_group_state(module_id, 2, state[6:12].hex())
+        for group in changed:
+            offset = (group - 1) * 6
+            self.coordinator.set_bytearray_group_state(
+                module_id, group, state[offset:offset + 6].hex()
+            )
 
-        await self.coordinator.api.set_output_states_for_module(address=module_id)
+        if changed == [2]:
+            # No whole-module call writes group 2 alone; a channel write
+            # sends its group's frame built from the buffer set above.
+            await self.coordinator.api_commands.set_output_state(
+                module_id, 7, state[6], completion_handler=completion_handler
+            )
+        else:
+            # The channel count passed decides whether group 2 goes out.
+            await self.coordinator.api.set_output_states_for_module(
+                address=module_id,
+                completion_handler=completion_handler,
+                num_channels=12 if 2 in changed else 6,
+            )
 
         # Notify coordinator of manual refresh
         await self.coordinator.async_event_handler(
             "nikobus_refreshed", {"impacted_module_address": module_id}
         )
+        return True
 
     async def _delayed_roller_stop(
         self, module_id: str, sent_state: bytearray, indexes: set[int], delay: float, token: str
@@ -473,14 +518,7 @@ class NikobusSceneEntity(NikobusEntity, Scene):
 
     def _state_to_byte(self, module_type: str | None, state: Any) -> int | None:
         """Convert friendly state strings/values to Nikobus bytes."""
-        if module_type == "dimmer_module":
-            try:
-                return max(0, min(int(state), 255))
-            except (ValueError, TypeError):
-                return None
-
-        clean_state = str(state).lower()
-        return _STATE_MAPPING.get(module_type or "", {}).get(clean_state)
+        return state_to_byte(module_type, state)
 
     def _normalize_feedback_leds(self, value: Any) -> list[str]:
         """Ensure feedback LEDs are a list of cleaned strings."""
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping
 from typing import Any
 
 from homeassistant.components.switch import SwitchEntity
@@ -13,10 +13,11 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 from homeassistant.helpers.restore_state import RestoreEntity
 
-from .const import operation_signal, press_signal
+from .const import channel_signal, operation_signal, press_signal
 from .coordinator import NikobusConfigEntry, NikobusDataCoordinator
 from .entity import NikobusEntity, command_error
 from .router import (
+    PlatformEntities,
     build_unique_id,
     get_routing,
     input_latch_switch_unique_id,
@@ -82,43 +83,38 @@ async def async_setup_entry(
 ) -> None:
     """Set up Nikobus switch entities from a config entry."""
     coordinator: NikobusDataCoordinator = entry.runtime_data
-    entities: list[SwitchEntity] = []
 
-    routing = get_routing(hass, entry, coordinator.dict_module_data)
-    specs = routing.get("switch", [])
-    register_output_module_devices(hass, entry, specs)
+    def _build() -> Iterator[tuple[SwitchEntity, Any]]:
+        routing = get_routing(hass, entry, coordinator.dict_module_data)
+        specs = routing.get("switch", [])
+        register_output_module_devices(hass, entry, specs)
 
-    for spec in specs:
-        if spec.kind == "relay_switch":
-            entities.append(
-                NikobusRelaySwitchEntity(
+        for spec in specs:
+            if spec.kind == "relay_switch":
+                yield NikobusRelaySwitchEntity(
                     coordinator, spec.address, spec.channel,
                     spec.channel_description, spec.module_desc, spec.module_model
-                )
-            )
-        elif spec.kind == "cover_binary":
-            entities.append(
-                NikobusCoverSwitchEntity(
+                ), spec
+            elif spec.kind == "cover_binary":
+                yield NikobusCoverSwitchEntity(
                     coordinator, spec.address, spec.channel,
                     spec.channel_description, spec.module_desc, spec.module_model
-                )
-            )
-
-    # Stateful A/B latch switch per PC-Logic / Modular-Interface input.
-    # The input itself surfaces as a stateless button (button.py); this
-    # adds a persistent on/off mirror: the 1A signal turns it on, 1B
-    # turns it off, and turn_on/off drive the corresponding bus frame.
-    for physical_addr, phys in iter_input_module_children(
-        coordinator.dict_button_data.get("nikobus_button", {})
-    ):
-        naming = pc_logic_input_naming(phys)
-        ab = input_ab_addresses(phys)
-        if naming is None or ab is None:
-            continue
-        device_name, via_device = naming
-        addr_1a, addr_1b = ab
-        entities.append(
-            NikobusInputLatchSwitch(
+                ), spec
+
+        # Stateful A/B latch switch per PC-Logic / Modular-Interface input.
+        # The input itself surfaces as a stateless button (button.py); this
+        # adds a persistent on/off mirror: the 1A signal turns it on, 1B
+        # turns it off, and turn_on/off drive the corresponding bus frame.
+        for physical_addr, phys in iter_input_module_children(
+            coordinator.dict_button_data.get("nikobus_button", {})
+        ):
+            naming = pc_logic_input_naming(phys)
+            ab = input_ab_addresses(phys)
+            if naming is None or ab is None:
+                continue
+            device_name, via_device = naming
+            addr_1a, addr_1b = ab
+            yield NikobusInputLatchSwitch(
                 coordinator,
                 # Use the raw button-store key so the latch's device
                 # identifier matches the input-child device registered in
@@ -130,10 +126,11 @@ async def async_setup_entry(
                 device_name=device_name,
                 via_device=via_device,
                 model=str(phys.get("model") or "Logical Input"),
-            )
-        )
+            ), phys
 
-    async_add_entities(entities)
+    entities = PlatformEntities(_build, async_add_entities)
+    entities.async_add_initial()
+    coordinator.register_platform_entities("switch", entities)
 
 
 class NikobusBaseSwitch(NikobusEntity, SwitchEntity, RestoreEntity):
@@ -193,6 +190,14 @@ class NikobusBaseSwitch(NikobusEntity, SwitchEntity, RestoreEntity):
         """Diff on the resolved on/off so an unchanged poll skips the write."""
         return self.is_on
 
+    def _update_signal(self) -> str:
+        """Wake on this channel's changes only."""
+        return channel_signal(self._address, self._channel)
+
+    def _state_group(self) -> int | None:
+        """The channel's byte lives in group 1 (channels 1-6) or 2 (7-12)."""
+        return 1 if self._channel <= 6 else 2
+
     @callback
     def _handle_button_operation(self) -> None:
         """A press impacted this module — drop optimistic state so the
@@ -231,7 +231,11 @@ class _Store:
 _mod("homeassistant.helpers.storage", Store=_Store)
 
 # homeassistant.helpers.event
-_mod("homeassistant.helpers.event", async_call_later=lambda *a, **kw: (lambda: None))
+_mod(
+    "homeassistant.helpers.event",
+    async_call_later=lambda *a, **kw: (lambda: None),
+    async_track_time_interval=lambda *a, **kw: (lambda: None),
+)
 
 # homeassistant.helpers.entity_platform
 _mod(
@@ -255,7 +259,18 @@ class _DataUpdateCoordinatorStub:
         pass
 
 
-class _CoordinatorEntityStub:
+class _EntityStub:
+    """Minimal stub for the Entity attributes the integration reads."""
+
+    hass = None
+    _attr_unique_id = None
+
+    @property
+    def unique_id(self):
+        return self._attr_unique_id
+
+
+class _CoordinatorEntityStub(_EntityStub):
     """Minimal stub for CoordinatorEntity."""
 
     available = True  # NikobusEntity.available reads super().available
@@ -319,6 +334,7 @@ _mod(
 )
 _mod(
     "homeassistant.const",
+    EVENT_HOMEASSISTANT_FINAL_WRITE="homeassistant_final_write",
     PERCENTAGE="%",
     EntityCategory=type("EntityCategory", (), {"DIAGNOSTIC": "diagnostic", "CONFIG": "config"}),
 )
@@ -329,7 +345,7 @@ _mod(
 )
 _mod("homeassistant.components.binary_sensor", BinarySensorEntity=type("BinarySensorEntity", (), {}), DOMAIN="binary_sensor")
 _mod("homeassistant.components.switch", SwitchEntity=type("SwitchEntity", (), {}), DOMAIN="switch")
-_mod("homeassistant.components.button", ButtonEntity=type("ButtonEntity", (), {}), DOMAIN="button")
+_mod("homeassistant.components.button", ButtonEntity=type("ButtonEntity", (_EntityStub,), {}), DOMAIN="button")
 _mod(
     "homeassistant.components.cover",
     CoverEntity=type("CoverEntity", (), {}),
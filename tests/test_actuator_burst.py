@@ -19,6 +19,7 @@ Pins:
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -84,25 +85,24 @@ def _events_of(actuator: NikobusActuator, event_type: str) -> list[dict]:
     ]
 
 
-def test_stop_cancels_inflight_tasks():
-    """stop() cancels in-flight release + refresh tasks and clears the maps."""
+@pytest.mark.asyncio
+async def test_stop_cancels_inflight_tasks():
+    """stop() cancels the release timer + refresh tasks and clears the maps."""
     actuator = _make_actuator()
 
-    release = MagicMock()
-    release.done.return_value = False
-    actuator._press_states["AA0000"] = PressState(
-        address="AA0000", press_start=0.0, last_press_time=0.0,
-        press_id="x", module_address=None, channel=None, release_task=release,
-    )
+    await actuator.handle_button_press("AA0000")
+    release = actuator._release_timer
+    assert release is not None
     refresh = MagicMock()
     refresh.done.return_value = False
     actuator._module_refresh_tasks["BB00_1"] = refresh
 
     actuator.stop()
 
-    release.cancel.assert_called_once()
+    assert release.cancelled()
     refresh.cancel.assert_called_once()
     assert actuator._press_states == {}
+    assert actuator._release_heap == []
     assert actuator._module_refresh_tasks == {}
 
 
@@ -389,3 +389,76 @@ async def test_short_tap_still_classified_as_short_press():
     assert len(_events_of(actuator, "nikobus_short_button_pressed")) == 1
     assert _events_of(actuator, "nikobus_long_button_pressed") == []
     assert _events_of(actuator, "nikobus_button_pressed_0")[0]["bucket"] == 0
+
+
+# ---------------------------------------------------------------------------
+# Release heap: one loop timer for every held button
+# ---------------------------------------------------------------------------
+
+
+class _RunningHass(_FakeHass):
+    """Run created tasks so the release handler actually executes."""
+
+    def async_create_task(self, coro):
+        if coro.__qualname__.endswith("button_discovery"):
+            return super().async_create_task(coro)
+        return asyncio.ensure_future(coro)
+
+
+def _running_actuator() -> NikobusActuator:
+    actuator = _make_actuator()
+    actuator._hass = _RunningHass()
+    return actuator
+
+
+@pytest.mark.asyncio
+async def test_concurrent_presses_share_one_release_timer():
+    actuator = _running_actuator()
+    await actuator.handle_button_press("C5E952")
+    timer = actuator._release_timer
+    await actuator.handle_button_press("C5E953")
+    await actuator.handle_button_press("C5E952")
+
+    # Later frames push deadlines out; the armed timer stays put.
+    assert actuator._release_timer is timer
+    assert len(actuator._release_heap) == 2
+
+
+@pytest.mark.asyncio
+async def test_release_fires_once_silence_reaches_threshold():
+    actuator = _running_actuator()
+    await actuator.handle_button_press("C5E952")
+    await asyncio.sleep(RELEASE_THRESHOLD_MS / 2000)
+    await actuator.handle_button_press("C5E952")  # still held
+    await asyncio.sleep(RELEASE_THRESHOLD_MS / 2000 + 0.01)
+    assert _events_of(actuator, "nikobus_button_released") == []
+    assert "C5E952" in actuator._press_states
+
+    await asyncio.sleep(RELEASE_THRESHOLD_MS / 2000 + 0.02)
+
+    released = _events_of(actuator, "nikobus_button_released")
+    assert len(released) == 1
+    assert released[0]["duration_s"] == pytest.approx(2 * FRAME_CADENCE_S)
+    assert actuator._press_states == {}
+    assert actuator._release_heap == []
+    assert actuator._release_timer is None
+
+
+@pytest.mark.asyncio
+async def test_frame_after_release_starts_a_new_press():
+    actuator = _running_actuator()
+    await actuator.handle_button_press("C5E952")
+    first = actuator._press_states["C5E952"].press_id
+    actuator._on_release_timer()  # not due yet: nothing released
+    assert actuator._press_states["C5E952"].press_id == first
+
+    actuator._press_states["C5E952"].last_press_time -= 10
+    actuator._press_states["C5E952"].release_deadline = None
+    actuator._release_heap.clear()
+    actuator._schedule_release(actuator._press_states["C5E952"])
+    actuator._on_release_timer()
+    await actuator.handle_button_press("C5E952")  # before the release task ran
+    await asyncio.sleep(0)
+
+    assert len(_events_of(actuator, "nikobus_button_released")) == 1
+    assert actuator._press_states["C5E952"].press_id != first
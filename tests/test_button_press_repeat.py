@@ -13,12 +13,14 @@ from unittest.mock import AsyncMock, patch
 
 from custom_components.nikobus.coordinator import NikobusDataCoordinator
 from custom_components.nikobus.const import DEFAULT_PRESS_REPEAT
+from custom_components.nikobus.nkbbusscheduler import NikobusBusScheduler
 
 
 def _coord(press_repeat=DEFAULT_PRESS_REPEAT):
     c = NikobusDataCoordinator.__new__(NikobusDataCoordinator)
     c._press_repeat = press_repeat
     c.nikobus_command = AsyncMock()
+    c.bus_scheduler = NikobusBusScheduler()
     return c
 
 
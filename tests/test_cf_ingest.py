@@ -84,8 +84,9 @@ class TestIngestCFBroadcasts(unittest.TestCase):
         self.assertEqual(len(stored["3880CA"]["outputs"]), 2)
         modes = {o["mode"] for o in stored["3880CA"]["outputs"]}
         self.assertEqual(modes, {"M02", "M03"})
-        # Save was actually issued.
+        # Save was actually issued, and lookups see the new store.
         coord.cf_storage.async_save.assert_awaited_once()
+        coord.rebuild_cf_trigger_index.assert_called_once()
 
     def test_light_scene_cf_lands_in_storage(self):
         """Light-scene CFs (button/IR-sourced, detected from a
@@ -12,9 +12,9 @@ from __future__ import annotations
 
 import asyncio
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from custom_components.nikobus.nkbstorage import NikobusCFStorage
+from custom_components.nikobus.nkbstorage import SAVE_DELAY, NikobusCFStorage
 
 
 def _run(coro):
@@ -121,11 +121,97 @@ class TestStorageSaveErrorHandling(unittest.TestCase):
         store = NikobusCFStorage(MagicMock())
         _run(store.async_load())
         store.data["nikobus_cf"]["3880CA"] = {"pattern": "roller_pair"}
-        store._store.async_save = MagicMock(side_effect=OSError("disk full"))
+        store._store.async_save = AsyncMock(side_effect=OSError("disk full"))
+        _run(store.async_save())
         with self.assertLogs(
             "custom_components.nikobus.nkbstorage", level="ERROR"
         ) as logs:
-            _run(store.async_save())  # must not raise
+            _run(store.async_flush())  # must not raise
         self.assertTrue(any("Failed to persist" in m for m in logs.output))
         # In-memory data untouched by the failure.
         self.assertIn("3880CA", store.data["nikobus_cf"])
+
+    def test_failed_write_is_retried_by_the_next_save(self):
+        store = NikobusCFStorage(MagicMock())
+        _run(store.async_load())
+        store.data["nikobus_cf"]["3880CA"] = {"pattern": "roller_pair"}
+        store._store.async_save = AsyncMock(side_effect=[OSError("disk full"), None])
+        _run(store.async_save())
+        with self.assertLogs("custom_components.nikobus.nkbstorage", level="ERROR"):
+            _run(store.async_flush())
+
+        # Same content, but it never reached the disk.
+        _run(store.async_save())
+        self.assertTrue(store.pending)
+        _run(store.async_flush())
+        self.assertEqual(store._store.async_save.await_count, 2)
+        _run(store.async_save())
+        self.assertFalse(store.pending)
+
+
+class TestStorageDelayedSave(unittest.TestCase):
+    def setUp(self):
+        patcher = patch(
+            "custom_components.nikobus.nkbstorage.async_call_later",
+            return_value=MagicMock(),
+        )
+        self.call_later = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _store(self):
+        store = NikobusCFStorage(MagicMock())
+        _run(store.async_load())
+        store._store.async_save = AsyncMock()
+        return store
+
+    def test_unchanged_dict_is_not_written(self):
+        store = self._store()
+        _run(store.async_save())
+        self.call_later.assert_not_called()
+        _run(store.async_flush())
+        store._store.async_save.assert_not_awaited()
+
+    def test_saves_coalesce_into_one_delayed_write(self):
+        store = self._store()
+        store.data["nikobus_cf"]["3880CA"] = {"pattern": "roller_pair"}
+        _run(store.async_save())
+        store.data["nikobus_cf"]["384102"] = {"pattern": "switch_pair"}
+        _run(store.async_save())
+
+        self.call_later.assert_called_once()
+        _hass, delay, action = self.call_later.call_args.args
+        self.assertEqual(delay, SAVE_DELAY)
+        _run(action(None))
+        # The write takes the dict as it is when it runs.
+        store._store.async_save.assert_awaited_once_with(store.data)
+        self.assertEqual(set(store.data["nikobus_cf"]), {"3880CA", "384102"})
+        # Its shutdown fallback is dropped with it.
+        store._hass.bus.async_listen_once.return_value.assert_called_once()
+
+        # Written: the same content again needs no write.
+        _run(store.async_save())
+        self.call_later.assert_called_once()
+
+    def test_flush_writes_a_pending_save_now(self):
+        store = self._store()
+        store.data["nikobus_cf"]["3880CA"] = {"pattern": "roller_pair"}
+        _run(store.async_save())
+        _run(store.async_flush())
+        store._store.async_save.assert_awaited_once_with(store.data)
+        self.call_later.return_value.assert_called_once()
+
+        _run(store.async_flush())
+        store._store.async_save.assert_awaited_once()
+
+    def test_final_write_runs_a_pending_save_at_shutdown(self):
+        store = self._store()
+        store.data["nikobus_cf"]["3880CA"] = {"pattern": "roller_pair"}
+        _run(store.async_save())
+        event, listener = store._hass.bus.async_listen_once.call_args.args
+        self.assertEqual(event, "homeassistant_final_write")
+
+        _run(listener(MagicMock()))
+        store._store.async_save.assert_awaited_once()
+        self.call_later.return_value.assert_called_once()
+        # The fired listener is not removed a second time.
+        store._hass.bus.async_listen_once.return_value.assert_not_called()
@@ -247,6 +247,7 @@ class TestSceneEditor(unittest.TestCase):
         entry.options = {}
         entry.data = {}
         flow.config_entry = entry
+        flow.hass = MagicMock()
         return flow, coord
 
     def test_manage_scenes_lists_existing_and_create(self):
@@ -278,6 +279,8 @@ class TestSceneEditor(unittest.TestCase):
         result = _run(flow.async_step_scene_editor({"action": "save"}))
         self.assertEqual(result["type"], "create_entry")
         coord.nikobus_config.save_json_data.assert_awaited_once()
+        # The new scene's entity is reconciled in, not reloaded.
+        coord.async_reconcile_entities.assert_called_once()
         scenes = coord.dict_scene_data["scene"]
         self.assertEqual(len(scenes), 1)
         self.assertEqual(scenes[0]["id"], "scene_tout_teindre")
@@ -286,6 +289,21 @@ class TestSceneEditor(unittest.TestCase):
             [{"module_id": "8110", "channel": "2", "state": "off"}],
         )
 
+    def test_save_with_changed_options_leaves_the_reconcile_to_the_listener(self):
+        flow, coord = self._flow_with_store()
+        flow._options = {"refresh_interval": 60}
+        _run(flow.async_step_manage_scenes({"scene": "__create__"}))
+        _run(flow.async_step_scene_editor({"description": "Nuit", "action": "add_member"}))
+        _run(flow.async_step_scene_member({"module": "8110", "channel": 1, "state": "off"}))
+
+        result = _run(flow.async_step_scene_editor({"action": "save"}))
+
+        self.assertEqual(result["type"], "create_entry")
+        self.assertEqual(result["data"], {"refresh_interval": 60})
+        # The update listener reloads or reconciles; a second reconcile
+        # from the flow would race it.
+        coord.async_reconcile_entities.assert_not_called()
+
     def test_member_validation_rejects_bad_state_and_channel(self):
         flow, _ = self._flow_with_store()
         _run(flow.async_step_manage_scenes({"scene": "__create__"}))
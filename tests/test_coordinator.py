@@ -6,12 +6,19 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from nikobus_connect.command import NikobusCommandHandler
 from nikobus_connect.discovery import InventoryQueryType
+from nikobus_connect.exceptions import NikobusConnectionError
 
 from custom_components.nikobus.const import (
     DISCOVERY_SUB_PHASE_IDENTITY,
     DISCOVERY_SUB_PHASE_INVENTORY,
 )
 from custom_components.nikobus.coordinator import NikobusDataCoordinator
+from custom_components.nikobus.nkbbusscheduler import (
+    BusPriority,
+    NikobusBusScheduler,
+)
+from custom_components.nikobus.nkbpollscheduler import NikobusPollScheduler
+from custom_components.nikobus.nkbstatetable import ModuleStateTable
 
 
 # ---------------------------------------------------------------------------
@@ -33,9 +40,10 @@ class _FakeCoord:
         # and exposes it through the ``nikobus_module_states`` read-only
         # property. The borrowed methods reach for ``self._module_states``
         # directly, so we set that as the source of truth here and alias
-        # ``nikobus_module_states`` to the same dict so assertions reading
+        # ``nikobus_module_states`` to the same table so assertions reading
         # either name see the same data.
-        self._module_states: dict = states or {}
+        self._module_states = ModuleStateTable()
+        self._module_states.update(states or {})
         self.nikobus_module_states = self._module_states
         self.dict_module_data: dict = module_data or {}
         # ``module_storage.data`` is the 0.4.0 flat store. Build it from the
@@ -61,6 +69,10 @@ class _FakeCoord:
             listener=MagicMock(),
             module_states=self._module_states,
         )
+        self._poll_pipeline_depth = 4
+        self._blackout_streak = 3
+        self._poll_scheduler = _scheduler()
+        self.bus_scheduler = NikobusBusScheduler()
 
     async def async_event_handler(self, event: str, data: dict) -> None:
         pass  # no-op for unit tests
@@ -75,6 +87,12 @@ class _FakeCoord:
     _refresh_module_type = NikobusDataCoordinator._refresh_module_type
 
 
+def _scheduler():
+    return NikobusPollScheduler(
+        120, min_interval=30, max_interval=960, budget_share=0.2, read_cost=0.2
+    )
+
+
 def _coord(states=None, module_data=None):
     return _FakeCoord(states=states, module_data=module_data)
 
@@ -508,7 +526,6 @@ class TestPurgeInventoryAddresses(unittest.IsolatedAsyncioTestCase):
         coord.config_entry.entry_id = "entry_test"
         coord.hass = MagicMock()
         coord.hass.data = {}
-        coord.hass.config_entries.async_reload = MagicMock()
         coord.hass.async_create_task = MagicMock()
 
         coord.purge_inventory_addresses = lambda addrs, self_=coord: \
@@ -529,6 +546,9 @@ class TestPurgeInventoryAddresses(unittest.IsolatedAsyncioTestCase):
         coord.button_storage.async_save.assert_awaited_once()
         coord._rebuild_dict_module_data.assert_called_once()
         coord.hass.async_create_task.assert_called_once()
+        # Entities for the purged address are reconciled away in place.
+        coord.async_reconcile_entities.assert_called_once()
+        coord.hass.config_entries.async_reload.assert_not_called()
 
     async def test_removes_button_address(self):
         coord = self._make_coordinator_stub()
@@ -1817,7 +1837,14 @@ class TestBlackoutAutoRecovery(unittest.IsolatedAsyncioTestCase):
         coord.discovery_running = False
         coord._stopping = False
         coord.dict_module_data = modules
-        coord._module_states = {}
+        coord._module_states = ModuleStateTable()
+        coord._poll_pipeline_depth = 4
+        coord._blackout_streak = 3
+        coord.blackouts_detected = 0
+        coord.last_blackout_detect_time = None
+        coord._poll_tick = 30
+        coord._poll_scheduler = _scheduler()
+        coord.bus_scheduler = NikobusBusScheduler()
         coord.nikobus_command = MagicMock()
         coord.nikobus_command.get_output_state = AsyncMock(
             side_effect=get_output_state_side_effect
@@ -1840,11 +1867,19 @@ class TestBlackoutAutoRecovery(unittest.IsolatedAsyncioTestCase):
         # actually runs against the mocked get_output_state. The
         # unbound staticmethod-style call hands ``coord`` in as self.
         coord._refresh_module_type = (
-            lambda md, _coord=coord:
-            NikobusDataCoordinator._refresh_module_type(_coord, md)
+            lambda md, plan=None, _coord=coord:
+            NikobusDataCoordinator._refresh_module_type(_coord, md, plan)
         )
         return coord
 
+    @staticmethod
+    def _answered_before(coord, *addresses):
+        """Mark the modules' groups as read once and due again."""
+        for address in addresses:
+            for group in (1, 2):
+                coord._poll_scheduler.record(address, group, changed=False)
+                coord._poll_scheduler._groups[(address, group)].next_due = 0.0
+
     async def test_total_blackout_triggers_reconnect(self):
         # Every poll fails → reconnect kicked.
         from nikobus_connect.exceptions import NikobusTimeoutError
@@ -1855,6 +1890,7 @@ class TestBlackoutAutoRecovery(unittest.IsolatedAsyncioTestCase):
             }},
             get_output_state_side_effect=NikobusTimeoutError("timeout"),
         )
+        self._answered_before(coord, "8110", "1CEC")
 
         await NikobusDataCoordinator._async_update_data(coord)
 
@@ -1921,6 +1957,148 @@ class TestBlackoutAutoRecovery(unittest.IsolatedAsyncioTestCase):
         coord.hass.async_create_background_task.assert_not_called()
         coord.nikobus_command.get_output_state.assert_not_called()
 
+    async def test_single_failed_read_does_not_trigger_reconnect(self):
+        # A tick with one due group that times out once is not a blackout.
+        from nikobus_connect.exceptions import NikobusTimeoutError
+        coord = self._make_coord(
+            modules={"switch_module": {"8110": {"channels": [{}, {}]}}},
+            get_output_state_side_effect=NikobusTimeoutError("timeout"),
+        )
+
+        await NikobusDataCoordinator._async_update_data(coord)
+
+        coord.hass.async_create_background_task.assert_not_called()
+        coord._handle_connection_lost.assert_not_called()
+
+    async def test_failure_streak_across_ticks_triggers_reconnect(self):
+        from nikobus_connect.exceptions import NikobusTimeoutError
+        coord = self._make_coord(
+            modules={"switch_module": {"8110": {"channels": [{}, {}]}}},
+            get_output_state_side_effect=NikobusTimeoutError("timeout"),
+        )
+        self._answered_before(coord, "8110")
+
+        for _ in range(2):
+            await NikobusDataCoordinator._async_update_data(coord)
+        coord.hass.async_create_background_task.assert_not_called()
+
+        await NikobusDataCoordinator._async_update_data(coord)
+        coord.hass.async_create_background_task.assert_called_once()
+
+    async def test_success_between_failures_resets_streak(self):
+        from nikobus_connect.exceptions import NikobusTimeoutError
+        coord = self._make_coord(
+            modules={"switch_module": {"8110": {"channels": [{}, {}]}}},
+            get_output_state_side_effect=[
+                NikobusTimeoutError("timeout"),
+                NikobusTimeoutError("timeout"),
+                "0000FFFF0000",
+                NikobusTimeoutError("timeout"),
+                NikobusTimeoutError("timeout"),
+            ],
+        )
+
+        for _ in range(5):
+            await NikobusDataCoordinator._async_update_data(coord)
+            # Make the group due again on the next tick.
+            coord._poll_scheduler._groups[("8110", 1)].next_due = 0.0
+
+        coord.hass.async_create_background_task.assert_not_called()
+
+    async def test_blackout_aborts_rest_of_sweep(self):
+        # 6 modules x 2 groups all time out; the sweep stops at the
+        # third failure instead of waiting out every read.
+        from nikobus_connect.exceptions import NikobusTimeoutError
+        calls = 0
+
+        async def _silent(*args, **kw):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            raise NikobusTimeoutError("timeout")
+
+        coord = self._make_coord(
+            modules={"switch_module": {
+                f"81{i}0": {"channels": [{}] * 12} for i in range(6)
+            }},
+        )
+        coord._poll_pipeline_depth = 1
+        coord.nikobus_command.get_output_state = AsyncMock(side_effect=_silent)
+        self._answered_before(coord, *(f"81{i}0" for i in range(6)))
+
+        await NikobusDataCoordinator._async_update_data(coord)
+
+        self.assertEqual(calls, 3)
+        self.assertEqual(coord.last_poll_reads, 3)
+        coord.hass.async_create_background_task.assert_called_once()
+        self.assertEqual(coord.blackouts_detected, 1)
+        self.assertIsNotNone(coord.last_blackout_detect_time)
+        self.assertGreaterEqual(coord.last_blackout_detect_time, 0.0)
+
+    async def test_blackout_cancels_reads_in_flight(self):
+        from nikobus_connect.exceptions import NikobusTimeoutError
+        hung = asyncio.Event()
+        calls = 0
+
+        async def _read(address, group):
+            nonlocal calls
+            calls += 1
+            if address == "8110":
+                await asyncio.sleep(0)
+                raise NikobusTimeoutError("timeout")
+            await hung.wait()  # never answered
+            return "0000FFFF0000"
+
+        coord = self._make_coord(
+            modules={"switch_module": {
+                "8110": {"channels": [{}] * 12},
+                "8120": {"channels": [{}] * 12},
+            }},
+        )
+        coord._blackout_streak = 2
+        coord.nikobus_command.get_output_state = AsyncMock(side_effect=_read)
+        self._answered_before(coord, "8110", "8120")
+
+        await asyncio.wait_for(
+            NikobusDataCoordinator._async_update_data(coord), 1.0
+        )
+
+        self.assertEqual(calls, 4)
+        coord.hass.async_create_background_task.assert_called_once()
+        self.assertEqual(coord.bus_scheduler.stats()["poll"]["in_flight"], 0)
+
+    async def test_absent_modules_do_not_starve_live_ones(self):
+        # Two powered-off 12-channel modules never answer; the live one
+        # does. Their failures are no blackout, and after the first
+        # sweep they back off instead of heading every tick.
+        from nikobus_connect.exceptions import NikobusTimeoutError
+        reads: list[str] = []
+
+        async def _read(address, group):
+            reads.append(address)
+            await asyncio.sleep(0)
+            if address in ("DEA1", "DEA2"):
+                raise NikobusTimeoutError("timeout")
+            return "0000FFFF0000"
+
+        coord = self._make_coord(
+            modules={"switch_module": {
+                "DEA1": {"channels": [{}] * 12},
+                "DEA2": {"channels": [{}] * 12},
+                "8110": {"channels": [{}] * 6},
+            }},
+        )
+        coord.nikobus_command.get_output_state = AsyncMock(side_effect=_read)
+
+        for _ in range(3):
+            await NikobusDataCoordinator._async_update_data(coord)
+            # The live module falls due again every tick.
+            coord._poll_scheduler._groups[("8110", 1)].next_due = 0.0
+
+        coord.hass.async_create_background_task.assert_not_called()
+        self.assertEqual(reads.count("8110"), 3)
+        self.assertEqual(reads.count("DEA1") + reads.count("DEA2"), 4)
+
     async def test_stopping_does_not_trigger_reconnect(self):
         # If the integration is shutting down, blackout-recovery
         # should NOT kick — we're going away anyway.
@@ -2109,6 +2287,260 @@ class TestRefreshModuleTypeDispatch(unittest.TestCase):
         c.async_event_handler.assert_not_awaited()
 
 
+class TestChangedChannelDispatch(unittest.IsolatedAsyncioTestCase):
+    """A refresh wakes the channels whose bytes changed, then the module."""
+
+    def _coord(self):
+        coord = MagicMock()
+        coord._module_states = ModuleStateTable()
+        coord._module_states.ensure("C1C7")
+        return coord
+
+    @patch("custom_components.nikobus.coordinator.async_dispatcher_send")
+    async def test_one_toggle_wakes_one_channel(self, mock_send):
+        coord = self._coord()
+        coord._module_states.write_group("C1C7", 2, "00FF00000000")
+
+        await NikobusDataCoordinator.async_event_handler(
+            coord, "nikobus_refreshed", {"impacted_module_address": "C1C7"}
+        )
+
+        self.assertEqual(
+            [c.args[1] for c in mock_send.call_args_list],
+            ["nikobus_update_C1C7_8", "nikobus_update_C1C7"],
+        )
+
+    @patch("custom_components.nikobus.coordinator.async_dispatcher_send")
+    async def test_refresh_without_a_change_wakes_nobody(self, mock_send):
+        coord = self._coord()
+        coord._module_states.write_group("C1C7", 1, "FF0000000000")
+        await NikobusDataCoordinator.async_event_handler(
+            coord, "nikobus_refreshed", {"impacted_module_address": "C1C7"}
+        )
+        mock_send.reset_mock()
+
+        await NikobusDataCoordinator.async_event_handler(
+            coord, "nikobus_refreshed", {"impacted_module_address": "C1C7"}
+        )
+        mock_send.assert_not_called()
+
+
+class TestPipelinedPoll(unittest.IsolatedAsyncioTestCase):
+    """The poll sweep keeps up to ``_poll_pipeline_depth`` reads in flight."""
+
+    def _coord_with_gate(self, depth):
+        c = _coord(states={})
+        c._poll_pipeline_depth = depth
+        c.async_event_handler = AsyncMock()
+        gate = asyncio.Event()
+        state = {"in_flight": 0, "peak": 0}
+
+        async def _get(address, group):
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            await gate.wait()
+            state["in_flight"] -= 1
+            return "0102030405060708090A0B0C"
+
+        c.nikobus_command.get_output_state = _get
+        return c, gate, state
+
+    async def _sweep(self, c, gate, modules):
+        task = asyncio.ensure_future(c._refresh_module_type(modules))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        gate.set()
+        return await task
+
+    async def test_window_bounds_reads_in_flight(self):
+        c, gate, state = self._coord_with_gate(depth=3)
+        modules = {f"C1C{i}": {"channels": [1] * 12} for i in range(4)}
+
+        polled, failed = await self._sweep(c, gate, modules)
+
+        self.assertEqual((polled, failed), (8, 0))
+        self.assertEqual(state["peak"], 3)
+        # Every module changed (empty -> real) and is woken exactly once.
+        self.assertEqual(c.async_event_handler.await_count, 4)
+
+    async def test_depth_one_reads_serially(self):
+        c, gate, state = self._coord_with_gate(depth=1)
+        modules = {"C1C7": {"channels": [1] * 12}, "C1C8": {"channels": [1]}}
+
+        polled, _ = await self._sweep(c, gate, modules)
+
+        self.assertEqual(polled, 3)
+        self.assertEqual(state["peak"], 1)
+
+    async def test_failed_read_releases_its_slot(self):
+        c = _coord(states={})
+        c._poll_pipeline_depth = 2
+        c.async_event_handler = AsyncMock()
+        gate = asyncio.Event()
+        state = {"in_flight": 0, "peak": 0, "done": []}
+
+        async def _get(address, group):
+            state["in_flight"] += 1
+            state["peak"] = max(state["peak"], state["in_flight"])
+            await gate.wait()
+            state["in_flight"] -= 1
+            if (address, group) == ("C1C0", 1):
+                raise TimeoutError("no answer")
+            state["done"].append((address, group))
+            return "0102030405060708090A0B0C"
+
+        c.nikobus_command.get_output_state = _get
+        modules = {f"C1C{i}": {"channels": [1] * 12} for i in range(3)}
+
+        polled, failed = await self._sweep(c, gate, modules)
+
+        # The failing read sat in a full window; the other five still ran.
+        self.assertEqual((polled, failed), (6, 1))
+        self.assertEqual(state["peak"], 2)
+        self.assertEqual(len(state["done"]), 5)
+        self.assertEqual(state["in_flight"], 0)
+        # C1C0's group 2 still changed, so every module is woken.
+        self.assertEqual(c.async_event_handler.await_count, 3)
+        self.assertEqual(bytes(c._module_states["C1C0"][:6]), bytes(6))
+
+    async def test_sweep_yields_to_interactive_commands(self):
+        c = _coord(states={})
+        c.async_event_handler = AsyncMock()
+        c.nikobus_command.get_output_state = AsyncMock(
+            return_value="0102030405060708090A0B0C"
+        )
+        await c.bus_scheduler.acquire(BusPriority.INTERACTIVE)
+
+        task = asyncio.ensure_future(
+            c._refresh_module_type({"C1C7": {"channels": [1] * 12}})
+        )
+        for _ in range(5):
+            await asyncio.sleep(0)
+        c.nikobus_command.get_output_state.assert_not_awaited()
+
+        c.bus_scheduler.release(BusPriority.INTERACTIVE)
+        self.assertEqual(await task, (2, 0))
+        self.assertEqual(c.bus_scheduler.stats()["poll"]["delayed"], 2)
+
+    async def test_update_records_cycle_wall_time(self):
+        c = MagicMock()
+        c.discovery_running = False
+        c._stopping = False
+        c.dict_module_data = {
+            "switch_module": {"C1C7": {"channels": [1, 2]}},
+            "roller_module": {"C1C8": {"channels": [1, 2]}},
+        }
+        c._poll_tick = 30
+        c._blackout_streak = 3
+        c._poll_scheduler = _scheduler()
+        c._refresh_module_type = AsyncMock(return_value=(2, 1))
+
+        with self.assertLogs(
+            "custom_components.nikobus.coordinator", level="DEBUG"
+        ) as logs:
+            await NikobusDataCoordinator._async_update_data(c)
+
+        # Both module types go through one pipelined pass.
+        c._refresh_module_type.assert_awaited_once()
+        self.assertEqual(
+            set(c._refresh_module_type.await_args.args[0]), {"C1C7", "C1C8"}
+        )
+        self.assertEqual(c.last_poll_reads, 2)
+        self.assertGreaterEqual(c.last_poll_duration, 0.0)
+        self.assertLess(c.last_poll_duration, 1.0)
+        self.assertTrue(
+            any("2 reads (1 failed" in line for line in logs.output), logs.output
+        )
+
+
+class TestAdaptivePollFeeds(unittest.IsolatedAsyncioTestCase):
+    """Updates outside the poll sweep keep a busy group's interval short."""
+
+    async def test_press_refresh_then_same_poll_does_not_back_off(self):
+        c = _coord(states={"C1C7": bytearray(12)})
+        c.async_event_handler = AsyncMock()
+        bus = {"C1C7": "AABBCCDDEEFF", "C1C8": "AABBCCDDEEFF"}
+        c.nikobus_command.get_output_state = AsyncMock(
+            side_effect=lambda address, group: bus[address]
+        )
+        modules = {"C1C7": {"channels": [1] * 6}, "C1C8": {"channels": [1] * 6}}
+        c._module_states["C1C8"] = bytearray.fromhex("AABBCCDDEEFF") + bytes(6)
+        c._module_states["C1C7"][:6] = bytes.fromhex("AABBCCDDEEFF")
+        await c._refresh_module_type(modules)
+        groups = c._poll_scheduler._groups
+        self.assertEqual(groups[("C1C7", 1)].interval, 240)
+
+        # A press changes C1C7; the actuator's refresh stores it first.
+        c.set_bytearray_group_state("C1C7", "1", "112233445566", confirmed=True)
+        self.assertEqual(groups[("C1C7", 1)].interval, 120)
+        bus["C1C7"] = "112233445566"
+        await c._refresh_module_type(modules)
+
+        # The poll saw the already-stored bytes but keeps the busy
+        # group's interval; the untouched module keeps backing off.
+        self.assertEqual(groups[("C1C7", 1)].interval, 120)
+        self.assertEqual(groups[("C1C8", 1)].interval, 480)
+
+    async def test_feedback_frame_is_reported_to_scheduler(self):
+        c = _coord(states={"C1C7": bytearray(12)})
+        await c._feedback_callback(1, _feedback_frame("C7C1", "AABBCCDDEEFF"))
+        entry = c._poll_scheduler._groups[("C1C7", 1)]
+        self.assertEqual(entry.changes, 1)
+        self.assertEqual(entry.interval, 60)
+        self.assertIsNotNone(entry.last_confirmed)
+
+    async def test_own_write_is_a_change_but_not_a_confirmation(self):
+        c = _coord(states={"C1C7": bytearray(12)})
+        c.set_bytearray_group_state("C1C7", 1, "AABBCCDDEEFF")
+        entry = c._poll_scheduler._groups[("C1C7", 1)]
+        self.assertEqual(entry.changes, 1)
+        self.assertIsNone(entry.last_confirmed)
+
+    async def test_press_refreshed_group_is_skipped_by_next_poll(self):
+        c = MagicMock()
+        c.discovery_running = False
+        c._stopping = False
+        c.dict_module_data = {"switch_module": {
+            "C1C7": {"channels": [1, 2]}, "C1C8": {"channels": [1, 2]},
+        }}
+        c._poll_tick = 30
+        c._poll_scheduler = NikobusPollScheduler(
+            120, min_interval=30, max_interval=960, budget_share=0.2,
+            read_cost=0.2, freshness_window=20,
+        )
+        for address in ("C1C7", "C1C8"):
+            c._poll_scheduler.record(address, 1, changed=False)
+            entry = c._poll_scheduler._groups[(address, 1)]
+            entry.next_due = entry.last_confirmed = 0.0
+        # The actuator's settled read just confirmed C1C7.
+        c._poll_scheduler.observe("C1C7", 1, changed=False, confirmed=True)
+        c._refresh_module_type = AsyncMock(return_value=(1, 0))
+
+        await NikobusDataCoordinator._async_update_data(c)
+
+        self.assertEqual(
+            c._refresh_module_type.await_args.args[1], {"C1C8": (1,)}
+        )
+        self.assertEqual(c._poll_scheduler.stats()["skipped_fresh_total"], 1)
+
+    async def test_idle_tick_leaves_listeners_alone(self):
+        c = MagicMock()
+        c.discovery_running = False
+        c._stopping = False
+        c.dict_module_data = {"switch_module": {"C1C7": {"channels": [1, 2]}}}
+        c._poll_tick = 30
+        c._poll_scheduler = _scheduler()
+        c._poll_scheduler.record("C1C7", 1, changed=False)
+        c._refresh_module_type = AsyncMock(return_value=(1, 0))
+        c.last_poll_reads = 5
+
+        await NikobusDataCoordinator._async_update_data(c)
+
+        c._refresh_module_type.assert_not_awaited()
+        c.async_update_listeners.assert_not_called()
+        self.assertEqual(c.last_poll_reads, 0)
+
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -2167,3 +2599,203 @@ class TestSurfaceCorruptModules(unittest.TestCase):
         NikobusDataCoordinator._surface_corrupt_modules(coord)
         mock_create.assert_not_called()
         mock_delete.assert_called_once()
+
+
+class TestCalibrateCover(unittest.IsolatedAsyncioTestCase):
+    """async_calibrate_cover stores the fitted times and tells the cover."""
+
+    def _coord(self):
+        coord = MagicMock()
+        coord.module_storage.data = {
+            "nikobus_module": {
+                "9105": {
+                    "module_type": "roller_module",
+                    "channels": [{"description": "Kitchen"}, {"description": "Hall"}],
+                }
+            }
+        }
+        coord.calibrating = set()
+        coord.async_on_module_save = AsyncMock()
+        coord.address_label = lambda addr: addr
+        return coord
+
+    @patch("custom_components.nikobus.coordinator.async_dispatcher_send")
+    @patch("custom_components.nikobus.coordinator.time_travel")
+    async def test_persists_fitted_times_and_signals_cover(self, mock_travel, mock_send):
+        from custom_components.nikobus.nkbcalibrate import TravelSample
+
+        mock_travel.side_effect = [
+            TravelSample("opening", 0.3, 24.04),
+            TravelSample("closing", 0.3, 22.96),
+        ]
+        coord = self._coord()
+
+        fit = await NikobusDataCoordinator.async_calibrate_cover(coord, "9105", 2)
+
+        self.assertEqual((fit.time_up, fit.time_down, fit.runs), (24.04, 22.96, 2))
+        channel = coord.module_storage.data["nikobus_module"]["9105"]["channels"][1]
+        self.assertEqual(channel["operation_time_up"], "24.0")
+        self.assertEqual(channel["operation_time_down"], "23.0")
+        coord.async_on_module_save.assert_awaited_once()
+        mock_send.assert_called_once_with(
+            coord.hass, "nikobus_calibrated_9105", 2, 24.04, 22.96
+        )
+        self.assertEqual(coord.calibrating, set())
+
+    @patch("custom_components.nikobus.coordinator.time_travel")
+    async def test_failed_run_stores_nothing(self, mock_travel):
+        from custom_components.nikobus.nkbcalibrate import CalibrationError
+
+        mock_travel.side_effect = CalibrationError("channel never started moving")
+        coord = self._coord()
+
+        with self.assertRaises(CalibrationError):
+            await NikobusDataCoordinator.async_calibrate_cover(coord, "9105", 1)
+
+        self.assertNotIn(
+            "operation_time_up",
+            coord.module_storage.data["nikobus_module"]["9105"]["channels"][0],
+        )
+        coord.async_on_module_save.assert_not_awaited()
+        self.assertEqual(coord.calibrating, set())
+
+
+class TestEntityReconcile(unittest.IsolatedAsyncioTestCase):
+    """Store changes reconcile entities in place instead of reloading."""
+
+    async def test_reconciles_every_platform_then_cleans_orphans(self):
+        coord = MagicMock()
+        coord._reconcile_lock = asyncio.Lock()
+        lights = MagicMock(async_reconcile=AsyncMock(return_value=(2, 0)))
+        scenes = MagicMock(async_reconcile=AsyncMock(return_value=(0, 1)))
+        coord._platform_entities = {"light": lights, "scene": scenes}
+
+        with patch(
+            "custom_components.nikobus._async_cleanup_orphan_entities",
+            AsyncMock(),
+        ) as cleanup:
+            await NikobusDataCoordinator.async_reconcile_entities(coord)
+
+        coord._invalidate_routing_cache.assert_called_once()
+        coord._initialize_module_states.assert_called_once()
+        lights.async_reconcile.assert_awaited_once()
+        scenes.async_reconcile.assert_awaited_once()
+        cleanup.assert_awaited_once_with(coord.hass, coord.config_entry, coord)
+        coord.hass.config_entries.async_reload.assert_not_called()
+
+    async def test_options_update_reloads_only_for_new_settings(self):
+        from custom_components.nikobus import _async_options_updated
+
+        hass = MagicMock()
+        entry = MagicMock()
+        entry.data = {"connection_string": "/dev/ttyUSB0"}
+        entry.options = {"refresh_interval": 120}
+        entry.runtime_data.applied_config = {
+            "connection_string": "/dev/ttyUSB0", "refresh_interval": 120,
+        }
+
+        await _async_options_updated(hass, entry)
+        entry.runtime_data.async_reconcile_entities.assert_called_once()
+        hass.config_entries.async_reload.assert_not_called()
+
+        entry.options = {"refresh_interval": 60}
+        await _async_options_updated(hass, entry)
+        hass.config_entries.async_reload.assert_called_once_with(entry.entry_id)
+
+
+class TestStartupPipeline(unittest.IsolatedAsyncioTestCase):
+    """Stores load concurrently with each other and with the transport."""
+
+    def _coord(self):
+        coord = NikobusDataCoordinator.__new__(NikobusDataCoordinator)
+        coord.hass = MagicMock()
+        coord.tasks = []
+
+        def _create_task(coro):
+            task = asyncio.ensure_future(coro)
+            coord.tasks.append(task)
+            return task
+
+        coord.hass.async_create_task = _create_task
+        coord.startup_timings = {}
+        return coord
+
+    async def test_stores_load_concurrently(self):
+        coord = self._coord()
+        started: list[str] = []
+        all_started = asyncio.Event()
+
+        async def _load(name, result=None):
+            started.append(name)
+            if len(started) == 5:
+                all_started.set()
+            # A sequential load would wait here forever.
+            await all_started.wait()
+            return result
+
+        coord.dict_module_data = {}
+        coord.module_storage = MagicMock(async_load=lambda: _load("modules"))
+        coord.module_storage.data = {"nikobus_module": {"C1C7": {"module_type": "switch_module"}}}
+        coord.button_storage = MagicMock(
+            async_load=lambda: _load("buttons", {"nikobus_button": {}})
+        )
+        coord.cf_storage = MagicMock(async_load=lambda: _load("cf"))
+        coord.cf_storage.data = {"nikobus_cf": {}}
+        coord.nikobus_config = MagicMock(
+            load_json_data=lambda *a: _load("scenes", {"scene": []})
+        )
+        coord.state_storage = MagicMock(async_load=lambda: _load("state"))
+        coord._warn_if_legacy_config_files_present = AsyncMock()
+
+        await asyncio.wait_for(coord._async_load_stores(), 1)
+
+        self.assertCountEqual(started, ["modules", "buttons", "cf", "scenes", "state"])
+        self.assertIn("C1C7", coord.dict_module_data["switch_module"])
+        self.assertEqual(coord.dict_button_data, {"nikobus_button": {}})
+        self.assertEqual(coord.dict_scene_data, {"scene": []})
+        self.assertIn("stores", coord.startup_timings)
+
+    async def test_snapshot_restores_and_orders_the_first_sweep(self):
+        c = MagicMock()
+        c._module_states = ModuleStateTable()
+        c._module_states.ensure("C1C7")
+        c._module_states.ensure("C1C8")
+        c._poll_scheduler = _scheduler()
+        c.state_storage.data = {"nikobus_state": {
+            "C1C7": {"state": "ff" * 12, "confirmed": 2000.0},
+            "C1C8": {"state": "00" * 12, "confirmed": 1000.0},
+        }}
+
+        NikobusDataCoordinator._restore_snapshot(c)
+
+        self.assertEqual(c._module_states["C1C7"], bytes([0xFF] * 12))
+        self.assertEqual(c.restored_snapshot.modules, 2)
+
+        c.discovery_running = False
+        c._stopping = False
+        c.dict_module_data = {"switch_module": {
+            "C1C7": {"channels": [1] * 6}, "C1C8": {"channels": [1] * 6},
+        }}
+        c._poll_tick = 30
+        c._blackout_streak = 3
+        c._refresh_module_type = AsyncMock(return_value=(2, 0))
+        await NikobusDataCoordinator._async_update_data(c)
+
+        # C1C8's snapshot is older, so it is read first.
+        self.assertEqual(
+            list(c._refresh_module_type.await_args.args[0]), ["C1C8", "C1C7"]
+        )
+
+    async def test_transport_failure_cancels_the_store_load(self):
+        coord = self._coord()
+        coord._async_load_stores = lambda: asyncio.Event().wait()
+        coord.nikobus_connection = MagicMock(
+            connect=AsyncMock(side_effect=NikobusConnectionError("down"))
+        )
+
+        with self.assertRaises(NikobusConnectionError):
+            await coord.connect()
+
+        (load,) = coord.tasks
+        self.assertTrue(load.cancelled())
+        self.assertIn("transport", coord.startup_timings)
@@ -4,7 +4,7 @@ cover.py is the integration's most complex, stateful code (time-based
 position dead-reckoning, motor-protection handling, HA-vs-Nikobus move
 sourcing) and previously had no direct test coverage. These tests pin
 the current behavior so the file can be refactored safely later. They
-deliberately avoid the live 0.5s motion loop (timing-flaky) and instead
+deliberately avoid the live motion engine timers (timing-flaky) and instead
 exercise the calculator, the pure helpers, the properties, and the
 state-machine transitions with the scheduled tasks mocked out.
 """
@@ -12,8 +12,9 @@ state-machine transitions with the scheduled tasks mocked out.
 from __future__ import annotations
 
 import asyncio
+from datetime import datetime, timezone
 import unittest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 from custom_components.nikobus.const import CATEGORY_CENTRAL_FUNCTIONS, DOMAIN
 from custom_components.nikobus.cover import (
@@ -26,6 +27,8 @@ from custom_components.nikobus.cover import (
     STATE_CLOSING,
     STATE_ERROR,
 )
+from custom_components.nikobus.entity import NikobusEntity
+from custom_components.nikobus.nkbdispatch import dispatch_module_writes
 from custom_components.nikobus.nkbtravelcalculator import NikobusTravelCalculator
 
 _MONO = "custom_components.nikobus.nkbtravelcalculator.time.monotonic"
@@ -107,6 +110,17 @@ class TestTravelCalculator(unittest.TestCase):
             clock["t"] = 9999.0  # time moves on, but we're stopped
             self.assertEqual(c.current_position(), 50.0)
 
+    def test_time_to_position_is_linear(self):
+        c = NikobusTravelCalculator(20, 10)
+        c.set_position(10)
+        clock = {"t": 0.0}
+        with patch(_MONO, lambda: clock["t"]):
+            self.assertIsNone(c.time_to_position(50))  # not travelling
+            c.start_travel("opening")
+            clock["t"] = 2.0  # 10% further: at 20
+            self.assertAlmostEqual(c.time_to_position(50), 6.0)
+            self.assertIsNone(c.time_to_position(5))  # behind us
+
     def test_zero_active_time_guard(self):
         c = NikobusTravelCalculator(0, 0)
         c.set_position(50)
@@ -144,6 +158,8 @@ def _make_cover(op_up=10.0, op_down=10.0):
     coord.api.close_cover = AsyncMock()
     coord.api.stop_cover = AsyncMock()
     coord.set_bytearray_state = MagicMock()
+    coord.motion_engine.stop_lead = 0.0
+    coord.restored_cover_position.return_value = None
     ent = NikobusCoverEntity(
         coord, "9105", 1, "Shutter 1", "Roller module", "05-001", op_up, op_down
     )
@@ -207,6 +223,97 @@ class TestShouldStop(unittest.TestCase):
         self.assertFalse(ent._should_stop())
 
 
+class TestMotionEngineHandoff(unittest.TestCase):
+    def test_target_move_tracks_exact_stop_deadline(self):
+        ent, coord = _make_cover(op_up=20.0)
+        ent._position = 0.0
+        ent._calculator.set_position(0.0)
+        ent._target_position = 25
+        ent._start_motion_logic("opening")
+        key, delay, on_deadline, on_tick = coord.motion_engine.track.call_args.args
+        self.assertIs(key, ent)
+        self.assertAlmostEqual(delay, 5.0, places=2)  # 25% of 20 s
+        self.assertEqual(on_deadline, ent._on_motion_deadline)
+        self.assertEqual(on_tick, ent._on_motion_tick)
+
+    def test_untargeted_move_runs_to_end_stop_limit(self):
+        ent, coord = _make_cover(op_down=10.0)
+        ent._start_motion_logic("closing")
+        delay = coord.motion_engine.track.call_args.args[1]
+        self.assertEqual(delay, ent._current_run_limit)
+
+    def test_deadline_snaps_to_target_and_stops(self):
+        ent, _ = _make_cover()
+        ent._state = STATE_OPENING
+        ent._movement_source = "ha"
+        ent._target_position = 40
+        ent._stop = AsyncMock()
+        ent._on_motion_deadline()
+        self.assertEqual(ent._position, 40.0)
+        self.assertEqual(ent._calculator.current_position(), 40.0)
+        ent.hass.async_create_task.assert_called_once()
+        self.assertTrue(ent._stop.call_args.kwargs["send_stop"])
+        self.assertTrue(callable(ent._stop.call_args.kwargs["on_sent"]))
+
+    def test_target_deadline_is_brought_forward_by_stop_lead(self):
+        ent, coord = _make_cover(op_up=20.0)
+        ent._calculator.set_position(0.0)
+        ent._target_position = 25
+        coord.motion_engine.stop_lead = 0.4
+        ent._start_motion_logic("opening")
+        delay = coord.motion_engine.track.call_args.args[1]
+        self.assertAlmostEqual(delay, 5.0 - 0.4, places=2)
+
+    def test_stop_answer_records_latency_and_positioning_error(self):
+        ent, coord = _make_cover(op_up=10.0)
+        clock = {"t": 100.0}
+        with patch(_MONO, lambda: clock["t"]), patch(
+            "custom_components.nikobus.cover.time.monotonic", lambda: clock["t"]
+        ):
+            ent._calculator.set_position(0.0)
+            ent._target_position = 50
+            ent._movement_source = "ha"
+            ent._start_motion_logic("opening")
+            clock["t"] = 104.8  # deadline, issued early at 48 %
+            ent._stop = AsyncMock()
+            ent._on_motion_deadline()
+            on_sent = ent._stop.call_args.kwargs["on_sent"]
+            ent._state = STATE_STOPPED
+            clock["t"] = 105.1  # frame answered 0.3 s later
+            _run(on_sent())
+        coord.motion_engine.record_stop_latency.assert_called_once()
+        self.assertAlmostEqual(
+            coord.motion_engine.record_stop_latency.call_args.args[0], 0.3
+        )
+        self.assertAlmostEqual(ent._position, 51.0)
+        attrs = ent.extra_state_attributes
+        self.assertEqual(attrs["positioning_error"], 1.0)
+        self.assertEqual(attrs["positioning_error_mean"], 1.0)
+
+    def test_stop_untracks_from_engine(self):
+        ent, coord = _make_cover()
+        ent._state = STATE_CLOSING
+        _run(ent._stop(send_stop=False))
+        coord.motion_engine.untrack.assert_called_once_with(ent)
+
+
+class TestCalibratedTimes(unittest.TestCase):
+    def test_own_channel_adopts_measured_times(self):
+        ent, _ = _make_cover()
+        ent._handle_calibrated(1, 24.0, 23.0)
+        attrs = ent.extra_state_attributes
+        self.assertEqual(
+            (attrs["operation_time_up"], attrs["operation_time_down"]), (24.0, 23.0)
+        )
+        ent.async_write_ha_state.assert_called_once()
+
+    def test_other_channel_is_ignored(self):
+        ent, _ = _make_cover()
+        ent._handle_calibrated(2, 24.0, 23.0)
+        self.assertEqual(ent._calculator.time_up, 10.0)
+        ent.async_write_ha_state.assert_not_called()
+
+
 class TestStop(unittest.TestCase):
     def test_finalizes_state_and_optimistic_write(self):
         ent, coord = _make_cover()
@@ -222,7 +329,9 @@ class TestStop(unittest.TestCase):
         ent, coord = _make_cover()
         ent._state = STATE_OPENING
         _run(ent._stop(send_stop=True))
-        coord.api.stop_cover.assert_awaited_once_with("9105", 1, "opening")
+        coord.api.stop_cover.assert_awaited_once_with(
+            "9105", 1, "opening", completion_handler=None
+        )
 
     def test_send_stop_when_already_stopped_skips_api(self):
         ent, coord = _make_cover()
@@ -299,6 +408,47 @@ class TestHandleButtonPressed(unittest.TestCase):
         ent._stop.assert_awaited_once_with(send_stop=True)
 
 
+class TestWarmStartPosition(unittest.TestCase):
+    """The position restored at startup is the most recently saved one."""
+
+    def _restore(self, snapshot, last_state):
+        ent, coord = _make_cover()
+        coord.restored_cover_position.return_value = snapshot
+        ent.async_get_last_state = AsyncMock(return_value=last_state)
+        with patch(
+            "custom_components.nikobus.cover.async_dispatcher_connect",
+            return_value=lambda: None,
+        ):
+            _run(ent.async_added_to_hass())
+        return ent
+
+    def _last_state(self, position, at):
+        state = MagicMock()
+        state.attributes = {"current_position": position}
+        state.last_updated = datetime.fromtimestamp(at, timezone.utc)
+        return state
+
+    def test_newer_snapshot_wins(self):
+        ent = self._restore((40.0, 2000.0), self._last_state(70, 1000.0))
+        self.assertEqual(ent.current_cover_position, 40)
+        self.assertEqual(ent._calculator.current_position(), 40.0)
+
+    def test_newer_restore_state_wins(self):
+        ent = self._restore((40.0, 1000.0), self._last_state(70, 2000.0))
+        self.assertEqual(ent.current_cover_position, 70)
+
+    def test_snapshot_alone(self):
+        ent = self._restore((25.0, 1000.0), None)
+        self.assertEqual(ent.current_cover_position, 25)
+
+    def test_write_notes_the_position(self):
+        ent, coord = _make_cover()
+        ent._position = 33.0
+        with patch.object(NikobusEntity, "async_write_ha_state"):
+            NikobusCoverEntity.async_write_ha_state(ent)
+        coord.note_cover_position.assert_called_once_with("9105", 1, 33.0)
+
+
 class TestHandleCoordinatorUpdate(unittest.TestCase):
     def _setup(self, bus_state, *, state=STATE_STOPPED, source="ha"):
         ent, coord = _make_cover()
@@ -419,7 +569,7 @@ class TestStopFromMotionLoopSendsBusStop(unittest.TestCase):
             ent, coord = _make_cover()
             sent = []
 
-            async def real_stop(*args):
+            async def real_stop(*args, **kwargs):
                 await asyncio.sleep(0)  # genuine suspension point
                 sent.append(args)
 
@@ -512,7 +662,9 @@ class TestErrorClearEpisode(unittest.TestCase):
         ent._state = STATE_STOPPED
         ent._last_motion_direction = "opening"
         _run(ent._stop(send_stop=True, force_api=True))
-        coord.api.stop_cover.assert_awaited_once_with("9105", 1, "opening")
+        coord.api.stop_cover.assert_awaited_once_with(
+            "9105", 1, "opening", completion_handler=None
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -555,6 +707,11 @@ def _make_cf_cover(members=None, modules_channels=6, cf_config=None):
     coord.api.set_output_states_for_module = AsyncMock()
     coord.async_event_handler = AsyncMock()
     coord.address_label = MagicMock(side_effect=lambda a: f"name({a})")
+
+    async def _dispatch(label, writes):
+        return await dispatch_module_writes(writes, limit=4, timeout=0.01)
+
+    coord.async_dispatch_module_writes = _dispatch
     if cf_config is None:
         cf_config = {"pattern": "roller", "outputs": []}
     ent = NikobusCFCoverEntity(coord, "3880cd", cf_config, members)
@@ -613,7 +770,9 @@ class TestCFCoverMove(unittest.TestCase):
         ent, coord = _make_cf_cover()
         _run(ent._move("closing"))
         # All three channels are on one module → exactly one bus commit.
-        coord.api.set_output_states_for_module.assert_awaited_once_with(address="8CF5")
+        coord.api.set_output_states_for_module.assert_awaited_once_with(
+            address="8CF5", completion_handler=ANY
+        )
         # Group-1 state staged with channels 1,2,3 = CLOSING (0x02).
         group1_hex = coord.set_bytearray_group_state.call_args_list[0].args[2]
         self.assertEqual(group1_hex[:6], "020202")
@@ -638,11 +797,47 @@ class TestCFCoverMove(unittest.TestCase):
         self.assertEqual(addrs, {"8CF5", "9105"})
 
     def test_move_schedules_timed_stops(self):
-        ent, _ = _make_cf_cover()
+        ent, coord = _make_cf_cover()
         _run(ent._move("closing"))
         # One module → one timed-stop token.
         self.assertEqual(len(ent._module_tokens), 1)
         self.assertIn("8CF5", ent._module_tokens)
+        # One engine deadline for the timed stops, one for the group model.
+        keys = [c.args[0] for c in coord.motion_engine.track.call_args_list]
+        self.assertEqual(keys, [(ent, "stop"), ent])
+        self.assertAlmostEqual(
+            coord.motion_engine.track.call_args_list[0].args[1], 40.0 + 3.0
+        )
+
+
+class TestCFCoverBatchDispatch(unittest.TestCase):
+    def test_modules_are_written_as_one_batch_and_skew_reported(self):
+        members = [
+            {"module_address": "8CF5", "channel": 1, "open_time": "40 s", "close_time": "40 s"},
+            {"module_address": "9105", "channel": 2, "open_time": "30 s", "close_time": "30 s"},
+        ]
+        ent, coord = _make_cf_cover(members=members)
+        in_flight: list[str] = []
+        answers = []
+
+        async def _write(address, completion_handler=None):
+            in_flight.append(address)
+            answers.append(completion_handler)
+
+        coord.api.set_output_states_for_module = AsyncMock(side_effect=_write)
+
+        async def scenario():
+            move = asyncio.ensure_future(ent._move("closing"))
+            for _ in range(5):
+                await asyncio.sleep(0)
+            # Both modules are queued before either has answered.
+            self.assertEqual(sorted(in_flight), ["8CF5", "9105"])
+            for answer in answers:
+                await answer()
+            await move
+
+        _run(scenario())
+        self.assertIsNotNone(ent.extra_state_attributes["last_actuation_skew_ms"])
 
 
 class TestCFCoverStop(unittest.TestCase):
@@ -659,7 +854,9 @@ class TestCFCoverStop(unittest.TestCase):
         # Stopped byte (0x00) staged for the member channels.
         group1_hex = coord.set_bytearray_group_state.call_args_list[-1].args[2]
         self.assertEqual(group1_hex[:6], "000000")
-        coord.api.set_output_states_for_module.assert_awaited_with(address="8CF5")
+        coord.api.set_output_states_for_module.assert_awaited_with(
+            address="8CF5", completion_handler=ANY
+        )
 
 
 class TestCFCoverActionErrors(unittest.TestCase):
@@ -700,8 +897,7 @@ class TestCFCoverTimedStop(unittest.TestCase):
         current[1] = STATE_OPENING
         coord.nikobus_module_states = {"8CF5": current}
         ent._module_tokens = {"8CF5": "tok"}
-        with patch("custom_components.nikobus.cover.asyncio.sleep", new=AsyncMock()):
-            _run(ent._delayed_stop("8CF5", sent, {0, 1}, 0.0, "tok"))
+        _run(ent._timed_stop("8CF5", sent, {0, 1}, "tok"))
         # Committed stop state: ch1 → stopped, ch2 untouched (still opening).
         group1_hex = coord.set_bytearray_group_state.call_args_list[-1].args[2]
         self.assertEqual(group1_hex[:4], "0001")  # 00=ch1 stopped, 01=ch2 left opening
@@ -710,6 +906,5 @@ class TestCFCoverTimedStop(unittest.TestCase):
         ent, coord = _make_cf_cover()
         ent._module_tokens = {"8CF5": "newtok"}
         sent = bytearray(12)
-        with patch("custom_components.nikobus.cover.asyncio.sleep", new=AsyncMock()):
-            _run(ent._delayed_stop("8CF5", sent, {0}, 0.0, "oldtok"))
+        _run(ent._timed_stop("8CF5", sent, {0}, "oldtok"))
         coord.api.set_output_states_for_module.assert_not_awaited()
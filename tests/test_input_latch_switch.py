@@ -55,6 +55,9 @@ class TestInputSwitchKnownIds(unittest.TestCase):
     def test_input_switch_ids_are_known(self):
         coord = NikobusDataCoordinator.__new__(NikobusDataCoordinator)
         coord.dict_module_data = {}
+        coord.hass = MagicMock()
+        coord.hass.data = {}
+        coord.config_entry = MagicMock()
         coord.dict_scene_data = {}
         coord.cf_storage = MagicMock()
         coord.cf_storage.data = {"nikobus_cf": {}}
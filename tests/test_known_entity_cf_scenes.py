@@ -21,6 +21,9 @@ from custom_components.nikobus.coordinator import NikobusDataCoordinator
 def _coord_with_cfs(cf_addrs):
     coord = NikobusDataCoordinator.__new__(NikobusDataCoordinator)
     coord.dict_module_data = {}
+    coord.hass = MagicMock()
+    coord.hass.data = {}
+    coord.config_entry = MagicMock()
     coord.dict_button_data = {}
     coord.dict_scene_data = {}
     coord.cf_storage = MagicMock()
@@ -13,7 +13,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 from homeassistant.exceptions import HomeAssistantError
 
-from custom_components.nikobus.const import operation_signal
+from custom_components.nikobus.const import channel_signal, operation_signal
 from custom_components.nikobus.light import (
     NikobusDimmerEntity,
     NikobusRelayEntity,
@@ -121,6 +121,18 @@ class TestDimmer(unittest.TestCase):
         signals = [c.args[1] for c in conn.call_args_list]
         self.assertIn(operation_signal("0E6C"), signals)
 
+    def test_wakes_on_its_own_channel_only(self):
+        e, _ = self._make()
+        e.hass = MagicMock()
+        with patch(
+            "custom_components.nikobus.entity.async_dispatcher_connect",
+            return_value=lambda: None,
+        ) as conn:
+            _run(e.async_added_to_hass())
+        self.assertEqual(
+            [c.args[1] for c in conn.call_args_list], [channel_signal("0E6C", 1)]
+        )
+
 
 class TestRelayLight(unittest.TestCase):
     def _make(self):
@@ -0,0 +1,188 @@
+"""Unit tests for the bus priority scheduler (nkbbusscheduler)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.nikobus import nkbbusscheduler
+from custom_components.nikobus.nkbbusscheduler import (
+    BusPriority,
+    NikobusBusScheduler,
+)
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_interactive_is_admitted_while_polls_are_in_flight():
+    sched = NikobusBusScheduler()
+    for _ in range(4):
+        await sched.acquire(BusPriority.POLL)
+
+    await asyncio.wait_for(sched.acquire(BusPriority.INTERACTIVE), 0.1)
+
+    assert sched.stats()["interactive"]["in_flight"] == 1
+    assert sched.stats()["interactive"]["delayed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_poll_yields_while_interactive_in_flight():
+    sched = NikobusBusScheduler()
+    await sched.acquire(BusPriority.INTERACTIVE)
+    poll = asyncio.ensure_future(sched.acquire(BusPriority.POLL))
+    await _settle()
+    assert not poll.done()
+    assert sched.stats()["poll"]["waiting"] == 1
+
+    sched.release(BusPriority.INTERACTIVE)
+    await _settle()
+
+    assert poll.done()
+    stats = sched.stats()["poll"]
+    assert (stats["delayed"], stats["in_flight"]) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_waiters_are_admitted_most_urgent_class_first():
+    sched = NikobusBusScheduler()
+    await sched.acquire(BusPriority.INTERACTIVE)
+    order: list[str] = []
+
+    async def _take(priority: BusPriority) -> None:
+        async with sched.slot(priority):
+            order.append(priority.name)
+            await asyncio.sleep(0)
+
+    tasks = [
+        asyncio.ensure_future(_take(BusPriority.BACKGROUND)),
+        asyncio.ensure_future(_take(BusPriority.POLL)),
+        asyncio.ensure_future(_take(BusPriority.PRESS_REFRESH)),
+    ]
+    await _settle()
+    assert order == []
+
+    sched.release(BusPriority.INTERACTIVE)
+    await asyncio.gather(*tasks)
+
+    assert order == ["PRESS_REFRESH", "POLL", "BACKGROUND"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_a_slot():
+    sched = NikobusBusScheduler()
+    await sched.acquire(BusPriority.INTERACTIVE)
+    poll = asyncio.ensure_future(sched.acquire(BusPriority.POLL))
+    await _settle()
+    poll.cancel()
+    await _settle()
+    sched.release(BusPriority.INTERACTIVE)
+
+    stats = sched.stats()["poll"]
+    assert (stats["waiting"], stats["in_flight"]) == (0, 0)
+    await asyncio.wait_for(sched.acquire(BusPriority.POLL), 0.1)
+
+
+@pytest.mark.asyncio
+async def test_view_holds_write_slot_until_the_write_is_answered():
+    sched = NikobusBusScheduler()
+    loop = asyncio.get_running_loop()
+    answer = loop.create_future()
+    handler = MagicMock()
+    handler.set_output_state = AsyncMock(return_value=answer)
+    handler.get_output_state = AsyncMock(return_value="00" * 6)
+    view = sched.commands(handler, BusPriority.INTERACTIVE)
+
+    result = await view.set_output_state("C1C7", 1, 0xFF)
+    assert result is answer
+    assert sched.stats()["interactive"]["in_flight"] == 1
+    poll = asyncio.ensure_future(sched.acquire(BusPriority.POLL))
+    await _settle()
+    assert not poll.done()
+
+    answer.set_result("ok")
+    await _settle()
+    assert poll.done()
+    assert sched.stats()["interactive"]["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_unanswered_write_releases_its_slot_after_the_hold_timeout(monkeypatch):
+    monkeypatch.setattr(nkbbusscheduler, "WRITE_HOLD_TIMEOUT", 0.01)
+    sched = NikobusBusScheduler()
+    answer = asyncio.get_running_loop().create_future()
+    handler = MagicMock()
+    handler.set_output_state = AsyncMock(return_value=answer)
+    view = sched.commands(handler, BusPriority.INTERACTIVE)
+
+    await view.set_output_state("C1C7", 1, 0xFF)
+    await asyncio.wait_for(sched.acquire(BusPriority.POLL), 0.5)
+    assert sched.stats()["interactive"]["in_flight"] == 0
+
+    # A late answer doesn't give the slot back a second time.
+    answer.set_result("ok")
+    await _settle()
+    assert sched.stats()["poll"]["in_flight"] == 1
+
+
+@pytest.mark.asyncio
+async def test_reset_drops_slots_and_admits_waiters():
+    sched = NikobusBusScheduler()
+    async with sched.slot(BusPriority.INTERACTIVE):
+        poll = asyncio.ensure_future(sched.acquire(BusPriority.POLL))
+        await _settle()
+        assert not poll.done()
+
+        sched.reset()
+        await _settle()
+        assert poll.done()
+    # The slot taken before the reset is not released against the poll's.
+    stats = sched.stats()
+    assert (stats["interactive"]["in_flight"], stats["poll"]["in_flight"]) == (0, 1)
+
+
+@pytest.mark.asyncio
+async def test_view_passes_non_bus_attributes_through():
+    handler = MagicMock()
+    view = NikobusBusScheduler().commands(handler, BusPriority.INTERACTIVE)
+    view.set_bytearray_state("C1C7", 1, 0xFF)
+    handler.set_bytearray_state.assert_called_once_with("C1C7", 1, 0xFF)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_channel_writes_share_one_frame_per_group():
+    from nikobus_connect import NikobusAPI
+    from nikobus_connect.command import NikobusCommandHandler
+
+    states: dict = {"C1C7": bytearray(12)}
+    handler = NikobusCommandHandler(
+        connection=MagicMock(), listener=MagicMock(), module_states=states
+    )
+    view = NikobusBusScheduler().commands(handler, BusPriority.INTERACTIVE)
+    api = NikobusAPI(
+        view, {"switch_module": {"C1C7": {"channels": [{}] * 12}}}
+    )
+    failures = [MagicMock() for _ in range(8)]
+
+    # "All on" from a light group: eight entities, one module.
+    await asyncio.gather(*(
+        api.turn_on_switch("C1C7", ch, failure_handler=failures[ch - 1])
+        for ch in range(1, 9)
+    ))
+
+    assert handler._command_queue.qsize() == 2  # group 1 and group 2
+    assert view.write_stats() == {
+        "channel_writes": 8, "frames": 2, "combined": 6,
+    }
+    # Each caller still hears about its own write's outcome.
+    err = RuntimeError("no answer")
+    for item in handler._pending_set_groups.values():
+        for fail in item["failure_handlers"]:
+            fail(err)
+    for fail in failures:
+        fail.assert_called_once_with(err)
@@ -0,0 +1,111 @@
+"""Unit tests for shutter travel-time calibration (nkbcalibrate)."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.nikobus.nkbcalibrate import (
+    CalibrationError,
+    TravelSample,
+    fit_travel_times,
+    time_travel,
+)
+
+_STEP = 0.001
+
+
+class _Channel:
+    """Scripted status-byte reads on a fake clock, one ``_STEP`` apart."""
+
+    def __init__(self, script: list[int | None]) -> None:
+        self.now = 0.0
+        self._script = list(script)
+
+    def clock(self) -> float:
+        return self.now
+
+    async def command(self, on_sent) -> None:
+        await on_sent()
+
+    async def read_byte(self) -> int | None:
+        self.now += _STEP
+        return self._script.pop(0) if self._script else 0x00
+
+
+async def _time(channel: _Channel, direction: str = "opening", **kwargs):
+    return await time_travel(
+        direction,
+        kwargs.pop("command", channel.command),
+        channel.read_byte,
+        sample_interval=_STEP,
+        timeout=kwargs.pop("timeout", 1.0),
+        clock=channel.clock,
+    )
+
+
+@pytest.mark.asyncio
+async def test_transitions_sit_between_the_bracketing_reads():
+    # Reads at 1, 2, 3, 4, 5 ms: moving first seen at 2, stopped at 5.
+    channel = _Channel([0x00, 0x01, 0x01, 0x01, 0x00])
+
+    sample = await _time(channel)
+
+    assert sample.direction == "opening"
+    assert sample.start_latency == pytest.approx(0.0015)
+    assert sample.stop_after == pytest.approx(0.0045)
+
+
+@pytest.mark.asyncio
+async def test_failed_reads_are_skipped():
+    channel = _Channel([0x02, None, 0x02, 0x00])
+
+    sample = await _time(channel, "closing")
+
+    assert sample.start_latency == pytest.approx(0.0005)
+    assert sample.stop_after == pytest.approx(0.0035)
+
+
+@pytest.mark.asyncio
+async def test_channel_that_never_moves_fails():
+    with pytest.raises(CalibrationError, match="never started"):
+        await _time(_Channel([0x00] * 10))
+
+
+@pytest.mark.asyncio
+async def test_wrong_direction_fails():
+    with pytest.raises(CalibrationError, match="instead of moving"):
+        await _time(_Channel([0x02]))
+
+
+@pytest.mark.asyncio
+async def test_motor_protection_while_moving_fails():
+    with pytest.raises(CalibrationError, match="while moving"):
+        await _time(_Channel([0x01, 0x03]))
+
+
+@pytest.mark.asyncio
+async def test_unsent_command_fails():
+    async def _never_sent(on_sent) -> None:
+        return None
+
+    with pytest.raises(CalibrationError, match="never sent"):
+        await _time(_Channel([]), command=_never_sent, timeout=0.01)
+
+
+def test_fit_averages_each_direction():
+    fit = fit_travel_times([
+        TravelSample("opening", 0.2, 20.0),
+        TravelSample("closing", 0.4, 18.0),
+        TravelSample("opening", 0.2, 22.0),
+        TravelSample("closing", 0.4, 18.5),
+    ])
+
+    assert fit.time_up == pytest.approx(21.0)
+    assert fit.time_down == pytest.approx(18.25)
+    assert fit.start_latency == pytest.approx(0.3)
+    assert fit.runs == 4
+
+
+def test_fit_needs_both_directions():
+    with pytest.raises(CalibrationError):
+        fit_travel_times([TravelSample("opening", 0.2, 20.0)])
@@ -0,0 +1,105 @@
+"""Unit tests for batched scene module writes (nkbdispatch)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from custom_components.nikobus.nkbdispatch import dispatch_module_writes
+
+
+class _Bus:
+    """Module writes that answer when the test says so."""
+
+    def __init__(self) -> None:
+        self.queued: list[str] = []
+        self.answers: dict[str, object] = {}
+        self.now = 0.0
+
+    def clock(self) -> float:
+        return self.now
+
+    def write(self, module_id: str, *, send: bool = True):
+        async def _write(on_answered) -> bool:
+            if not send:
+                return False
+            self.queued.append(module_id)
+            self.answers[module_id] = on_answered
+            return True
+
+        return _write
+
+    async def answer(self, module_id: str, at: float) -> None:
+        self.now = at
+        await self.answers.pop(module_id)()
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_at_most_limit_modules_wait_for_their_answer():
+    bus = _Bus()
+    batch = asyncio.ensure_future(dispatch_module_writes(
+        {m: bus.write(m) for m in ("A", "B", "C")},
+        limit=2, timeout=1.0, clock=bus.clock,
+    ))
+    await _settle()
+    assert bus.queued == ["A", "B"]
+
+    await bus.answer("A", at=0.10)
+    await _settle()
+    assert bus.queued == ["A", "B", "C"]
+
+    await bus.answer("B", at=0.15)
+    await bus.answer("C", at=0.30)
+    result = await batch
+
+    assert (result.modules, result.sent, result.answered) == (3, 3, 3)
+    assert result.skew == pytest.approx(0.20)
+
+
+@pytest.mark.asyncio
+async def test_skipped_writes_hold_no_slot_and_no_skew():
+    bus = _Bus()
+    result = await dispatch_module_writes(
+        {"A": bus.write("A", send=False)}, limit=1, timeout=1.0, clock=bus.clock
+    )
+    assert (result.modules, result.sent, result.answered, result.skew) == (1, 0, 0, None)
+
+
+@pytest.mark.asyncio
+async def test_unanswered_write_frees_its_slot_after_the_timeout():
+    bus = _Bus()
+    batch = asyncio.ensure_future(dispatch_module_writes(
+        {m: bus.write(m) for m in ("A", "B")},
+        limit=1, timeout=0.05, clock=bus.clock,
+    ))
+    await asyncio.sleep(0.07)
+    assert bus.queued == ["A", "B"]
+    await bus.answer("B", at=1.0)
+    result = await batch
+
+    assert (result.sent, result.answered, result.skew) == (2, 1, 0.0)
+
+
+@pytest.mark.asyncio
+async def test_failure_is_raised_after_every_write_ran():
+    bus = _Bus()
+
+    async def _broken(on_answered) -> bool:
+        raise RuntimeError("bus down")
+
+    async def _ok(on_answered) -> bool:
+        bus.queued.append("B")
+        await on_answered()
+        return True
+
+    with pytest.raises(RuntimeError, match="bus down"):
+        await dispatch_module_writes(
+            {"A": _broken, "B": _ok}, limit=1, timeout=1.0, clock=bus.clock
+        )
+    assert bus.queued == ["B"]
@@ -0,0 +1,82 @@
+"""Unit tests for the shared cover motion engine (nkbmotion)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from custom_components.nikobus.nkbmotion import NikobusMotionEngine
+
+
+@pytest.mark.asyncio
+async def test_deadlines_fire_in_order_from_one_timer():
+    engine = NikobusMotionEngine(10.0)
+    fired: list[str] = []
+    engine.track("slow", 0.06, lambda: fired.append("slow"))
+    engine.track("fast", 0.02, lambda: fired.append("fast"))
+
+    await asyncio.sleep(0.04)
+    assert fired == ["fast"]
+    assert engine.is_tracked("slow")
+
+    await asyncio.sleep(0.05)
+    assert fired == ["fast", "slow"]
+    assert engine.stats()["deadline_stops"] == 2
+    assert engine.stats()["moving"] == 0
+    assert engine._deadline_timer is None
+
+
+@pytest.mark.asyncio
+async def test_untrack_and_retrack_replace_the_deadline():
+    engine = NikobusMotionEngine(10.0)
+    first, second, gone = MagicMock(), MagicMock(), MagicMock()
+    engine.track("cover", 0.01, first)
+    engine.track("cover", 0.03, second)
+    engine.track("other", 0.01, gone)
+    engine.untrack("other")
+
+    await asyncio.sleep(0.05)
+    first.assert_not_called()
+    gone.assert_not_called()
+    second.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_one_ui_tick_redraws_every_moving_cover():
+    engine = NikobusMotionEngine(0.01)
+    ticks = [MagicMock() for _ in range(20)]
+    for i, tick in enumerate(ticks):
+        engine.track(i, 10.0, MagicMock(), tick)
+
+    await asyncio.sleep(0.035)
+    assert all(t.call_count >= 2 for t in ticks)
+    assert engine.stats()["ui_ticks"] == ticks[0].call_count
+
+    engine.stop()
+    assert engine._tick_timer is None and engine._deadline_timer is None
+
+
+@pytest.mark.asyncio
+async def test_failing_callback_does_not_stall_other_covers():
+    engine = NikobusMotionEngine(10.0)
+    after = MagicMock()
+    engine.track("bad", 0.0, MagicMock(side_effect=RuntimeError("boom")))
+    engine.track("good", 0.0, after)
+
+    await asyncio.sleep(0.01)
+    after.assert_called_once()
+
+
+def test_stop_lead_follows_measured_latency_within_cap():
+    engine = NikobusMotionEngine(0.5, max_stop_lead=0.5, latency_weight=0.5)
+    assert engine.stop_lead == 0.0
+
+    engine.record_stop_latency(0.2)
+    assert engine.stop_lead == pytest.approx(0.2)
+    engine.record_stop_latency(0.4)
+    assert engine.stop_lead == pytest.approx(0.3)
+    engine.record_stop_latency(5.0)
+    assert engine.stop_lead == 0.5
+    assert engine.stats()["stop_latency_samples"] == 3
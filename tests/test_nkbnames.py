@@ -30,6 +30,7 @@ def _coord(cf=None, button_data=None):
         return fn(*a)
 
     c.hass.async_add_executor_job = _aaej
+    c.async_reconcile_entities = MagicMock()
     c.config_entry = MagicMock()
     c.config_entry.entry_id = "E1"
     c.dict_button_data = button_data or {}
@@ -213,8 +214,8 @@ def test_import_names_existing_discovered_cf_scene():
 
 def test_import_purges_stale_nkb_sourced_scene():
     """Migration: a button-duplicating scene a previous import created
-    (source='nkb') is removed on the next import, and a reload is scheduled
-    so the now-dead scene entity is torn down."""
+    (source='nkb') is removed on the next import, and a reconcile is
+    scheduled so the now-dead scene entity is torn down."""
     data = NkbData(addresses={}, scenes=[])
     coord = _coord(cf={
         "AB1234": {"bus_address": "AB1234", "pattern": "nkb_scene",
@@ -226,6 +227,7 @@ def test_import_purges_stale_nkb_sourced_scene():
 
     assert coord.cf_storage.data["nikobus_cf"] == {}
     coord.hass.async_create_task.assert_called_once()
+    coord.async_reconcile_entities.assert_called_once()
 
 
 def test_ingest_drops_stale_nkb_sourced_scenes():
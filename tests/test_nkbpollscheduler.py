@@ -0,0 +1,265 @@
+"""Unit tests for the adaptive poll scheduler (nkbpollscheduler)."""
+
+from __future__ import annotations
+
+from custom_components.nikobus.nkbpollscheduler import NikobusPollScheduler
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _scheduler(clock, *, read_cost=0.2, freshness=0.0):
+    return NikobusPollScheduler(
+        120,
+        min_interval=30,
+        max_interval=960,
+        budget_share=0.2,
+        read_cost=read_cost,
+        freshness_window=freshness,
+        clock=clock,
+    )
+
+
+def test_unread_groups_are_always_due():
+    sched = _scheduler(_Clock())
+    keys = [("C1C7", 1), ("C1C7", 2), ("C1C8", 1)]
+    assert sched.plan(keys, 30) == keys
+
+
+def test_quiet_group_backs_off_exponentially_up_to_max():
+    clock = _Clock()
+    sched = _scheduler(clock)
+    intervals = []
+    for _ in range(5):
+        sched.record("C1C7", 1, changed=False)
+        intervals.append(sched._groups[("C1C7", 1)].interval)
+    assert intervals == [240, 480, 960, 960, 960]
+
+
+def test_volatile_group_speeds_up_down_to_min():
+    clock = _Clock()
+    sched = _scheduler(clock)
+    for _ in range(4):
+        sched.record("C1C7", 1, changed=True)
+    entry = sched._groups[("C1C7", 1)]
+    assert entry.interval == 30
+    assert entry.changes == 4
+    assert entry.last_changed == clock.now
+
+
+def test_only_due_groups_are_planned():
+    clock = _Clock()
+    sched = _scheduler(clock)
+    sched.record("C1C7", 1, changed=True)   # next due in 60 s
+    sched.record("C1C8", 1, changed=False)  # next due in 240 s
+    keys = [("C1C7", 1), ("C1C8", 1)]
+
+    assert sched.plan(keys, 30) == []
+    clock.now += 60
+    assert sched.plan(keys, 30) == [("C1C7", 1)]
+    clock.now += 180
+    assert sched.plan(keys, 30) == [("C1C7", 1), ("C1C8", 1)]
+
+
+def test_budget_defers_least_overdue_groups():
+    clock = _Clock()
+    # 30 s tick * 0.2 share / 2 s per read -> 3 reads per tick.
+    sched = _scheduler(clock, read_cost=2.0)
+    keys = [(f"C1C{i}", 1) for i in range(5)]
+    for i, key in enumerate(keys):
+        clock.now = 1000.0 + i
+        sched.record(*key, changed=False)
+    clock.now = 5000.0
+
+    assert sched.plan(keys, 30) == keys[:3]
+    assert sched.deferred_last_tick == 2
+
+
+def test_failure_keeps_group_due():
+    clock = _Clock()
+    sched = _scheduler(clock)
+    sched.record("C1C7", 1, changed=False)
+    sched.record_failure("C1C7", 1)
+    assert sched.plan([("C1C7", 1)], 30) == [("C1C7", 1)]
+
+
+def test_group_that_never_answered_backs_off_and_is_no_blackout():
+    clock = _Clock()
+    sched = _scheduler(clock)
+    dead, live = ("DEAD", 1), ("C1C7", 1)
+    sched.record(*live, changed=False)
+    sched.reset()
+
+    assert sched.plan([dead, live], 30) == [dead, live]
+    sched.record_failure(*dead)
+    sched.record_failure(*dead)
+    # Only the group that answered before counts toward the streak,
+    # even across the reset.
+    assert sched.failure_streak == 0
+    sched.record_failure(*live)
+    assert sched.failure_streak == 1
+
+    # Out of the unbudgeted head of the plan, and backed off.
+    assert sched.plan([dead, live], 30) == [live]
+    assert sched._groups[dead].interval == 480
+    clock.now += 480
+    assert sched.plan([dead], 30) == [dead]
+
+
+def test_observe_cycle_tracks_read_cost():
+    sched = _scheduler(_Clock(), read_cost=0.2)
+    sched.observe_cycle(10.0, 10)
+    assert abs(sched.read_cost - 0.36) < 1e-9
+    sched.observe_cycle(0.0, 0)
+    assert abs(sched.read_cost - 0.36) < 1e-9
+
+
+def test_reset_makes_every_group_due_again():
+    sched = _scheduler(_Clock())
+    sched.record("C1C7", 1, changed=False)
+    sched.reset()
+    assert sched.plan([("C1C7", 1)], 30) == [("C1C7", 1)]
+    assert sched.stats()["tracked_groups"] == 0
+
+
+def test_observed_change_speeds_up_and_holds_through_same_poll():
+    clock = _Clock()
+    sched = _scheduler(clock)
+    sched.record("C1C7", 1, changed=False)  # 240 s
+    clock.now += 10
+    sched.observe("C1C7", 1, changed=True, confirmed=True)
+    entry = sched._groups[("C1C7", 1)]
+    assert entry.interval == 120
+    assert entry.last_confirmed == clock.now
+
+    # The next poll finds the bytes the press refresh already stored.
+    clock.now += 120
+    sched.record("C1C7", 1, changed=False)
+    assert entry.interval == 120
+    # With no further activity it backs off again.
+    clock.now += 120
+    sched.record("C1C7", 1, changed=False)
+    assert entry.interval == 240
+
+
+def test_unconfirmed_change_does_not_count_as_fresh():
+    clock = _Clock()
+    sched = _scheduler(clock)
+    sched.record("C1C7", 1, changed=False)  # due in 240 s
+    sched.observe("C1C7", 1, changed=True, confirmed=False)
+    entry = sched._groups[("C1C7", 1)]
+    assert entry.last_confirmed == clock.now
+    assert entry.next_due == clock.now + 120
+
+    sched.observe("C1C8", 1, changed=True, confirmed=False)
+    assert sched.plan([("C1C8", 1)], 30) == [("C1C8", 1)]
+
+
+def test_keepalive_reads_most_overdue_group_when_idle():
+    clock = _Clock()
+    sched = _scheduler(clock)
+    keys = [("C1C7", 1), ("C1C8", 1)]
+    for _ in range(3):
+        for key in keys:
+            sched.record(*key, changed=False)
+    sched._groups[("C1C8", 1)].next_due -= 1
+
+    clock.now += 60
+    assert sched.plan(keys, 30) == []
+    clock.now += 60
+    assert sched.plan(keys, 30) == [("C1C8", 1)]
+
+
+def test_failure_streak_spans_ticks_and_resets_on_answer():
+    sched = _scheduler(_Clock())
+    sched.record("C1C7", 1, changed=False)
+    sched.record_failure("C1C7", 1)
+    sched.record_failure("C1C7", 1)
+    assert sched.failure_streak == 2
+    sched.observe("C1C8", 1, changed=False, confirmed=True)
+    assert sched.failure_streak == 0
+    sched.record_failure("C1C7", 1)
+    sched.record("C1C8", 1, changed=False)
+    assert sched.failure_streak == 0
+
+
+def test_group_confirmed_within_freshness_window_is_skipped():
+    clock = _Clock()
+    sched = _scheduler(clock, freshness=20)
+    keys = [("C1C7", 1), ("C1C8", 1)]
+    for key in keys:
+        sched.record(*key, changed=False)  # both due in 240 s
+    clock.now += 230
+    sched.observe("C1C7", 1, changed=False, confirmed=True)
+    clock.now += 10
+
+    assert sched.plan(keys, 30) == [("C1C8", 1)]
+    assert sched.skipped_fresh_last_tick == 1
+    assert sched.skipped_fresh_total == 1
+    # Rescheduled from the press refresh's read, not from now.
+    assert sched._groups[("C1C7", 1)].next_due == clock.now - 10 + 240
+
+
+def test_confirmation_outside_freshness_window_does_not_skip():
+    clock = _Clock()
+    sched = _scheduler(clock, freshness=20)
+    sched.record("C1C7", 1, changed=False)
+    clock.now += 200
+    sched.observe("C1C7", 1, changed=False, confirmed=True)
+    clock.now += 40
+
+    assert sched.plan([("C1C7", 1)], 30) == [("C1C7", 1)]
+    assert sched.skipped_fresh_total == 0
+
+
+def test_unconfirmed_write_is_not_fresh():
+    clock = _Clock()
+    sched = _scheduler(clock, freshness=20)
+    sched.record("C1C7", 1, changed=False)
+    clock.now += 235
+    sched.observe("C1C7", 1, changed=False, confirmed=False)
+    clock.now += 5
+
+    assert sched.plan([("C1C7", 1)], 30) == [("C1C7", 1)]
+
+
+def test_streak_start_is_first_failed_read_of_the_streak():
+    clock = _Clock()
+    sched = _scheduler(clock)
+    sched.record("C1C7", 1, changed=False)
+    sched.record("C1C8", 1, changed=False)
+    sched.record_failure("C1C7", 1, sent=clock.now - 5)
+    clock.now += 10
+    sched.record_failure("C1C8", 1, sent=clock.now - 5)
+    assert sched.streak_started == 995.0
+    sched.record("C1C8", 1, changed=False)
+    assert sched.streak_started is None
+
+
+def test_unread_groups_go_stalest_restored_first():
+    clock = _Clock()
+    sched = _scheduler(clock)
+    sched.prefer_stalest({"AAAA": 500.0, "BBBB": 100.0})
+    keys = [("AAAA", 1), ("BBBB", 1), ("BBBB", 2), ("CCCC", 1)]
+
+    # Nothing restored for CCCC: stalest of all.
+    assert sched.plan(keys, 30) == [("CCCC", 1), ("BBBB", 1), ("BBBB", 2), ("AAAA", 1)]
+
+    sched.reset()
+    assert sched.plan(keys, 30) == keys
+
+
+def test_confirmed_at_is_the_latest_group_read():
+    clock = _Clock()
+    sched = _scheduler(clock)
+    sched.record("C1C7", 1, changed=False)
+    clock.now += 10
+    sched.observe("C1C7", 2, changed=True, confirmed=True)
+    sched.observe("C1C8", 1, changed=True, confirmed=False)
+
+    assert sched.confirmed_at() == {"C1C7": 1010.0}
@@ -0,0 +1,55 @@
+"""Unit tests for link-mode output prediction (nkbpredict)."""
+
+from __future__ import annotations
+
+from custom_components.nikobus.nkbactuator import build_press_routes
+from custom_components.nikobus.nkbpredict import link_action, predict_byte
+
+
+def test_switch_modes():
+    assert link_action("switch_module", "M01 (On / off)") == "toggle"
+    assert link_action("switch_module", "M02 (On + Operating time)") == "on"
+    assert link_action("switch_module", "M03 (Off + Operating time)") == "off"
+    assert link_action("switch_module", "M04 (Pushbutton)") is None
+    assert predict_byte("toggle", 0x00) == 0xFF
+    assert predict_byte("toggle", 0xFF) == 0x00
+
+
+def test_roller_modes_share_codes_but_not_actions_with_switches():
+    assert link_action("roller_module", "M02 (Open)") == "open"
+    assert link_action("roller_module", "M03 (Close)") == "close"
+    assert link_action("roller_module", "M04 (Stop)") == "stop"
+    assert link_action("dimmer_module", "M01 (Dim on/off (2 buttons))") is None
+    assert link_action(None, "M01 (On / off)") is None
+
+
+def test_cycle_stops_a_moving_shutter_only():
+    assert predict_byte("cycle", 0x01) == 0x00
+    assert predict_byte("cycle", 0x02) == 0x00
+    assert predict_byte("cycle", 0x00) is None
+
+
+def test_route_marks_module_predictable_only_if_every_link_is():
+    buttons = {"nikobus_button": {"1A2B3C": {"operation_points": {
+        "1A": {"bus_address": "C5E952", "linked_modules": [
+            {"module_address": "C1C7", "outputs": [
+                {"channel": 1, "mode": "M01 (On / off)"},
+                {"channel": 2, "mode": "M03 (Off + Operating time)"},
+            ]},
+            {"module_address": "C1C8", "outputs": [
+                {"channel": 1, "mode": "M02 (Open)"},
+                {"channel": 2, "mode": "M05 (Interface- and RF-control)"},
+            ]},
+        ]},
+    }}}}
+    modules = {"nikobus_module": {
+        "C1C7": {"module_type": "switch_module"},
+        "C1C8": {"module_type": "roller_module"},
+    }}
+
+    route = build_press_routes(buttons, modules)["C5E952"]
+
+    assert route.actions == (
+        ("C1C7", 1, "toggle"), ("C1C7", 2, "off"), ("C1C8", 1, "open"),
+    )
+    assert route.predictable == frozenset({"C1C7"})
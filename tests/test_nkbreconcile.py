@@ -6,12 +6,14 @@ from types import SimpleNamespace
 
 from custom_components.nikobus.nkbreconcile import (
     all_outputs_registry_sourced,
+    build_cf_trigger_index,
     build_controlled_by_index,
     build_routing_graph,
     cf_cover_members,
     cf_member_set,
     classify_button_status,
     collect_button_outputs,
+    diff_entity_records,
     flatten_cf_broadcasts,
     has_pc_logic_module,
     is_button_backed_cf,
@@ -201,6 +203,27 @@ def test_build_controlled_by_index_empty_and_malformed():
     assert build_controlled_by_index({"nikobus_button": "not-a-dict"}) == {}
 
 
+def test_build_cf_trigger_index():
+    cf_data = {
+        "8B7086": {"triggered_by": ["8B7086", "de4e2c"]},
+        "DE4E2C": {"triggered_by": ["DE4E2C"]},
+        "0D1C9E": {"triggered_by": ["DE4E2C", "1843B4"]},
+    }
+    index = build_cf_trigger_index(cf_data)
+    # A CF's own key wins over another CF listing it as a trigger...
+    assert index["DE4E2C"] == "DE4E2C"
+    # ...and among triggered_by entries the first CF in store order wins.
+    assert index["1843B4"] == "0D1C9E"
+    assert index["8B7086"] == "8B7086"
+    assert set(index) == {"8B7086", "DE4E2C", "0D1C9E", "1843B4"}
+
+
+def test_build_cf_trigger_index_empty_and_malformed():
+    assert build_cf_trigger_index(None) == {}
+    assert build_cf_trigger_index({"AAAAAA": "not-a-dict"}) == {}
+    assert build_cf_trigger_index({"AAAAAA": {"triggered_by": None}}) == {"AAAAAA": "AAAAAA"}
+
+
 def test_build_routing_graph_groups_triggers_by_member_set():
     button_data = {
         "nikobus_button": {
@@ -418,3 +441,10 @@ def test_bare_38xx_cf_always_surfaces():
         assert is_surfaced_cf_scene(cf) is True, pat
     # missing pattern is treated as not-button-backed → surfaced
     assert is_surfaced_cf_scene({"outputs": []}) is True
+
+
+def test_diff_entity_records_splits_added_removed_and_changed():
+    old = {"a": {"ch": 1}, "b": {"ch": 2}, "c": None}
+    new = {"a": {"ch": 1}, "b": {"ch": 3}, "c": None, "d": {"ch": 4}}
+    assert diff_entity_records(old, new) == (["d"], [], ["b"])
+    assert diff_entity_records(new, {"a": {"ch": 1}}) == ([], ["b", "c", "d"], [])
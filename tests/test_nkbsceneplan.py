@@ -0,0 +1,80 @@
+"""Unit tests for compiled software-scene plans (nkbsceneplan)."""
+
+from __future__ import annotations
+
+from custom_components.nikobus.nkbsceneplan import compile_scene
+
+_TYPES = {"C1C7": "switch_module", "9105": "roller_module", "0E6C": "dimmer_module"}
+_CHANNELS = {"C1C7": 12, "9105": 6, "0E6C": 12}
+
+
+def _compile(channels, op_times=None):
+    op_times = op_times or {}
+    return compile_scene(
+        channels,
+        revision=7,
+        module_type=_TYPES.get,
+        channel_count=lambda m: _CHANNELS.get(m, 0),
+        operation_time=lambda m, ch, d: op_times.get((m, ch, d), 30.0),
+        stop_buffer=3.0,
+    )
+
+
+def test_members_are_grouped_per_module_with_mask_and_values():
+    plan = _compile([
+        {"module_id": "c1c7", "channel": 1, "state": "on"},
+        {"module_id": "C1C7", "channel": 8, "state": "off"},
+        {"module_id": "0E6C", "channel": 2, "state": 128},
+    ])
+
+    assert plan.revision == 7
+    by_module = {m.module_id: m for m in plan.modules}
+    switch = by_module["C1C7"]
+    assert switch.mask == bytes([0xFF] + [0] * 6 + [0xFF] + [0] * 4)
+    assert switch.values == bytes([0xFF] + [0] * 11)
+    assert switch.groups == (1, 2)
+    assert by_module["0E6C"].values[1] == 128
+    assert plan.stop_delay == 0.0
+
+
+def test_merge_keeps_channels_the_scene_does_not_touch():
+    (module,) = _compile([
+        {"module_id": "C1C7", "channel": 1, "state": "on"},
+        {"module_id": "C1C7", "channel": 2, "state": "off"},
+    ]).modules
+    current = bytearray([0x00, 0xFF, 0xFF] + [0x00] * 8 + [0xFF])
+
+    merged = module.merge(current)
+
+    assert merged == bytearray([0xFF, 0x00, 0xFF] + [0x00] * 8 + [0xFF])
+    assert current[0] == 0x00  # the live buffer is not written in place
+    assert module.merge(None)[:2] == bytearray([0xFF, 0x00])
+
+
+def test_rollers_share_the_longest_stop_delay():
+    plan = _compile(
+        [
+            {"module_id": "9105", "channel": 1, "state": "open"},
+            {"module_id": "9105", "channel": 2, "state": "close"},
+            {"module_id": "9105", "channel": 3, "state": "stop"},
+        ],
+        op_times={("9105", 1, "up"): 20.0, ("9105", 2, "down"): 45.0},
+    )
+
+    (roller,) = plan.modules
+    assert roller.roller_indexes == frozenset({0, 1})
+    assert roller.groups == (1,)
+    assert plan.stop_delay == 48.0
+
+
+def test_unusable_members_are_dropped():
+    plan = _compile([
+        {"module_id": "", "channel": 1, "state": "on"},
+        {"module_id": "C1C7", "channel": None, "state": "on"},
+        {"module_id": "C1C7", "channel": "x", "state": "on"},
+        {"module_id": "C1C7", "channel": 13, "state": "on"},
+        {"module_id": "C1C7", "channel": 1, "state": "weird"},
+        {"module_id": "FFFF", "channel": 1, "state": "on"},
+    ])
+
+    assert plan.modules == ()
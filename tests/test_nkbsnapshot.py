@@ -0,0 +1,56 @@
+"""Unit tests for the warm-start state snapshot (nkbsnapshot)."""
+
+from __future__ import annotations
+
+from custom_components.nikobus.nkbsnapshot import restore_snapshot, take_snapshot
+from custom_components.nikobus.nkbstatetable import ModuleStateTable
+
+
+def test_snapshot_round_trips_states_and_positions():
+    table = ModuleStateTable()
+    table["C1C7"] = bytes.fromhex("FF00000000000000000000AA")
+    table["9105"] = bytes(6)
+
+    snapshot = take_snapshot(
+        table,
+        confirmed={"C1C7": 1700000000.04},
+        positions={("9105", 2): (42.25, 1700000100.0), ("DEAD", 1): (10.0, 1.0)},
+    )
+    assert snapshot == {
+        "C1C7": {"state": "ff00000000000000000000aa", "confirmed": 1700000000.0},
+        "9105": {"state": "000000000000", "positions": {"2": [42.2, 1700000100.0]}},
+    }
+
+    fresh = ModuleStateTable()
+    fresh.ensure("C1C7")
+    fresh["9105"] = bytes(6)
+    restored = restore_snapshot(fresh, snapshot)
+
+    assert fresh["C1C7"] == table["C1C7"]
+    assert restored.modules == 2
+    assert restored.confirmed == {"C1C7": 1700000000.0}
+    assert restored.positions == {("9105", 2): (42.2, 1700000100.0)}
+    # Restoring is not a bus change.
+    assert fresh.take_changes("C1C7") == 0
+
+
+def test_restore_skips_unknown_resized_and_malformed_entries():
+    table = ModuleStateTable()
+    table.ensure("C1C7")
+    table.ensure("C1C8")
+    table.ensure("C1C9")
+
+    restored = restore_snapshot(table, {
+        "FFFF": {"state": "ff" * 12},
+        "C1C7": {"state": "ff" * 6},
+        "C1C8": {"state": "zz"},
+        "C1C9": {"state": "01" * 12, "positions": {"x": [1, 2], "1": [150, 5], "2": 7}},
+        "C1CA": "garbage",
+    })
+
+    assert "FFFF" not in table
+    assert table["C1C7"] == bytes(12)
+    assert table["C1C8"] == bytes(12)
+    assert table["C1C9"] == bytes([1] * 12)
+    assert restored.modules == 1
+    assert restored.positions == {("C1C9", 1): (100.0, 5.0)}
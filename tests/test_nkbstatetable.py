@@ -0,0 +1,125 @@
+"""Unit tests for the packed module state table (nkbstatetable)."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from nikobus_connect.command import NikobusCommandHandler
+import pytest
+
+from custom_components.nikobus.nkbstatetable import ModuleStateTable
+
+
+def test_rows_behave_like_the_bytearrays_they_replace():
+    table = ModuleStateTable()
+    table["C1C7"] = bytearray(range(12))
+    row = table["C1C7"]
+
+    assert row[2] == 2
+    assert row[6:] == bytearray(range(6, 12))
+    assert row[:6] + bytearray([0xFF]) == bytearray([0, 1, 2, 3, 4, 5, 0xFF])
+    assert bytearray(row) == bytearray(range(12))
+    assert row.hex() == bytes(range(12)).hex()
+
+    row[0] = 0xAA
+    row[6:12] = bytes(6)
+    assert bytes(row) == bytes([0xAA, 1, 2, 3, 4, 5]) + bytes(6)
+    with pytest.raises(ValueError):
+        row[0:6] = b"\x01"
+
+
+def test_rows_share_one_buffer_and_survive_growth():
+    table = ModuleStateTable(capacity=1)
+    first = table.ensure("AAAA")
+    first[0] = 0x11
+    for n in range(40):
+        table.ensure(f"{n:04X}")
+    # The row handed out before growing still reads and writes the table.
+    assert table["AAAA"][0] == 0x11
+    first[1] = 0x22
+    assert table["AAAA"][1] == 0x22
+    assert len(table) == 41
+
+
+def test_short_rows_keep_their_length():
+    table = ModuleStateTable()
+    table["C1C7"] = bytearray(6)
+
+    assert table["C1C7"] == bytearray(6)
+    assert table.group_view("C1C7", 2) is None
+    assert table.write_group("C1C7", 2, "AABBCCDDEEFF") is None
+    assert table["C1C7"] == bytearray(6)
+
+
+def test_write_group_reports_changes_in_the_mask():
+    table = ModuleStateTable()
+    table.ensure("C1C7")
+
+    assert table.write_group("C1C7", 2, "112233445566") is True
+    assert table.write_group("C1C7", 2, "112233445566") is False
+    assert table.group_view("C1C7", 2) == bytes.fromhex("112233445566")
+    assert table["C1C7"][:6] == bytearray(6)
+    assert table.take_changes("C1C7") == 0b111111 << 6
+    assert table.take_changes("C1C7") == 0
+
+    assert table.write_group("FFFF", 1, "AABBCCDDEEFF") is None
+    assert "FFFF" not in table
+    with pytest.raises(ValueError):
+        table.write_group("C1C7", 1, "GGGGGGGGGGGG")
+
+
+def test_deleted_slot_is_reused_zeroed():
+    table = ModuleStateTable(capacity=2)
+    table["AAAA"] = bytes([0xFF] * 12)
+    del table["AAAA"]
+    assert table.ensure("BBBB") == bytearray(12)
+
+
+def test_library_handler_writes_into_the_table():
+    table = ModuleStateTable()
+    handler = NikobusCommandHandler(
+        connection=MagicMock(), listener=MagicMock(), module_states=table
+    )
+    handler.set_bytearray_state("c1c7", 8, 0xFF)
+
+    assert table["C1C7"][7] == 0xFF
+    assert handler.get_bytearray_group_state("C1C7", 2) == bytearray([0, 0xFF, 0, 0, 0, 0])
+
+
+def test_generation_moves_only_when_the_group_changes():
+    table = ModuleStateTable()
+    row = table.ensure("C1C7")
+    g1, g2 = table.generation("C1C7", 1), table.generation("C1C7", 2)
+
+    table.write_group("C1C7", 1, "000000000000")
+    row[6] = 0
+    assert (table.generation("C1C7", 1), table.generation("C1C7", 2)) == (g1, g2)
+
+    table.write_group("C1C7", 1, "FF0000000000")
+    assert table.generation("C1C7", 1) > g1
+    assert table.generation("C1C7", 2) == g2
+
+    # The library's handler writes straight into the row.
+    row[7] = 0xFF
+    assert table.generation("C1C7", 2) > g2
+    assert table.generation("FFFF", 1) == 0
+
+
+def test_reused_slot_never_repeats_a_generation():
+    table = ModuleStateTable(capacity=1)
+    table.ensure("AAAA")
+    seen = table.generation("AAAA", 1)
+    del table["AAAA"]
+    table.ensure("BBBB")
+    assert table.generation("BBBB", 1) > seen
+
+
+def test_change_mask_names_the_channels_that_moved():
+    table = ModuleStateTable()
+    row = table.ensure("C1C7")
+
+    table.write_group("C1C7", 1, "00FF00000000")
+    row[9] = 0x01
+    row[10] = 0x00  # already zero: not a change
+
+    assert table.take_changes("C1C7") == (1 << 1) | (1 << 9)
@@ -11,7 +11,8 @@ from __future__ import annotations
 
 import asyncio
 import unittest
-from unittest.mock import MagicMock, patch
+import copy
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import importlib
 
@@ -175,6 +176,89 @@ class TestOutputPlatformSetup(unittest.TestCase):
         self.assertIn(_ROUTING_CACHE_KEY, hass.data["nikobus"]["entry_test"])
 
 
+class TestRoutingMemo(unittest.TestCase):
+    """Routing is memoised per module on the entry's content hash."""
+
+    def test_memo_matches_a_full_build(self):
+        from custom_components.nikobus.router import RoutingMemo, build_routing
+
+        self.assertEqual(RoutingMemo().routing(_MODULE_DATA), build_routing(_MODULE_DATA))
+
+    def test_only_changed_modules_are_routed_again(self):
+        from custom_components.nikobus import router
+        from custom_components.nikobus.router import RoutingMemo, build_unique_id
+
+        data = copy.deepcopy(_MODULE_DATA)
+        memo = RoutingMemo()
+        memo.routing(data)
+        dimmer_2 = build_unique_id("light", "dimmer_light", "D1A2", 2)
+        self.assertIn(dimmer_2, memo.unique_ids(data))
+
+        data["dimmer_module"]["D1A2"]["channels"][1]["entity_type"] = "disabled"
+        del data["roller_module"]
+        with patch.object(router, "_route_module", wraps=router._route_module) as route:
+            # Until invalidated the memo hands out what it built.
+            memo.routing(data)
+            route.assert_not_called()
+            memo.invalidate()
+            routing = memo.routing(data)
+
+        self.assertEqual([c.args[1] for c in route.call_args_list], ["D1A2"])
+        self.assertEqual(routing, router.build_routing(data))
+        known = memo.unique_ids(data)
+        self.assertNotIn(dimmer_2, known)
+        self.assertNotIn(build_unique_id("cover", "cover", "C9A5", 1), known)
+        self.assertIn(build_unique_id("switch", "relay_switch", "8110", 1), known)
+
+
+class TestPlatformReconcile(unittest.TestCase):
+    """A platform's entities follow the stores without a reload."""
+
+    def test_reconcile_adds_replaces_and_removes_only_what_changed(self):
+        hass, entry, coord = _entry_and_coord()
+        coord.dict_module_data = copy.deepcopy(_MODULE_DATA)
+        added: list = []
+
+        async def _scenario():
+            with patch.object(
+                light_platform, "register_output_module_devices", MagicMock()
+            ):
+                await light_platform.async_setup_entry(
+                    hass, entry, lambda ents, **kw: added.extend(ents)
+                )
+                tracker = coord.register_platform_entities.call_args.args[1]
+                spots, suspension = added
+                for entity in added:
+                    entity.hass = hass
+                    entity.async_remove = AsyncMock()
+                added.clear()
+
+                # Rename one channel, add a second dimmer module.
+                dimmers = coord.dict_module_data["dimmer_module"]
+                dimmers["D1A2"]["channels"][1]["description"] = "Lustre"
+                dimmers["D1A3"] = {
+                    "description": "Dimmer cuisine",
+                    "model": "05-007-02",
+                    "channels": [{"description": "Plan de travail"}],
+                }
+                hass.data.clear()
+                counts = await tracker.async_reconcile()
+                return spots, suspension, counts
+
+        spots, suspension, counts = _run(_scenario())
+
+        spots.async_remove.assert_not_awaited()
+        suspension.async_remove.assert_awaited_once()
+        self.assertEqual(counts, (2, 1))
+        self.assertEqual(
+            sorted((e._address, e._channel) for e in added),
+            [("D1A2", 2), ("D1A3", 1)],
+        )
+        self.assertEqual(
+            coord.register_platform_entities.call_args.args[0], "light"
+        )
+
+
 class TestScenePlatformSetup(unittest.TestCase):
     def test_user_and_cf_scenes_created(self):
         coord = MagicMock()
@@ -0,0 +1,138 @@
+"""Tests for merging post-press refresh reads per module."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.nikobus import nkbactuator
+from custom_components.nikobus.nkbactuator import NikobusActuator, PressRoute
+from custom_components.nikobus.nkbbusscheduler import NikobusBusScheduler
+
+
+class _Hass:
+    def __init__(self) -> None:
+        self.bus = MagicMock()
+
+    def async_create_task(self, coro):
+        return asyncio.ensure_future(coro)
+
+
+@pytest.fixture(autouse=True)
+def _short_delays(monkeypatch):
+    monkeypatch.setattr(nkbactuator, "IMMEDIATE_REFRESH_DELAY", 0.01)
+    monkeypatch.setattr(nkbactuator, "REFRESH_DELAY", 0.03)
+    monkeypatch.setattr(nkbactuator, "DIMMER_DELAY", 0.03)
+
+
+def _actuator():
+    coordinator = MagicMock()
+    coordinator.bus_scheduler = NikobusBusScheduler()
+    coordinator.nikobus_command.get_output_state = AsyncMock(return_value="FF" * 6)
+    coordinator.async_event_handler = AsyncMock()
+    return NikobusActuator(
+        _Hass(), coordinator, {"nikobus_button": {}}, {"nikobus_module": {}}
+    )
+
+
+async def _drain(actuator: NikobusActuator) -> None:
+    await asyncio.gather(*list(actuator._module_refresh_tasks.values()))
+
+
+def _route(*impacted):
+    return PressRoute("C1C7", 1, tuple(impacted))
+
+
+@pytest.mark.asyncio
+async def test_two_buttons_on_same_group_share_reads():
+    actuator = _actuator()
+    await actuator.process_button_modules(_route(("C1C7", "1", False)), "AA0001", None)
+    await actuator.process_button_modules(_route(("C1C7", "1", False)), "AA0002", None)
+    await _drain(actuator)
+
+    reads = actuator._coordinator.nikobus_command.get_output_state
+    assert reads.await_count == 2  # one immediate + one settled
+    assert actuator.refresh_stats == {
+        "reads_requested": 4, "reads_issued": 2, "reads_saved": 2,
+        "predicted_presses": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_both_groups_are_read_back_to_back_per_pass():
+    actuator = _actuator()
+    await actuator.process_button_modules(
+        _route(("C1C7", "2", False), ("C1C7", "1", False)), "AA0001", None
+    )
+    await _drain(actuator)
+
+    reads = actuator._coordinator.nikobus_command.get_output_state
+    assert [c.args for c in reads.await_args_list] == [
+        ("C1C7", "1"), ("C1C7", "2"), ("C1C7", "1"), ("C1C7", "2"),
+    ]
+    # One refresh event per pass, not per group.
+    assert actuator._coordinator.async_event_handler.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_later_press_pushes_the_settle_read_out():
+    actuator = _actuator()
+    await actuator.process_button_modules(_route(("C1C7", "1", False)), "AA0001", None)
+    first_settle = actuator._module_refreshes["C1C7"].settle_at
+    await asyncio.sleep(0.02)
+    await actuator.process_button_modules(_route(("C1C7", "1", True)), "AA0002", None)
+    plan = actuator._module_refreshes["C1C7"]
+    assert plan.settle_at >= first_settle + 0.02
+    await _drain(actuator)
+
+    reads = actuator._coordinator.nikobus_command.get_output_state
+    assert reads.await_count == 2
+    assert actuator._module_refreshes == {}
+    assert actuator._module_refresh_tasks == {}
+
+
+@pytest.mark.asyncio
+async def test_held_button_defers_reads_until_release():
+    actuator = _actuator()
+    actuator._press_states["AA0001"] = MagicMock()
+    await actuator.process_button_modules(_route(("C1C7", "1", False)), "AA0001", None)
+    await asyncio.sleep(0.05)
+
+    reads = actuator._coordinator.nikobus_command.get_output_state
+    reads.assert_not_awaited()
+
+    actuator._press_states.clear()
+    await _drain(actuator)
+    assert reads.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_predicted_module_is_written_at_once_and_read_once():
+    actuator = _actuator()
+    buffer = {1: 0x00, 2: 0xFF}
+    coordinator = actuator._coordinator
+    coordinator.get_bytearray_state = MagicMock(side_effect=lambda a, ch: buffer[ch])
+    coordinator.set_bytearray_state = MagicMock(
+        side_effect=lambda a, ch, v: buffer.__setitem__(ch, v)
+    )
+    actuator._routes["C5E952"] = PressRoute(
+        "C1C7", 1, (("C1C7", "1", False),),
+        actions=(("C1C7", 1, "toggle"), ("C1C7", 2, "off")),
+        predictable=frozenset({"C1C7"}),
+    )
+
+    await actuator.handle_button_press("C5E952")
+
+    assert buffer == {1: 0xFF, 2: 0x00}
+    coordinator.async_event_handler.assert_awaited_with(
+        "nikobus_refreshed", {"impacted_module_address": "C1C7"}
+    )
+    await asyncio.sleep(0)
+    actuator._press_states.clear()  # released
+    await _drain(actuator)
+
+    # Only the settled read verifies the prediction.
+    assert coordinator.nikobus_command.get_output_state.await_count == 1
+    assert actuator.refresh_stats["predicted_presses"] == 1
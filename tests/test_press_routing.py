@@ -0,0 +1,90 @@
+"""Tests for the compiled press-routing table (``build_press_routes``)."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.nikobus.nkbactuator import (
+    NikobusActuator,
+    PressRoute,
+    build_press_routes,
+)
+
+
+def _buttons() -> dict:
+    return {
+        "nikobus_button": {
+            "1A2B3C": {
+                "operation_points": {
+                    "1A": {
+                        "bus_address": "c5e952",
+                        "linked_modules": [
+                            {
+                                "module_address": "c1c7",
+                                "outputs": [{"channel": 3}, {"channel": 9}, {"channel": 4}],
+                            },
+                            {"module_address": "0E6C", "outputs": [{"channel": 2}]},
+                        ],
+                    },
+                    "1B": {"bus_address": "C5E953", "linked_modules": []},
+                },
+            },
+            "4D5E6F": {
+                "operation_points": {
+                    # Same bus address as above: the first op-point wins.
+                    "1A": {
+                        "bus_address": "C5E952",
+                        "linked_modules": [
+                            {"module_address": "FFFF", "outputs": [{"channel": 1}]},
+                        ],
+                    },
+                },
+            },
+        }
+    }
+
+
+def _modules() -> dict:
+    return {
+        "nikobus_module": {
+            "C1C7": {"module_type": "switch_module"},
+            "0E6C": {"module_type": "dimmer_module"},
+        }
+    }
+
+
+def test_route_precomputes_primary_link_groups_and_dimmer_flags():
+    routes = build_press_routes(_buttons(), _modules())
+
+    assert routes["C5E952"] == PressRoute(
+        module_address="C1C7",
+        channel=3,
+        impacted=(("C1C7", "1", False), ("C1C7", "2", False), ("0E6C", "1", True)),
+    )
+    assert routes["C5E953"] == PressRoute(None, None, ())
+
+
+def test_empty_or_malformed_stores_compile_to_empty_table():
+    assert build_press_routes({}, {}) == {}
+    assert build_press_routes({"nikobus_button": {"X": "bad"}}, {}) == {}
+
+
+@pytest.mark.asyncio
+async def test_rebuild_routes_picks_up_store_changes():
+    buttons = {"nikobus_button": {}}
+    modules = _modules()
+    hass = MagicMock()
+    actuator = NikobusActuator(hass, MagicMock(), buttons, modules)
+    actuator.process_button_modules = AsyncMock()
+
+    await actuator.button_discovery("C5E952")
+    actuator.process_button_modules.assert_not_called()
+
+    buttons["nikobus_button"].update(_buttons()["nikobus_button"])
+    actuator.rebuild_routes()
+    await actuator.button_discovery("c5e952")
+
+    route = actuator.process_button_modules.await_args.args[0]
+    assert route.module_address == "C1C7"
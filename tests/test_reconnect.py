@@ -6,6 +6,9 @@ from unittest.mock import AsyncMock, MagicMock
 
 from custom_components.nikobus.coordinator import NikobusDataCoordinator
 from custom_components.nikobus.const import RECONNECT_DELAY_INITIAL, RECONNECT_DELAY_MAX
+from custom_components.nikobus.nkbbusscheduler import BusPriority, NikobusBusScheduler
+from custom_components.nikobus.nkbsnapshot import RestoredSnapshot
+from custom_components.nikobus.nkbstatetable import ModuleStateTable
 
 
 # ---------------------------------------------------------------------------
@@ -37,7 +40,7 @@ def _make_coordinator():
     coord.connection_string = "192.168.1.1:8000"
     coord._stopping = False
     coord._reconnect_task = None
-    coord._reload_task = None
+    coord._reconcile_task = None
     coord._last_connected = None
     coord._reconnect_attempts = 0
     coord.discovery_running = False
@@ -45,7 +48,12 @@ def _make_coordinator():
     # ``nikobus_module_states`` is a read-only property on the real class
     # (returns ``self._module_states``). Bypass __init__, so set the
     # underlying attribute directly.
-    coord._module_states = {}
+    coord._module_states = ModuleStateTable()
+    coord._poll_scheduler = MagicMock()
+    coord.motion_engine = MagicMock()
+    coord._snapshot_unsub = None
+    for store in ("module_storage", "button_storage", "cf_storage", "state_storage"):
+        setattr(coord, store, MagicMock(async_flush=AsyncMock()))
 
     # Mock subsystems
     coord.nikobus_connection = MagicMock()
@@ -69,6 +77,7 @@ def _make_coordinator():
 
     coord.async_update_listeners = MagicMock()
     coord._async_update_data = AsyncMock()
+    coord.bus_scheduler = NikobusBusScheduler()
 
     return coord
 
@@ -199,6 +208,35 @@ class TestReconnectLoop(unittest.IsolatedAsyncioTestCase):
         )
 
 
+    async def test_write_cut_off_by_the_drop_does_not_block_the_next_poll(self):
+        """A channel write still waiting for its answer when the worker
+        is stopped holds an INTERACTIVE slot that is never given back;
+        the reconnect's poll must still get on the bus."""
+        coord = _make_coordinator()
+        handler = MagicMock()
+        # The stopped worker never answers this frame.
+        handler.set_output_state = AsyncMock(
+            return_value=asyncio.get_running_loop().create_future()
+        )
+        view = coord.bus_scheduler.commands(handler, BusPriority.INTERACTIVE)
+        await view.set_output_state("C1C7", 1, 0xFF)
+
+        polled: list[str] = []
+
+        async def _poll():
+            async with coord.bus_scheduler.slot(BusPriority.POLL):
+                polled.append("C1C7")
+
+        coord._async_update_data = AsyncMock(side_effect=_poll)
+        await coord._handle_connection_lost()
+        await asyncio.wait_for(coord._reconnect_task, 1)
+
+        self.assertEqual(polled, ["C1C7"])
+        stats = coord.bus_scheduler.stats()
+        self.assertEqual(stats["interactive"]["in_flight"], 0)
+        self.assertEqual(stats["poll"]["in_flight"], 0)
+
+
 # ---------------------------------------------------------------------------
 # stop() — reconnect task cancellation
 # ---------------------------------------------------------------------------
@@ -231,6 +269,27 @@ class TestStopCancelsReconnect(unittest.IsolatedAsyncioTestCase):
         await coord.stop()
         coord.nikobus_connection.disconnect.assert_called_once()
 
+    async def test_stop_saves_the_snapshot(self):
+        coord = _make_coordinator()
+        unsub = coord._snapshot_unsub = MagicMock()
+        coord._module_states["C1C7"] = bytes.fromhex("FF" + "00" * 11)
+        coord._poll_scheduler.confirmed_at.return_value = {}
+        coord.restored_snapshot = RestoredSnapshot()
+        coord._cover_positions = {}
+        coord.state_storage.async_save = AsyncMock()
+        coord.state_storage.data = {"nikobus_state": {}}
+
+        await coord.stop()
+
+        unsub.assert_called_once()
+        coord.state_storage.async_save.assert_awaited_once()
+        coord.state_storage.async_flush.assert_awaited_once()
+        coord.button_storage.async_flush.assert_awaited_once()
+        self.assertEqual(
+            coord.state_storage.data["nikobus_state"],
+            {"C1C7": {"state": "ff" + "00" * 11}},
+        )
+
 
 # ---------------------------------------------------------------------------
 # RECONNECT_DELAY constants sanity check
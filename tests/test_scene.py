@@ -1,9 +1,9 @@
 """Characterization tests for the scene platform.
 
 Covers the software-scene helpers (state→byte mapping, feedback-LED
-normalization + dispatch) and CF-scene activation. The full async_activate
-fan-out (module writes + timed roller stops) is integration-level and left
-to the live system; these pin the deterministic pieces.
+normalization + dispatch), which module groups an activation writes, and
+CF-scene activation. Timed roller stops on a live bus are left to the
+live system; these pin the deterministic pieces.
 """
 
 from __future__ import annotations
@@ -11,9 +11,10 @@ from __future__ import annotations
 import asyncio
 import unittest
 import unittest.mock
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import ANY, AsyncMock, MagicMock
 
 from custom_components.nikobus.const import DOMAIN
+from custom_components.nikobus.nkbdispatch import dispatch_module_writes
 from custom_components.nikobus.scene import (
     NikobusCFSceneEntity,
     NikobusSceneEntity,
@@ -28,6 +29,16 @@ def _run(coro):
         loop.close()
 
 
+def _wire_dispatch(coord):
+    """Run a scene's module writes through the real batch dispatcher."""
+
+    async def _dispatch(label, writes):
+        return await dispatch_module_writes(writes, limit=4, timeout=0.01)
+
+    coord.async_dispatch_module_writes = _dispatch
+    coord.scene_writes = {"group_writes": 0, "skipped": 0, "forced": 0}
+
+
 def _scene(**cfg):
     base = {"id": "s1", "channels": [], "feedback_led": None}
     base.update(cfg)
@@ -102,6 +113,7 @@ class TestSceneActivationErrors(unittest.TestCase):
         coord.api.set_output_states_for_module = AsyncMock(
             side_effect=RuntimeError("bus down")
         )
+        _wire_dispatch(coord)
         e = NikobusSceneEntity(coord, {
             "id": "s1",
             "channels": [{"module_id": "C1C7", "channel": 1, "state": "on"}],
@@ -290,7 +302,9 @@ class TestCFSceneAttributes(unittest.TestCase):
 class TestCoordinatorSceneHelpers(unittest.TestCase):
     def _coord(self):
         from custom_components.nikobus.coordinator import NikobusDataCoordinator
-        return NikobusDataCoordinator.__new__(NikobusDataCoordinator)
+        c = NikobusDataCoordinator.__new__(NikobusDataCoordinator)
+        c._cf_trigger_index = None
+        return c
 
     def test_get_scene_for_address(self):
         c = self._coord()
@@ -317,6 +331,16 @@ class TestCoordinatorSceneHelpers(unittest.TestCase):
         )
         self.assertIsNone(c.get_scene_for_address("FFFFFF"))
 
+    def test_get_scene_for_address_follows_a_rebuilt_index(self):
+        c = self._coord()
+        c.cf_storage = MagicMock()
+        c.cf_storage.data = {"nikobus_cf": {"8B7086": {"triggered_by": ["DE4E2C"]}}}
+        self.assertIsNotNone(c.get_scene_for_address("DE4E2C"))
+        c.cf_storage.data["nikobus_cf"] = {"0D1C9E": {"triggered_by": ["0D1C9E"]}}
+        c.rebuild_cf_trigger_index()
+        self.assertIsNone(c.get_scene_for_address("DE4E2C"))
+        self.assertIsNotNone(c.get_scene_for_address("0D1C9E"))
+
     def test_address_label_fallback_without_device(self):
         c = self._coord()
         c.hass = None
@@ -337,6 +361,104 @@ class TestCoordinatorSceneHelpers(unittest.TestCase):
             self.assertEqual(c.address_label("0E6C"), "dimmer_module_d1 (0E6C)")
 
 
+class TestSceneActivationPlan(unittest.TestCase):
+    """Members are resolved once per module-store revision, not per press."""
+
+    def _scene(self):
+        coord = MagicMock()
+        coord.module_revision = 1
+        coord.get_module_type.return_value = "switch_module"
+        coord.get_module_channel_count.return_value = 6
+        coord.nikobus_module_states = {"C1C7": bytearray([0x00, 0xFF] + [0x00] * 10)}
+        coord.async_event_handler = AsyncMock()
+        coord.api.set_output_states_for_module = AsyncMock()
+        _wire_dispatch(coord)
+        e = NikobusSceneEntity(coord, {
+            "id": "s1",
+            "channels": [{"module_id": "C1C7", "channel": 1, "state": "on"}],
+            "feedback_led": None,
+        })
+        e.name = "Test Scene"
+        return e, coord
+
+    def test_activation_merges_plan_into_current_state(self):
+        e, coord = self._scene()
+        _run(e.async_activate())
+        coord.set_bytearray_group_state.assert_called_once_with("C1C7", 1, "ffff00000000")
+        coord.api.set_output_states_for_module.assert_awaited_once_with(
+            address="C1C7", completion_handler=ANY, num_channels=6
+        )
+
+    def test_plan_is_reused_until_the_store_is_saved(self):
+        e, coord = self._scene()
+        _run(e.async_activate())
+        _run(e.async_activate())
+        self.assertEqual(coord.get_module_type.call_count, 1)
+
+        coord.module_revision = 2
+        _run(e.async_activate())
+        self.assertEqual(coord.get_module_type.call_count, 2)
+
+
+class TestSceneDiffWrites(unittest.TestCase):
+    """Only module groups whose bytes differ from the buffer are written."""
+
+    def _scene(self, channels, current, *, force=False, channel_count=12):
+        coord = MagicMock()
+        coord.module_revision = 1
+        coord.get_module_type.return_value = "switch_module"
+        coord.get_module_channel_count.return_value = channel_count
+        coord.nikobus_module_states = {"C1C7": bytearray(current)}
+        coord.async_event_handler = AsyncMock()
+        coord.api.set_output_states_for_module = AsyncMock()
+        coord.api_commands.set_output_state = AsyncMock()
+        _wire_dispatch(coord)
+        e = NikobusSceneEntity(coord, {
+            "id": "s1",
+            "channels": [
+                {"module_id": "C1C7", "channel": ch, "state": st} for ch, st in channels
+            ],
+            "feedback_led": None,
+            "force_write": force,
+        })
+        e.name = "Evening"
+        return e, coord
+
+    def test_scene_already_in_place_sends_nothing(self):
+        e, coord = self._scene([(1, "on"), (8, "off")], [0xFF] + [0x00] * 11)
+        _run(e.async_activate())
+        coord.api.set_output_states_for_module.assert_not_awaited()
+        coord.api_commands.set_output_state.assert_not_awaited()
+        coord.async_event_handler.assert_not_awaited()
+        self.assertEqual(coord.scene_writes, {"group_writes": 0, "skipped": 2, "forced": 0})
+
+    def test_only_the_changed_first_group_is_written(self):
+        e, coord = self._scene([(1, "on"), (8, "off")], [0x00] * 12)
+        _run(e.async_activate())
+        coord.api.set_output_states_for_module.assert_awaited_once_with(
+            address="C1C7", completion_handler=ANY, num_channels=6
+        )
+        coord.set_bytearray_group_state.assert_called_once_with("C1C7", 1, "ff0000000000")
+        self.assertEqual(coord.scene_writes["skipped"], 1)
+
+    def test_only_the_changed_second_group_is_written(self):
+        e, coord = self._scene([(1, "on"), (8, "on")], [0xFF] + [0x00] * 11)
+        _run(e.async_activate())
+        coord.api.set_output_states_for_module.assert_not_awaited()
+        coord.set_bytearray_group_state.assert_called_once_with("C1C7", 2, "00ff00000000")
+        coord.api_commands.set_output_state.assert_awaited_once_with(
+            "C1C7", 7, 0x00, completion_handler=ANY
+        )
+
+    def test_force_write_resends_unchanged_groups(self):
+        e, coord = self._scene([(1, "on")], [0xFF] + [0x00] * 11, force=True)
+        _run(e.async_activate())
+        coord.api.set_output_states_for_module.assert_awaited_once_with(
+            address="C1C7", completion_handler=ANY, num_channels=12
+        )
+        self.assertEqual(coord.scene_writes, {"group_writes": 2, "skipped": 0, "forced": 2})
+
+
 if __name__ == "__main__":
     unittest.main()
 
@@ -10,6 +10,7 @@ change — these pin that for switch (on/off) and dimmer (on/off + level).
 
 from __future__ import annotations
 
+from itertools import count
 from unittest.mock import MagicMock, patch
 
 from custom_components.nikobus.light import NikobusDimmerEntity
@@ -19,6 +20,9 @@ from custom_components.nikobus.switch import NikobusRelaySwitchEntity
 def _switch(state=False):
     coord = MagicMock()
     coord.get_switch_state = MagicMock(return_value=state)
+    # A fresh generation on every read: the group-generation gate never
+    # short-circuits, so these tests exercise the render diff behind it.
+    coord.state_generation = MagicMock(side_effect=count(1))
     coord.nikobus_connection.is_connected = True
     e = NikobusRelaySwitchEntity(coord, "3851", 3, "Relay", "Switch", "05-002")
     e.async_write_ha_state = MagicMock()
@@ -28,6 +32,7 @@ def _switch(state=False):
 def _dimmer(level=0):
     coord = MagicMock()
     coord.get_light_brightness = MagicMock(return_value=level)
+    coord.state_generation = MagicMock(side_effect=count(1))
     coord.nikobus_connection.is_connected = True
     e = NikobusDimmerEntity(coord, "0E6C", 1, "Lamp", "Dimmer", "05-007")
     e.async_write_ha_state = MagicMock()
@@ -147,3 +152,63 @@ def test_dimmer_optimistic_write_unfreezes_later_real_state_issue_469():
         coord.get_light_brightness.return_value = 0
         e._handle_coordinator_update()
         assert raw_write.call_count == 3
+
+
+# ---------------------------------------------------------------------------
+# Group generations: an entity whose module group is unchanged since its
+# last render is skipped before any of its state is evaluated.
+# ---------------------------------------------------------------------------
+
+
+def test_unchanged_generation_skips_without_reading_state():
+    e, coord = _switch(state=False)
+    coord.state_generation = MagicMock(return_value=7)
+    e._handle_coordinator_update()
+    assert coord.get_switch_state.call_count == 1
+
+    e._handle_coordinator_update()
+    e._handle_coordinator_update()
+    assert coord.get_switch_state.call_count == 1
+    assert e.async_write_ha_state.call_count == 1
+    coord.state_generation.assert_called_with("3851", 1)
+
+    coord.get_switch_state.return_value = True
+    coord.state_generation.return_value = 8
+    e._handle_coordinator_update()
+    assert e.async_write_ha_state.call_count == 2
+
+
+def test_channel_in_second_group_reads_group_two():
+    coord = MagicMock()
+    coord.state_generation = MagicMock(return_value=1)
+    e = NikobusRelaySwitchEntity(coord, "3851", 9, "Relay", "Switch", "05-002")
+    e.async_write_ha_state = MagicMock()
+    e._handle_coordinator_update()
+    coord.state_generation.assert_called_with("3851", 2)
+
+
+def test_availability_flip_renders_at_the_same_generation():
+    e, coord = _switch(state=True)
+    coord.state_generation = MagicMock(return_value=3)
+    e._handle_coordinator_update()
+    coord.nikobus_connection.is_connected = False
+    e._handle_coordinator_update()
+    assert e.async_write_ha_state.call_count == 2
+
+
+def test_optimistic_write_forces_the_next_render():
+    e, coord = _switch(state=False)
+    coord.state_generation = MagicMock(return_value=5)
+    del e.async_write_ha_state
+    with patch(
+        "homeassistant.helpers.update_coordinator."
+        "CoordinatorEntity.async_write_ha_state"
+    ) as raw_write:
+        e._handle_coordinator_update()
+        e._is_on = True
+        e.async_write_ha_state()
+        # The buffer never moved, but the optimistic ON must still be
+        # dropped and the real OFF shown.
+        e._handle_coordinator_update()
+        assert e._is_on is None
+        assert raw_write.call_count == 3